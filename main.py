@@ -1,187 +1,540 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import contextlib
+import copy
+import importlib
 import json
+import multiprocessing
+import os
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
 
 # Initialize environment variables first
 from src.utils.env_initializer import initialize_env
 if not initialize_env():
     sys.exit(1)  # Exit if environment validation fails
 
-# Import pipeline modules after environment is validated
-from src.ingestion_engine.ingestion import IngestionEngine
-from src.script_generator.script_gen import ScriptGenerator
-from src.animator.animate import Animator
-from src.voice_generator.voice_gen import VoiceGenerator
-from src.video_composer.compose import VideoComposer
-from src.quality_control.qc_checker import QualityControl
-from src.uploader.upload import Uploader
-from src.content_manager.manager import ContentManager
-from src.technician_agent.technician import TechnicianAgent
-
 # Initialize logging
-from src.utils.logging_utils import setup_logger
+from src.utils.logging_utils import setup_logger, log_operation
+from src.utils.cache_utils import JsonCache, hash_file, make_cache_key
+from src.utils.staging import StagingSink
+from src.utils.http_client import run_sync
+from src.utils.file_utils import create_directory_if_not_exists, get_file_size, load_json_file, save_json_file
+from src.utils.main_config import MAIN_CONFIG_PATH, get_main_config
 logger = setup_logger("pipeline")
 
+# Persistent cache for deterministic stages (created on first use)
+_stage_cache: Optional[JsonCache] = None
+
+# Worker processes for PDF ingestion (created on first use)
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+# Pipeline stages in execution order
+STAGE_NAMES = (
+    "ingestion",
+    "script_generation",
+    "animation",
+    "voice_generation",
+    "video_composition",
+    "quality_control",
+    "upload"
+)
+
+# Pre-built shape of a pipeline run's results; copied (or reset) per run
+_RESULTS_TEMPLATE = {
+    "start_time": None,
+    "stages": {name: {"output": None, "success": False} for name in STAGE_NAMES},
+    "success": False,
+    "error": None
+}
+
+def _reset_results(results: Dict[str, Any]) -> None:
+    """Reset a results dict to the template state in place, reusing its nested dicts"""
+    for key in ("end_time", "_start_perf", "_end_perf"):
+        results.pop(key, None)
+    results.update(start_time=None, success=False, error=None)
+    stages = results["stages"]
+    for name in list(stages):
+        if name not in _RESULTS_TEMPLATE["stages"]:
+            del stages[name]
+    for name in STAGE_NAMES:
+        info = stages.setdefault(name, {})
+        info.clear()
+        info.update(output=None, success=False)
+
+class ResultsPool:
+    """Pool of reusable results dicts for high-frequency scheduled runs"""
+    
+    def __init__(self):
+        self._free = []
+    
+    def acquire(self) -> Dict[str, Any]:
+        """Get a results dict in the template state"""
+        if self._free:
+            results = self._free.pop()
+            _reset_results(results)
+            return results
+        return copy.deepcopy(_RESULTS_TEMPLATE)
+    
+    def release(self, results: Dict[str, Any]) -> None:
+        """Return a results dict to the pool once it is no longer referenced"""
+        self._free.append(results)
+
 def load_config() -> Dict[str, Any]:
-    """Load the main configuration file"""
-    config_path = Path(__file__).parent / "config" / "main_config.json"
-    try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Failed to load config: {str(e)}")
+    """Load the main configuration file (parsed once and shared with the module configs)"""
+    config = get_main_config()
+    if config is None:
+        logger.error(f"Failed to load config: {MAIN_CONFIG_PATH}")
         sys.exit(1)
+    return config
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the process pool used for CPU-bound PDF ingestion (created on first use)"""
+    global _pdf_pool
+    if _pdf_pool is None:
+        # spawn rather than fork: the parent already runs logging and asyncio threads
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 2) // 2),
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_pool
+
+async def _ingest_in_process_pool(source_path: str, source_type: str) -> Optional[Dict[str, Any]]:
+    """Run ingestion in the PDF process pool so text extraction never holds this process's GIL"""
+    from src.ingestion_engine.ingestion import process_source_in_worker
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_pdf_pool(), process_source_in_worker, source_path, source_type
+    )
+
+def get_stage_cache() -> JsonCache:
+    """Return the persistent cache used for ingestion and script generation results"""
+    global _stage_cache
+    if _stage_cache is None:
+        base_data_path = Path(load_config()["base_settings"]["base_data_path"])
+        _stage_cache = JsonCache(base_data_path / "cache" / "pipeline")
+    return _stage_cache
+
+# Pipeline module classes as "module.path:ClassName", imported on first use
+_LAZY = {
+    "ingestion": "src.ingestion_engine.ingestion:IngestionEngine",
+    "script_generator": "src.script_generator.script_gen:ScriptGenerator",
+    "animator": "src.animator.animate:Animator",
+    "voice_generator": "src.voice_generator.voice_gen:VoiceGenerator",
+    "video_composer": "src.video_composer.compose:VideoComposer",
+    "quality_control": "src.quality_control.qc_checker:QualityControl",
+    "uploader": "src.uploader.upload:Uploader",
+    "content_manager": "src.content_manager.manager:ContentManager",
+    "technician": "src.technician_agent.technician:TechnicianAgent"
+}
+
+def _import_class(spec: str) -> type:
+    """Resolve a "module.path:ClassName" spec to the class it names"""
+    module_path, class_name = spec.split(":")
+    return getattr(importlib.import_module(module_path), class_name)
+
+def _lazy_import_modules() -> Dict[str, type]:
+    """
+    Import the pipeline module classes on first use.
+    
+    Keeping these imports out of module scope means --help, argument errors and
+    config failures never pay for the heavy dependencies the stages pull in.
+    The imports run in a thread pool: the import lock still serializes module
+    execution, but the filesystem lookups and reads of the different packages overlap.
+    
+    Returns:
+        dict: Pipeline module classes keyed by the name used throughout the pipeline
+    """
+    with ThreadPoolExecutor(max_workers=len(_LAZY)) as executor:
+        classes = executor.map(_import_class, _LAZY.values())
+        return dict(zip(_LAZY, classes))
+
+# Long-lived module registry shared by every run in this process
+_MODULES: Optional[Dict[str, Any]] = None
+
+async def _construct_modules() -> Dict[str, Any]:
+    """Construct all pipeline modules concurrently in worker threads"""
+    module_classes = _lazy_import_modules()
+    instances = await asyncio.gather(
+        *(asyncio.to_thread(cls) for cls in module_classes.values())
+    )
+    return dict(zip(module_classes, instances))
+
+def warmup() -> Dict[str, Any]:
+    """
+    Pre-load all pipeline modules, running their constructors in parallel.
+    
+    Subsequent calls (and initialize_modules) return the same instances.
+    
+    Returns:
+        dict: Initialized modules keyed by name
+    """
+    global _MODULES
+    if _MODULES is None:
+        _MODULES = asyncio.run(_construct_modules())
+        logger.info("All pipeline modules initialized successfully")
+    return _MODULES
 
 def initialize_modules(config: Dict[str, Any]) -> Dict[str, Any]:
-    """Initialize all pipeline modules with configuration"""
+    """Initialize all pipeline modules with configuration (idempotent)"""
     try:
-        modules = {
-            "ingestion": IngestionEngine(),
-            "script_generator": ScriptGenerator(),
-            "animator": Animator(),
-            "voice_generator": VoiceGenerator(),
-            "video_composer": VideoComposer(),
-            "quality_control": QualityControl(),
-            "uploader": Uploader(),
-            "content_manager": ContentManager(),
-            "technician": TechnicianAgent()
-        }
-        logger.info("All pipeline modules initialized successfully")
-        return modules
+        return warmup()
     except Exception as e:
         logger.critical(f"Module initialization failed: {str(e)}")
         sys.exit(1)
 
-def run_pipeline_stage(stage_name: str, func, *args, **kwargs) -> Any:
-    """Wrapper to run a pipeline stage with consistent error handling"""
-    logger.info(f"Starting stage: {stage_name}")
-    start_time = datetime.now()
+@contextlib.contextmanager
+def stage_span(stage_name: str, stage_info: Optional[Dict[str, Any]] = None):
+    """
+    Time a pipeline stage and emit a single structured log event when it ends.
+    
+    The yielded span dict can be annotated by the caller (e.g. span["cached"] = True);
+    its contents are included in the event.
     
+    Args:
+        stage_name: Name of the stage
+        stage_info: Optional results entry that receives the measured duration
+    """
+    span = {"name": stage_name, "ok": False}
+    start_ns = time.perf_counter_ns()
     try:
-        result = func(*args, **kwargs)
-        if not result:
-            raise RuntimeError(f"{stage_name} returned no results")
-        
-        duration = (datetime.now() - start_time).total_seconds()
-        logger.info(f"Completed {stage_name} in {duration:.2f} seconds")
-        return result
-        
+        yield span
+        span["ok"] = True
     except Exception as e:
-        logger.error(f"Stage {stage_name} failed: {str(e)}")
-        raise  # Re-raise to be caught by the main pipeline handler
+        span["error"] = str(e)
+        raise
+    finally:
+        span["dur_ns"] = time.perf_counter_ns() - start_ns
+        if stage_info is not None:
+            stage_info["duration_ns"] = span["dur_ns"]
+        log_operation(
+            logger,
+            "stage",
+            "completed" if span["ok"] else "failed",
+            span,
+            level="INFO" if span["ok"] else "ERROR"
+        )
 
-def run_full_pipeline(
+def _make_stage_runner(stage_name: str):
+    """
+    Build a stage runner specialized for one stage.
+    
+    The stage graph is fixed, so each runner is created once at import time with
+    its stage name and failure message bound as constants.
+    """
+    no_results_message = f"{stage_name} returned no results"
+    
+    async def run_stage(results: Dict[str, Any], func, *args, **kwargs) -> Any:
+        stage_info = results["stages"].setdefault(stage_name, {})
+        try:
+            with stage_span(stage_name, stage_info):
+                if asyncio.iscoroutinefunction(func):
+                    result = await func(*args, **kwargs)
+                else:
+                    result = await asyncio.to_thread(func, *args, **kwargs)
+                if not result:
+                    raise RuntimeError(no_results_message)
+                return result
+        except Exception:
+            stage_info["success"] = False
+            raise  # Re-raise to be caught by the main pipeline handler
+    
+    run_stage.__name__ = run_stage.__qualname__ = f"_run_{stage_name}"
+    return run_stage
+
+# Specialized runner per pipeline stage
+_STAGE_RUNNERS = {name: _make_stage_runner(name) for name in STAGE_NAMES}
+
+async def run_pipeline_stage(
+    results: Dict[str, Any],
+    stage_name: str,
+    func,
+    *args,
+    **kwargs
+) -> Any:
+    """
+    Run a pipeline stage with consistent error handling.
+    
+    Coroutine functions are awaited directly; blocking functions run in a worker thread.
+
+    Each stage records its own duration under results["stages"][stage_name],
+    so concurrently running stages never write to the same key.
+    """
+    runner = _STAGE_RUNNERS.get(stage_name) or _make_stage_runner(stage_name)
+    return await runner(results, func, *args, **kwargs)
+
+async def run_cached_stage(
+    results: Dict[str, Any],
+    stage_name: str,
+    cache_key: Optional[str],
+    func,
+    *args,
+    **kwargs
+) -> Any:
+    """
+    Run a deterministic pipeline stage, reusing a persisted result for identical inputs.
+    
+    A cache_key of None disables caching (e.g. for remote sources that cannot be hashed).
+    """
+    cache = get_stage_cache()
+    if cache_key:
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None:
+            stage_info = results["stages"].setdefault(stage_name, {})
+            stage_info["cached"] = True
+            with stage_span(stage_name, stage_info) as span:
+                span["cached"] = True
+            return cached
+    
+    result = await run_pipeline_stage(results, stage_name, func, *args, **kwargs)
+    if cache_key:
+        await asyncio.to_thread(cache.set, cache_key, result)
+    return result
+
+def _maintenance_mtimes() -> Dict[str, Optional[int]]:
+    """Stat the files whose changes make post-run maintenance worthwhile"""
+    from src.content_manager.config import config as content_config
+    from src.technician_agent.config import config as technician_config
+    
+    # Upload logs are date-stamped (uploader_YYYYMMDD.log), so track the newest one
+    upload_log = content_config.upload_log
+    upload_mtimes = [
+        entry.stat().st_mtime_ns
+        for entry in upload_log.parent.glob(f"{upload_log.stem}*.log")
+    ]
+    diagnostic_log = technician_config.diagnostic_dir / "diagnostic.log"
+    return {
+        "upload_log": max(upload_mtimes, default=None),
+        "diagnostic_log": diagnostic_log.stat().st_mtime_ns if diagnostic_log.exists() else None
+    }
+
+def run_maintenance(modules: Dict[str, Any]) -> bool:
+    """
+    Refresh content analysis and diagnostics, skipping the work when nothing changed.
+    
+    The last-seen upload/diagnostic log mtimes and the technician's log offsets are
+    kept in data/cache/last_maint.json, so unchanged cron ticks do no maintenance
+    I/O and log analysis only scans data appended since the previous run.
+    
+    Args:
+        modules: Dictionary of initialized modules
+        
+    Returns:
+        bool: True if maintenance ran, False if it was skipped
+    """
+    base_data_path = Path(load_config()["base_settings"]["base_data_path"])
+    state_path = base_data_path / "cache" / "last_maint.json"
+    state = load_json_file(state_path) if state_path.exists() else None
+    state = state or {}
+    
+    if state.get("mtimes") == _maintenance_mtimes():
+        logger.info("Skipping maintenance: no new uploads or diagnostics since last run")
+        return False
+    
+    logger.info("Running content analysis and system diagnostics")
+    modules["content_manager"].load_past_upload_data()
+    modules["content_manager"].update_performance_metrics()
+    technician = modules["technician"]
+    technician.analyze_logs(since=state.get("log_offsets"))
+    technician.generate_diagnostic_report()
+    
+    # Record state after maintenance so its own writes don't trigger the next run
+    create_directory_if_not_exists(state_path.parent)
+    save_json_file({
+        "mtimes": _maintenance_mtimes(),
+        "log_offsets": technician.log_offsets
+    }, state_path)
+    return True
+
+async def run_full_pipeline_async(
     modules: Dict[str, Any],
     source_path: str,
     source_type: str,
-    topic: Optional[str] = None
+    topic: Optional[str] = None,
+    results: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
-    Execute the full content generation pipeline with robust error handling
+    Execute the full content generation pipeline as a dependency graph of stages.
+    
+    Each stage is scheduled as an asyncio task that starts as soon as the stages it
+    depends on have resolved:
+        ingestion -> script_generation -> {animation, voice_generation}
+        {animation, voice_generation} -> video_composition
+        {script_generation, video_composition} -> quality_control
+        {script_generation, video_composition} -> upload
     
     Args:
         modules: Dictionary of initialized modules
         source_path: Path to source material
         source_type: Type of source (pdf, html, image)
         topic: Optional topic override
+        results: Optional results dict to fill in (e.g. from a ResultsPool)
         
     Returns:
         dict: Pipeline execution results and diagnostics
     """
-    results = {
-        "start_time": datetime.now().isoformat(),
-        "stages": {},
-        "success": False,
-        "error": None
-    }
+    if results is None:
+        results = copy.deepcopy(_RESULTS_TEMPLATE)
+    # Paths are normalized to str once here; stage outputs are recorded with
+    # os.fspath, which is a no-op for str and reuses a Path's cached string
+    source_path = os.fspath(source_path)
+    results["start_time"] = datetime.now().isoformat()
+    results["_start_perf"] = time.perf_counter_ns()
+    stages = results["stages"]
     
-    try:
-        # 1. Ingestion
-        ingested_data = run_pipeline_stage(
+    # Ingestion and script generation are pure functions of the source contents,
+    # source type and topic, so their results are cached under a content hash
+    async def cache_key(stage_name: str, *parts) -> Optional[str]:
+        source_digest = await digest_task
+        if source_digest is None:
+            return None
+        return make_cache_key(stage_name, source_digest, source_type, *parts)
+    
+    # 1. Ingestion (OCR output also depends on the OCR settings)
+    async def ingestion():
+        ocr_settings = ()
+        if source_type == "image":
+            from src.ingestion_engine.config import config as ingestion_config
+            ocr_settings = (ingestion_config.ocr_language, ingestion_config.ocr_psm,
+                            ingestion_config.ocr_preprocess)
+        ingested_data = await run_cached_stage(
+            results,
             "ingestion",
-            modules["ingestion"].process_source,
+            await cache_key("ingestion", *ocr_settings),
+            # PDF extraction is CPU-bound; html/image ingestion is I/O-bound and stays on the loop
+            _ingest_in_process_pool if source_type == "pdf" else modules["ingestion"].process_source_async,
             source_path,
             source_type
         )
-        results["stages"]["ingestion"] = {
-            "output": ingested_data["metadata"]["source"],
-            "success": True
-        }
+        stages["ingestion"].update(output=ingested_data["metadata"]["source"], success=True)
+        return ingested_data
 
-        # 2. Script Generation
-        script_data = run_pipeline_stage(
+    # 2. Script Generation (depends on ingestion)
+    async def script_generation():
+        ingested_data = await ingestion_task
+        script_data = await run_cached_stage(
+            results,
             "script_generation",
-            modules["script_generator"].generate_script,
+            await cache_key("script_generation", topic),
+            modules["script_generator"].generate_script_async,
             ingested_data,
             topic
         )
-        results["stages"]["script_generation"] = {
-            "output": script_data["metadata"]["source"],
-            "success": True
-        }
+        stages["script_generation"].update(output=script_data["metadata"]["source"], success=True)
+        return script_data
 
-        # 3. Animation
-        animation_path = run_pipeline_stage(
+    # 3. Animation (depends on script)
+    async def animation():
+        script_data = await script_task
+        animation_path = await run_pipeline_stage(
+            results,
             "animation",
             modules["animator"].process_script_for_animation,
             script_data
         )
-        results["stages"]["animation"] = {
-            "output": str(animation_path),
-            "success": True
-        }
+        stages["animation"].update(output=os.fspath(animation_path), success=True)
+        return animation_path
 
-        # 4. Voice Generation
-        voice_results = run_pipeline_stage(
+    # 4. Voice Generation (depends on script, runs alongside animation)
+    async def voice_generation():
+        script_data = await script_task
+        voice_results = await run_pipeline_stage(
+            results,
             "voice_generation",
-            modules["voice_generator"].process_script,
+            modules["voice_generator"].process_script_async,
             script_data
         )
-        results["stages"]["voice_generation"] = {
-            "output": str(voice_results["voiceover"]),
-            "success": True
-        }
+        stages["voice_generation"].update(output=os.fspath(voice_results["voiceover"]), success=True)
+        return voice_results
 
-        # 5. Video Composition
-        final_video_path = run_pipeline_stage(
+    # 5. Video Composition (depends on animation and voice)
+    async def video_composition():
+        animation_path, voice_results = await asyncio.gather(animation_task, voice_task)
+        # Compose into scratch storage; QC and upload read the local copy while
+        # the sink persists it to the output directory in the background (the
+        # video is about as large as its inputs, which decides whether it fits)
+        output_path = modules["video_composer"].default_output_path(animation_path)
+        expected_bytes = sum(
+            get_file_size(path) or 0 for path in (animation_path, voice_results["voiceover"])
+        )
+        final_video_path = await run_pipeline_stage(
+            results,
             "video_composition",
             modules["video_composer"].merge_assets,
             animation_path,
             voice_results["voiceover"],
-            voice_results.get("subtitles")
+            voice_results.get("subtitles"),
+            sink.scratch_path(output_path.name, expected_bytes)
         )
-        results["stages"]["video_composition"] = {
-            "output": str(final_video_path),
-            "success": True
-        }
+        sink.enqueue(final_video_path, output_path)
+        stages["video_composition"].update(output=os.fspath(output_path), success=True)
+        return final_video_path
 
-        # 6. Quality Control
-        qc_report_path = run_pipeline_stage(
+    # 6. Quality Control (depends on script and final video)
+    async def quality_control():
+        script_data, final_video_path = await asyncio.gather(script_task, compose_task)
+        qc_report_path = await run_pipeline_stage(
+            results,
             "quality_control",
-            modules["quality_control"].generate_qc_report,
+            modules["quality_control"].generate_qc_report_async,
             script_data["script"],
             final_video_path
         )
-        results["stages"]["quality_control"] = {
-            "output": str(qc_report_path),
-            "success": qc_report_path is not None
-        }
+        stages["quality_control"].update(
+            output=os.fspath(qc_report_path),
+            success=qc_report_path is not None
+        )
+        return qc_report_path
 
-        # 7. Upload
-        upload_results = run_pipeline_stage(
+    # 7. Upload (depends on script and final video, runs alongside QC)
+    async def upload():
+        script_data, final_video_path = await asyncio.gather(script_task, compose_task)
+        upload_results = await run_pipeline_stage(
+            results,
             "upload",
-            modules["uploader"].upload_all_platforms,
+            modules["uploader"].upload_all_platforms_async,
             final_video_path,
             script_data
         )
-        results["stages"]["upload"] = {
-            "output": {k: v is not None for k, v in upload_results.items()},
-            "success": any(upload_results.values())
-        }
+        # Per-platform status and overall success in a single pass
+        platform_status = {}
+        any_uploaded = False
+        for platform, response in upload_results.items():
+            uploaded = response is not None
+            platform_status[platform] = uploaded
+            any_uploaded = any_uploaded or uploaded
+        stages["upload"].update(output=platform_status, success=any_uploaded)
+        return upload_results
+
+    sink = StagingSink()
+    digest_task = asyncio.create_task(asyncio.to_thread(hash_file, source_path))
+    ingestion_task = asyncio.create_task(ingestion())
+    script_task = asyncio.create_task(script_generation())
+    animation_task = asyncio.create_task(animation())
+    voice_task = asyncio.create_task(voice_generation())
+    compose_task = asyncio.create_task(video_composition())
+    qc_task = asyncio.create_task(quality_control())
+    upload_task = asyncio.create_task(upload())
+    tasks = [
+        digest_task, ingestion_task, script_task, animation_task, voice_task,
+        compose_task, qc_task, upload_task
+    ]
+    
+    try:
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # Cancel whatever is still pending after a failure and collect every
+            # task's outcome so no exception is left unretrieved
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         results["success"] = True
         logger.info("Pipeline completed successfully")
@@ -199,22 +552,60 @@ def run_full_pipeline(
             logger.error(f"Diagnostics failed: {str(diag_error)}")
 
     finally:
+        # Wait for staged artifacts to reach their final location
+        await sink.close()
+        if sink.failed:
+            results["success"] = False
+            results["error"] = f"Failed to persist artifacts: {', '.join(map(str, sink.failed))}"
         results["end_time"] = datetime.now().isoformat()
+        results["_end_perf"] = time.perf_counter_ns()
         
-        # Always run maintenance and analysis
+        # Run maintenance and analysis when their inputs have changed
         try:
-            logger.info("Running content analysis and system diagnostics")
-            modules["content_manager"].load_past_upload_data()
-            modules["content_manager"].update_performance_metrics()
-            modules["technician"].analyze_logs()
-            modules["technician"].generate_diagnostic_report()
+            run_maintenance(modules)
         except Exception as e:
             logger.error(f"Post-pipeline tasks failed: {str(e)}")
 
-        return results
+    return results
 
-def parse_arguments():
-    """Parse command line arguments with improved validation"""
+def run_full_pipeline(
+    modules: Dict[str, Any],
+    source_path: str,
+    source_type: str,
+    topic: Optional[str] = None,
+    results: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Execute the full content generation pipeline (synchronous entry point)
+    
+    Args:
+        modules: Dictionary of initialized modules
+        source_path: Path to source material
+        source_type: Type of source (pdf, html, image)
+        topic: Optional topic override
+        results: Optional results dict to fill in (e.g. from a ResultsPool)
+        
+    Returns:
+        dict: Pipeline execution results and diagnostics
+    """
+    async def run_and_close():
+        try:
+            return await run_full_pipeline_async(
+                modules=modules,
+                source_path=source_path,
+                source_type=source_type,
+                topic=topic,
+                results=results
+            )
+        finally:
+            # The ingestion engine's aiohttp session is bound to this run's loop
+            await modules["ingestion"].aclose()
+    
+    # run_sync closes the loop's pooled connections before the loop ends
+    return run_sync(run_and_close())
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser (done once at import; it needs no heavy imports)"""
     parser = argparse.ArgumentParser(
         description="AutoEd Content Generation Pipeline",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -242,12 +633,19 @@ def parse_arguments():
         type=Path,
         help="Custom path to .env file"
     )
-    return parser.parse_args()
+    return parser
+
+# The CLI schema is fixed, so the parser is built once per process
+_PARSER = _build_parser()
+
+def parse_arguments():
+    """Parse command line arguments with improved validation"""
+    return _PARSER.parse_args()
 
 def print_summary(results: Dict[str, Any]):
     """Print a user-friendly summary of the pipeline run"""
-    duration = (datetime.fromisoformat(results["end_time"]) - 
-               datetime.fromisoformat(results["start_time"]))
+    # Monotonic clock deltas; the ISO timestamps are for display only
+    duration = timedelta(microseconds=(results["_end_perf"] - results["_start_perf"]) // 1000)
     
     print("\n=== Pipeline Summary ===")
     print(f"Status: {'SUCCESS' if results['success'] else 'FAILED'}")
@@ -275,6 +673,7 @@ def main():
             try:
                 from apscheduler.schedulers.blocking import BlockingScheduler
                 scheduler = BlockingScheduler()
+                results_pool = ResultsPool()
                 
                 @scheduler.scheduled_job('cron', args.schedule)
                 def scheduled_run():
@@ -283,9 +682,11 @@ def main():
                         modules=modules,
                         source_path=args.source_path,
                         source_type=args.source_type,
-                        topic=args.topic
+                        topic=args.topic,
+                        results=results_pool.acquire()
                     )
                     print_summary(results)
+                    results_pool.release(results)
                 
                 logger.info(f"Starting scheduler with schedule: {args.schedule}")
                 print(f"Pipeline scheduler started. Press Ctrl+C to exit.")
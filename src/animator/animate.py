@@ -1,32 +1,81 @@
 import os
+import functools
 import json
+import re
 import subprocess
+import sys
 import tempfile
+import threading
 import time
 from pathlib import Path
 from typing import Optional, Dict, Any
-import svgwrite
-import cairosvg
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from src.utils.logging_utils import setup_logging, log_operation
 from src.utils.file_utils import (
     create_directory_if_not_exists,
-    save_json_file,
-    load_json_file
+    load_json_file_cached
 )
+from src.utils.ffmpeg_utils import encoder_args
 from .config import config
 
 # Initialize logging
 logger = setup_logging("animator")
 
+# "[SECTION: title] content" blocks; content runs to the next marker or end of script
+_SECTION_RE = re.compile(r'\[SECTION:([^\]]*)\](.*?)(?=\[SECTION:|\Z)', re.DOTALL)
+
+@functools.lru_cache(maxsize=None)
+def _load_title_font() -> ImageFont.ImageFont:
+    """Load the title font once per process"""
+    try:
+        return ImageFont.truetype(config.title_font, config.title_font_size)
+    except OSError:
+        logger.warning(f"Title font {config.title_font} not found, using Pillow's default font")
+        return ImageFont.load_default()
+
+def _rasterize_section(title: str, width: int, height: int, out: np.ndarray) -> np.ndarray:
+    """
+    Render a section title card into a raw RGBA frame buffer.
+    
+    The card is drawn directly with Pillow (background fill plus centered title).
+    
+    Args:
+        title: Section title
+        width: Frame width in pixels
+        height: Frame height in pixels
+        out: (height, width, 4) uint8 buffer to render into
+        
+    Returns:
+        The filled buffer
+    """
+    img = Image.new("RGBA", (width, height), "#333333")
+    ImageDraw.Draw(img).text(
+        (width // 2, height // 2),
+        title,
+        font=_load_title_font(),
+        fill="#FFFFFF",
+        anchor="ms"  # Horizontally centered on the baseline, as before
+    )
+    
+    np.copyto(out, np.asarray(img))
+    return out
+
 class Animator:
     """Core animation generator using Manim and SVG"""
     
     def __init__(self):
         create_directory_if_not_exists(config.output_dir)
         self.template = self._load_default_template()
+        
+        # Single RGBA frame buffer reused for every frame sent to the encoder
+        self._frame_buf = np.empty((config.height, config.width, 4), dtype=np.uint8)
+        
+        # Persistent Manim render worker (started on first Manim render)
+        self._manim_worker: Optional[subprocess.Popen] = None
+        self._manim_worker_failed = False
+        self._manim_lock = threading.Lock()
         logger.info("Animator initialized with config:")
         logger.info(f"Resolution: {config.resolution}")
         logger.info(f"FPS: {config.fps}")
@@ -35,18 +84,130 @@ class Animator:
         """Load the default animation template"""
         template_path = config.template_dir / "default_template.json"
         try:
-            return load_json_file(template_path)
+            return load_json_file_cached(template_path)
         except Exception as e:
             logger.error(f"Failed to load template: {str(e)}")
             return {}
 
+    def _build_manim_script(self, script_text: str) -> str:
+        """Generate basic Manim scene source (simplified example)"""
+        return f"""
+from manim import *
+
+class GeneratedAnimation(Scene):
+    def construct(self):
+        # Example simple animation
+        title = Text("{script_text[:50]}...", font_size=48)
+        self.play(Write(title))
+        self.wait(2)
+        self.play(FadeOut(title))
+"""
+
+    def _get_manim_worker(self) -> Optional[subprocess.Popen]:
+        """
+        Return the long-lived Manim worker, starting it on first use
+        
+        Returns:
+            Popen: Running worker, or None if it could not be started
+        """
+        if self._manim_worker is not None and self._manim_worker.poll() is None:
+            return self._manim_worker
+        if self._manim_worker_failed:
+            return None
+        
+        try:
+            worker = subprocess.Popen(
+                [sys.executable, str(Path(__file__).with_name("manim_worker.py"))],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+            handshake = json.loads(worker.stdout.readline() or '{"ready": false, "error": "worker exited"}')
+            if not handshake.get("ready"):
+                worker.kill()
+                raise RuntimeError(handshake.get("error", "unknown error"))
+        except Exception as e:
+            logger.warning(f"Manim worker unavailable, using one-shot manim runs: {str(e)}")
+            self._manim_worker_failed = True
+            return None
+        
+        self._manim_worker = worker
+        logger.info("Started Manim worker process")
+        return worker
+
+    def _render_with_worker(self, manim_script: str, output_path: Path) -> Optional[bool]:
+        """
+        Render a scene on the Manim worker
+        
+        Returns:
+            bool: Render result, or None if the worker is unavailable or died
+        """
+        with self._manim_lock:
+            worker = self._get_manim_worker()
+            if worker is None:
+                return None
+            try:
+                worker.stdin.write(json.dumps({
+                    "script": manim_script,
+                    "scene": "GeneratedAnimation",
+                    "output_path": str(output_path),
+                    "quality": "low_quality"
+                }) + "\n")
+                worker.stdin.flush()
+                reply_line = worker.stdout.readline()
+            except (OSError, ValueError) as e:
+                reply_line = ""
+                logger.warning(f"Manim worker I/O failed: {str(e)}")
+            
+            if not reply_line:
+                # Worker died; the next call starts a fresh one
+                logger.warning("Manim worker exited unexpectedly")
+                worker.kill()
+                self._manim_worker = None
+                return None
+        
+        reply = json.loads(reply_line)
+        if not reply.get("ok"):
+            logger.error(f"Manim failed: {reply.get('error')}")
+            return False
+        return True
+
+    def _render_with_subprocess(self, manim_script: str, output_path: Path) -> bool:
+        """Render a scene with a one-shot manim CLI process"""
+        # Create temporary Manim script
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+            temp_script_path = Path(f.name)
+            f.write(manim_script)
+        
+        # Call Manim via subprocess
+        result = subprocess.run([
+            config.manim_path,
+            "-ql",  # Medium quality
+            "-o", output_path.stem,
+            str(temp_script_path),
+            "GeneratedAnimation"
+        ], cwd=output_path.parent, capture_output=True, text=True)
+        
+        # Clean up temporary file
+        temp_script_path.unlink()
+        
+        if result.returncode != 0:
+            logger.error(f"Manim failed: {result.stderr}")
+            return False
+        return True
+
     def generate_manim_animation(self, script_text: str, output_path: Path) -> bool:
         """
-        Generate animation using Manim by calling it as subprocess
+        Generate animation using Manim
+        
+        Scenes are rendered on a persistent worker process so manim is imported
+        once; if the worker can't run, each render falls back to a manim subprocess.
         
         Args:
             script_text: Text content from script
-            output_path: Output directory for animation
+            output_path: Output path for the animation
             
         Returns:
             bool: True if successful, False otherwise
@@ -55,38 +216,12 @@ class Animator:
                      {"output_path": str(output_path)})
         
         try:
-            # Create temporary Manim script
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                temp_script_path = Path(f.name)
-                
-                # Generate basic Manim script (simplified example)
-                manim_script = f"""
-from manim import *
-
-class GeneratedAnimation(Scene):
-    def construct(self):
-        # Example simple animation
-        title = Text("{script_text[:50]}...", font_size=48)
-        self.play(Write(title))
-        self.wait(2)
-        self.play(FadeOut(title))
-"""
-                f.write(manim_script)
+            manim_script = self._build_manim_script(script_text)
             
-            # Call Manim via subprocess
-            result = subprocess.run([
-                config.manim_path,
-                "-ql",  # Medium quality
-                "-o", output_path.stem,
-                str(temp_script_path),
-                "GeneratedAnimation"
-            ], cwd=output_path.parent, capture_output=True, text=True)
-            
-            # Clean up temporary file
-            temp_script_path.unlink()
-            
-            if result.returncode != 0:
-                logger.error(f"Manim failed: {result.stderr}")
+            success = self._render_with_worker(manim_script, output_path)
+            if success is None:
+                success = self._render_with_subprocess(manim_script, output_path)
+            if not success:
                 return False
                 
             log_operation(logger, "generate_manim_animation", "completed", 
@@ -97,61 +232,96 @@ class GeneratedAnimation(Scene):
             logger.error(f"Manim generation failed: {str(e)}")
             return False
 
-    def generate_svg_animation(self, script_json: Dict[str, Any], output_path: Path) -> bool:
+    def _get_frame_buffer(self, width: int, height: int) -> np.ndarray:
+        """Return the shared frame buffer, reallocating only if the resolution changed"""
+        if self._frame_buf.shape[:2] != (height, width):
+            self._frame_buf = np.empty((height, width, 4), dtype=np.uint8)
+        return self._frame_buf
+
+    def _open_frame_pipe(self, output_mp4: Path, width: int, height: int, fps: int) -> subprocess.Popen:
         """
-        Generate animation frames using SVG
+        Start an ffmpeg process that encodes raw RGBA frames written to its stdin
+        
+        Args:
+            output_mp4: Output MP4 file path
+            width: Frame width in pixels
+            height: Frame height in pixels
+            fps: Frames per second
+            
+        Returns:
+            Popen: Running ffmpeg process
+        """
+        cmd = [
+            config.ffmpeg_path,
+            "-y",  # Overwrite output
+            "-loglevel", "error",
+            "-f", "rawvideo",
+            "-pix_fmt", "rgba",
+            "-video_size", f"{width}x{height}",
+            "-framerate", str(fps),
+            "-i", "-",
+            *encoder_args(config.ffmpeg_encoder),
+            "-pix_fmt", "yuv420p",
+            str(output_mp4)
+        ]
+        # Buffer one whole frame so each frame reaches the pipe in a single flush
+        # rather than thousands of default-sized (8KB) writes
+        frame_bytes = width * height * 4
+        return subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=frame_bytes
+        )
+
+    def generate_svg_animation(self, script_json: Dict[str, Any], output_mp4: Path) -> bool:
+        """
+        Generate an animation of section title cards, streaming them straight into ffmpeg
+        
+        Frames are drawn in memory and written to ffmpeg's stdin as raw RGBA,
+        so no frame ever touches the filesystem.
         
         Args:
             script_json: Structured script data
-            output_path: Output directory for frames
+            output_mp4: Output MP4 file path
             
         Returns:
             bool: True if successful, False otherwise
         """
         log_operation(logger, "generate_svg_animation", "started", 
-                     {"output_path": str(output_path)})
+                     {"output_path": str(output_mp4)})
         
         try:
-            create_directory_if_not_exists(output_path)
+            create_directory_if_not_exists(output_mp4.parent)
             
-            # Get resolution from config
-            width, height = config.resolution_map.get(config.resolution, (1920, 1080))
+            width, height = config.width, config.height
             
             # Generate frames for each section
             sections = self._parse_script_to_sections(script_json)
             frame_count = 0
             
-            for i, section in enumerate(sections):
-                # Create SVG for each section
-                dwg = svgwrite.Drawing(size=(f"{width}px", f"{height}px"))
-                
-                # Background
-                dwg.add(dwg.rect(insert=(0, 0), size=('100%', '100%'), fill='#333333'))
-                
-                # Title
-                dwg.add(dwg.text(
-                    section.get('title', 'Educational Content'),
-                    insert=(width//2, height//2),
-                    font_size="48px",
-                    fill="#FFFFFF",
-                    text_anchor="middle"
-                ))
-                
-                # Save SVG
-                svg_file = output_path / f"frame_{frame_count:04d}.svg"
-                dwg.saveas(svg_file)
-                
-                # Convert to PNG
-                png_file = output_path / f"frame_{frame_count:04d}.png"
-                cairosvg.svg2png(url=str(svg_file), write_to=str(png_file))
-                
-                frame_count += 1
-                
-                # Remove intermediate SVG
-                svg_file.unlink()
+            frame_buf = self._get_frame_buffer(width, height)
+            frame_view = memoryview(frame_buf).cast('B')
+            
+            titles = [section.get('title', 'Educational Content') for section in sections]
+            
+            # One reused frame buffer, rasterized in-process: a card is a fill
+            # and one text draw, cheaper than shipping its pixels between processes
+            proc = self._open_frame_pipe(output_mp4, width, height, config.fps)
+            try:
+                for title in titles:
+                    _rasterize_section(title, width, height, out=frame_buf)
+                    proc.stdin.write(frame_view)
+                    frame_count += 1
+            finally:
+                _, stderr = proc.communicate()
+            
+            if proc.returncode != 0:
+                logger.error(f"ffmpeg failed: {stderr.decode('utf-8', errors='replace')}")
+                return False
             
             log_operation(logger, "generate_svg_animation", "completed", 
-                         {"frames_generated": frame_count})
+                         {"frames_generated": frame_count, "output": str(output_mp4)})
             return True
             
         except Exception as e:
@@ -166,16 +336,14 @@ class GeneratedAnimation(Scene):
         script = script_json.get("script", "")
         sections = []
         
-        # Split by sections if marked in script
-        if "[SECTION:" in script:
-            section_parts = script.split("[SECTION:")[1:]
-            for part in section_parts:
-                section_name, content = part.split("]", 1)
-                sections.append({
-                    "title": section_name.strip(),
-                    "content": content.strip()
-                })
-        else:
+        # Split by sections if marked in script (one regex pass over the script)
+        for match in _SECTION_RE.finditer(script):
+            sections.append({
+                "title": match.group(1).strip(),
+                "content": match.group(2).strip()
+            })
+        
+        if not sections:
             sections.append({
                 "title": script_json.get("metadata", {}).get("content_attributes", {}).get("topic", "Educational Content"),
                 "content": script
@@ -202,11 +370,23 @@ class GeneratedAnimation(Scene):
             if not fps:
                 fps = config.fps
                 
-            # Check if frames exist
-            frame_files = sorted(frame_dir.glob("frame_*.png"))
-            if not frame_files:
+            # Count frames; ffmpeg's frame_%04d.png pattern takes care of ordering
+            frame_count = 0
+            sample_frame = None
+            with os.scandir(frame_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith("frame_") and entry.name.endswith(".png"):
+                        frame_count += 1
+                        sample_frame = sample_frame or entry.path
+            if not frame_count:
                 logger.error("No frames found to compile")
                 return False
+            
+            # Only resample when the frames aren't already at the target size
+            # (reading the size only parses the PNG header)
+            with Image.open(sample_frame) as img:
+                needs_scale = img.size != (config.width, config.height)
+            scale_args = ["-vf", config.scale_filter] if needs_scale else []
                 
             # Build ffmpeg command
             cmd = [
@@ -214,9 +394,9 @@ class GeneratedAnimation(Scene):
                 "-y",  # Overwrite output
                 "-framerate", str(fps),
                 "-i", str(frame_dir / "frame_%04d.png"),
-                "-c:v", "libx264",
+                *encoder_args(config.ffmpeg_encoder),
                 "-pix_fmt", "yuv420p",
-                "-vf", f"scale={config.resolution_map[config.resolution][0]}:{config.resolution_map[config.resolution][1]}",
+                *scale_args,
                 str(output_mp4)
             ]
             
@@ -227,7 +407,7 @@ class GeneratedAnimation(Scene):
                 return False
                 
             log_operation(logger, "compile_frames_to_mp4", "completed", 
-                         {"output": str(output_mp4), "frame_count": len(frame_files)})
+                         {"output": str(output_mp4), "frame_count": frame_count})
             return True
             
         except Exception as e:
@@ -265,14 +445,9 @@ class GeneratedAnimation(Scene):
                     output_path
                 )
             else:
-                # Generate SVG frames then compile
-                frames_dir = output_dir / "frames"
-                create_directory_if_not_exists(frames_dir)
-                
-                success = self.generate_svg_animation(script_json, frames_dir)
-                if success:
-                    output_path = output_dir / f"{source_name}_svg.mp4"
-                    success = self.compile_frames_to_mp4(frames_dir, output_path)
+                # Render SVG frames straight into the encoder
+                output_path = output_dir / f"{source_name}_svg.mp4"
+                success = self.generate_svg_animation(script_json, output_path)
             
             if not success:
                 return None
@@ -1,15 +1,15 @@
 import os
 from pathlib import Path
-from typing import Dict, Any
-from src.utils.file_utils import load_json_file
+from typing import Dict, Any, Optional
+from src.utils.main_config import get_main_config
+from src.utils.ffmpeg_utils import detect_h264_encoder
 
 # Load main configuration
-_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
-_main_config = load_json_file(_CONFIG_PATH)
+_main_config = get_main_config()
 
 class AnimatorConfig:
     """Configuration for the Animator module"""
-    
+
     def __init__(self):
         # Paths from main config
         self.base_data_path = Path(_main_config["base_settings"]["base_data_path"])
@@ -19,7 +19,10 @@ class AnimatorConfig:
         
         # Animation settings from main config
         anim_config = _main_config["module_specific"]["animator"]
-        self.resolution = anim_config["output_resolution"]  # e.g., "1080p"
+        self.resolution = anim_config.get(
+            "output_resolution",
+            _main_config["base_settings"]["output_video_resolution"]
+        )  # e.g., "1080p"
         self.fps = anim_config["fps"]
         self.default_transition = anim_config["default_transition"]
         
@@ -31,6 +34,10 @@ class AnimatorConfig:
             "4k": (3840, 2160)
         }
         
+        # Frame size resolved once for everything that renders or encodes frames
+        self.width, self.height = self.resolution_map.get(self.resolution, (1920, 1080))
+        self.scale_filter = f"scale={self.width}:{self.height}"
+        
         # Default durations (in seconds)
         self.scene_duration = 5
         self.transition_duration = 1
@@ -38,6 +45,28 @@ class AnimatorConfig:
         # External tools paths
         self.ffmpeg_path = "ffmpeg"
         self.manim_path = "manim"
+        
+        # Title card font
+        self.title_font = "DejaVuSans.ttf"
+        self.title_font_size = 48
+        
+        # Video encoder; resolved on first use (see ffmpeg_encoder)
+        self._ffmpeg_encoder: Optional[str] = anim_config.get("ffmpeg_encoder")
+
+    @property
+    def ffmpeg_encoder(self) -> str:
+        """
+        Video encoder: explicit setting, else NVENC when available, else libx264
+        
+        Detection runs a test encode, so it happens on first use rather than at import.
+        """
+        if self._ffmpeg_encoder is None:
+            self._ffmpeg_encoder = detect_h264_encoder(self.ffmpeg_path)
+        return self._ffmpeg_encoder
+
+    @ffmpeg_encoder.setter
+    def ffmpeg_encoder(self, encoder: str) -> None:
+        self._ffmpeg_encoder = encoder
 
 # Singleton config instance
 config = AnimatorConfig()
@@ -0,0 +1,70 @@
+"""
+Long-lived Manim render worker.
+
+Started once by the Animator and kept alive so manim, numpy and cairo are
+imported a single time instead of once per render. Requests and replies are
+JSON lines:
+
+    request: {"script": "<python source>", "scene": "GeneratedAnimation",
+              "output_path": "/path/to/out.mp4", "quality": "low_quality"}
+    reply:   {"ok": true, "path": "/path/to/out.mp4"}
+             {"ok": false, "error": "..."}
+
+The first line written on startup is {"ready": true} or {"ready": false, "error": ...}.
+"""
+import os
+import sys
+import json
+import shutil
+import tempfile
+import traceback
+from pathlib import Path
+
+def _render(request: dict) -> dict:
+    """Execute a scene script and render the requested scene to output_path"""
+    from manim import tempconfig
+
+    output_path = Path(request["output_path"])
+    namespace = {"__name__": "__manim_scene__"}
+    exec(compile(request["script"], "<manim scene>", "exec"), namespace)
+    scene_class = namespace[request["scene"]]
+
+    with tempfile.TemporaryDirectory(prefix="manim_") as media_dir:
+        with tempconfig({
+            "quality": request.get("quality", "low_quality"),
+            "media_dir": media_dir,
+            "output_file": output_path.stem,
+            "disable_caching": True
+        }):
+            scene = scene_class()
+            scene.render()
+            movie_path = Path(scene.renderer.file_writer.movie_file_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(movie_path), str(output_path))
+
+    return {"ok": True, "path": str(output_path)}
+
+def main() -> None:
+    # Replies go to the original stdout; anything manim prints goes to stderr
+    replies = os.fdopen(os.dup(sys.stdout.fileno()), "w", buffering=1, encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    try:
+        import manim  # noqa: F401 - pay the import cost once, up front
+    except Exception as e:
+        replies.write(json.dumps({"ready": False, "error": str(e)}) + "\n")
+        return
+    replies.write(json.dumps({"ready": True}) + "\n")
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            reply = _render(json.loads(line))
+        except Exception as e:
+            traceback.print_exc()
+            reply = {"ok": False, "error": str(e)}
+        replies.write(json.dumps(reply) + "\n")
+
+if __name__ == "__main__":
+    main()
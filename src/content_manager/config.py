@@ -1,11 +1,10 @@
 import os
 from pathlib import Path
 from typing import Dict, Any
-from src.utils.file_utils import load_json_file
+from src.utils.main_config import get_main_config
 
 # Load main configuration
-_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
-_main_config = load_json_file(_CONFIG_PATH)
+_main_config = get_main_config()
 
 class ContentManagerConfig:
     """Configuration for the Content Manager module"""
@@ -19,10 +18,16 @@ class ContentManagerConfig:
         self.schedule_file = self.base_data_path / "content_schedule.json"
         self.trending_cache = self.base_data_path / "trending_topics.json"
         
+        # Binary (msgpack) variants, used when msgspec is installed
+        self.schedule_packed = self.base_data_path / "content_schedule.msgpack"
+        self.trending_cache_packed = self.base_data_path / "trending_topics.msgpack"
+        
         # Default files
         self.upload_log = self.base_data_path / "logs" / "uploader.log"
         self.qc_report_dir = self.base_data_path / "qc_reports"
         self.performance_csv = self.performance_data_dir / "content_performance.csv"
+        self.performance_parquet_dir = self.performance_data_dir / "content_performance"
+        self.max_performance_partitions = 64  # Compact into one file beyond this
         
         # Analysis parameters
         self.top_n_topics = 3
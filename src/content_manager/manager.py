@@ -2,11 +2,36 @@ import os
 import csv
 import json
 import time
+import functools
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
+import numpy as np
 import pandas as pd
+import requests
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    import pyarrow
+    import pyarrow.csv as pacsv
+except ImportError:
+    pyarrow = None
+    pacsv = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 from src.utils.logging_utils import setup_logging, log_operation
+from src.utils.inflate_logs import read_records
 from src.utils.file_utils import (
     create_directory_if_not_exists,
     save_json_file,
@@ -19,34 +44,182 @@ from src.utils.api_keys import TRENDING_API_KEY  # Import API key
 # Initialize logging
 logger = setup_logging("content_manager")
 
+# Persistent session for the trending API: connections (and TLS sessions)
+# are reused across refreshes instead of being rebuilt per request
+_trending_session = requests.Session()
+_trending_session.headers["Authorization"] = f"Bearer {TRENDING_API_KEY}"
+
+# Values present on completed upload records in the uploader log; a cheap
+# prefilter that holds whichever JSON separators the line was written with
+_UPLOAD_OP_MARK = b'"upload_to_'
+_COMPLETED_MARK = b'"completed"'
+
+# Columns of a new performance data table
+_PERFORMANCE_COLUMNS = (
+    "topic", "platform", "upload_date", "views",
+    "likes", "watch_time_percentage", "qc_issues"
+)
+
+def _read_performance_csv(csv_path: Path) -> pd.DataFrame:
+    """
+    Read a performance CSV, using pyarrow's multi-threaded parser when available
+    
+    Metric columns are parsed straight into typed Arrow buffers, so large
+    histories don't box every cell as a Python object before reaching pandas.
+    """
+    if pacsv is None:
+        return pd.read_csv(csv_path)
+    
+    table = pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        convert_options=pacsv.ConvertOptions(column_types={
+            "views": pyarrow.int64(),
+            "likes": pyarrow.int64(),
+            "watch_time_percentage": pyarrow.float32()
+        })
+    )
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def _load_packed(packed_path: Path, json_path: Path) -> Optional[Any]:
+    """
+    Load state stored as msgpack, falling back to the legacy JSON file
+    
+    Args:
+        packed_path: msgpack file (used when msgspec is installed)
+        json_path: JSON file (used without msgspec, and for migration)
+        
+    Returns:
+        Decoded data, or None if neither file exists
+    """
+    if msgspec is not None and packed_path.exists():
+        return msgspec.msgpack.decode(packed_path.read_bytes())
+    if json_path.exists():
+        return load_json_file(json_path)
+    return None
+
+def _save_packed(data: Any, packed_path: Path, json_path: Path) -> bool:
+    """
+    Save state as msgpack when msgspec is installed, otherwise as JSON
+    
+    A legacy JSON file is retired (renamed to *.json.migrated) after the first
+    msgpack save so it can't be read back as stale state.
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if msgspec is None:
+        return save_json_file(data, json_path)
+    try:
+        packed_path.write_bytes(msgspec.msgpack.encode(data))
+        if json_path.exists():
+            json_path.rename(json_path.with_suffix(".json.migrated"))
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save {packed_path}: {str(e)}")
+        return False
+
+
+def _is_completed_upload(log_entry: Dict[str, Any]) -> bool:
+    """Whether a log_operation record marks a finished platform upload"""
+    return (log_entry.get("status") == "completed"
+            and str(log_entry.get("operation", "")).startswith("upload_to_"))
+
+def _upload_record(log_entry: Dict[str, Any]) -> Dict[str, Any]:
+    """The upload history fields of a completed upload record"""
+    return {
+        "platform": log_entry.get("platform"),
+        "video_id": log_entry.get("video_id"),
+        "timestamp": log_entry.get("timestamp"),
+        "duration_sec": log_entry.get("duration_sec")
+    }
+
+@functools.lru_cache(maxsize=256)
+def _qc_summary(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    The issues and score of a QC report (shared between callers; treat as read-only)
+    
+    Cached on (path, mtime, size) like load_json_file_cached, but only these
+    fields are kept, not the whole report.
+    """
+    report = load_json_file(path)
+    return {
+        "issues": report.get("issues", []),
+        "score": report.get("score", 0)
+    }
+
 class ContentManager:
     """Strategic content planning and performance analysis module"""
     
     def __init__(self):
         create_directory_if_not_exists(config.performance_data_dir)
         self.performance_data = self._load_performance_data()
+        # Column order of the stored table; appended rows must follow it
+        self._columns = list(self.performance_data.columns) or list(_PERFORMANCE_COLUMNS)
+        # Rows already persisted but not yet merged into performance_data
+        self._pending_rows: List[Dict[str, Any]] = []
         self.schedule = self._load_schedule()
         logger.info("Content Manager initialized")
         
     def _load_performance_data(self) -> pd.DataFrame:
-        """Load historical performance data"""
+        """
+        Load historical performance data
+        
+        With pyarrow installed the data lives in Parquet partitions under
+        config.performance_parquet_dir (an existing CSV is migrated once);
+        otherwise the CSV is used.
+        """
         try:
+            if pyarrow is None:
+                if config.performance_csv.exists():
+                    return _read_performance_csv(config.performance_csv)
+                return pd.DataFrame(columns=_PERFORMANCE_COLUMNS)
+            
+            create_directory_if_not_exists(config.performance_parquet_dir)
             if config.performance_csv.exists():
-                return pd.read_csv(config.performance_csv)
-            return pd.DataFrame(columns=[
-                "topic", "platform", "upload_date", "views", 
-                "likes", "watch_time_percentage", "qc_issues"
-            ])
+                self._migrate_csv_to_parquet()
+            
+            partitions = sorted(config.performance_parquet_dir.glob("*.parquet"))
+            if not partitions:
+                return pd.DataFrame(columns=_PERFORMANCE_COLUMNS)
+            
+            data = pd.concat(
+                [pd.read_parquet(path, engine="pyarrow") for path in partitions],
+                ignore_index=True
+            )
+            if len(partitions) > config.max_performance_partitions:
+                self._compact_partitions(data, partitions)
+            return data
         except Exception as e:
             logger.error(f"Failed to load performance data: {str(e)}")
             return pd.DataFrame()
     
+    def _write_partition(self, data: pd.DataFrame, name: str = None) -> Path:
+        """Write rows as a new zstd-compressed Parquet partition"""
+        name = name or f"part-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+        path = config.performance_parquet_dir / f"{name}.parquet"
+        data.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        return path
+    
+    def _migrate_csv_to_parquet(self) -> None:
+        """One-shot conversion of the legacy performance CSV into the first partition"""
+        data = _read_performance_csv(config.performance_csv)
+        self._write_partition(data, name="part-00000000-000000-migrated")
+        config.performance_csv.rename(config.performance_csv.with_suffix(".csv.migrated"))
+        logger.info(f"Migrated {len(data)} performance records from CSV to Parquet")
+    
+    def _compact_partitions(self, data: pd.DataFrame, partitions: List[Path]) -> None:
+        """Merge many small partitions into one so loads stay a few file reads"""
+        self._write_partition(data)
+        for path in partitions:
+            path.unlink(missing_ok=True)
+        logger.info(f"Compacted {len(partitions)} performance data partitions")
+    
     def _load_schedule(self) -> Dict[str, Any]:
         """Load content schedule"""
         try:
-            if config.schedule_file.exists():
-                return load_json_file(config.schedule_file)
-            return {"scheduled": [], "completed": []}
+            schedule = _load_packed(config.schedule_packed, config.schedule_file)
+            return schedule or {"scheduled": [], "completed": []}
         except Exception as e:
             logger.error(f"Failed to load schedule: {str(e)}")
             return {"scheduled": [], "completed": []}
@@ -62,33 +235,43 @@ class ContentManager:
             dict: Trending topics data or None if failed
         """
         # Check cache first
-        if not force_refresh and file_exists_within_seconds(config.trending_cache, config.trending_cache_ttl):
+        cache_path = config.trending_cache_packed if msgspec is not None else config.trending_cache
+        if not force_refresh and file_exists_within_seconds(cache_path, config.trending_cache_ttl):
             try:
-                return load_json_file(config.trending_cache)
+                return _load_packed(config.trending_cache_packed, config.trending_cache)
             except Exception as e:
                 logger.warning(f"Failed to load trending cache: {str(e)}")
         
-        # Fetch from API
+        # Fetch from API over the shared keep-alive session
         try:
-            headers = {"Authorization": f"Bearer {TRENDING_API_KEY}"}
-            response = requests.get(
+            response = _trending_session.get(
                 f"{config.trending_api_url}/topics",
-                headers=headers,
                 timeout=10
             )
             response.raise_for_status()
             data = response.json()
             
             # Save to cache
-            save_json_file(data, config.trending_cache)
+            _save_packed(data, config.trending_cache_packed, config.trending_cache)
             return data
             
         except Exception as e:
             logger.error(f"Failed to fetch trending topics: {str(e)}")
             return None
     
+    def _merge_pending_rows(self) -> None:
+        """Fold rows appended since the last analysis into performance_data in one concat"""
+        if not self._pending_rows:
+            return
+        self.performance_data = pd.concat([
+            self.performance_data,
+            pd.DataFrame(self._pending_rows)
+        ], ignore_index=True)
+        self._pending_rows.clear()
+    
     def _analyze_performance(self) -> Dict[str, Any]:
         """Analyze performance data to identify successful patterns"""
+        self._merge_pending_rows()
         if self.performance_data.empty:
             return {}
             
@@ -99,12 +282,20 @@ class ContentManager:
         }
         
         try:
-            # Calculate success metric (simplified)
-            self.performance_data["success_score"] = (
-                self.performance_data["views"] / self.performance_data["views"].max() +
-                self.performance_data["likes"] / self.performance_data["likes"].max() +
-                self.performance_data["watch_time_percentage"]
-            ) / 3
+            # Calculate success metric (simplified): mean of normalized views,
+            # normalized likes and watch time, accumulated in one float64 buffer
+            views = self.performance_data["views"].to_numpy(dtype=np.float64)
+            likes = self.performance_data["likes"].to_numpy(dtype=np.float64)
+            watch = self.performance_data["watch_time_percentage"].to_numpy(dtype=np.float64)
+            
+            score = np.empty_like(views)
+            tmp = np.empty_like(views)
+            np.divide(views, views.max() or 1.0, out=score)
+            np.divide(likes, likes.max() or 1.0, out=tmp)
+            score += tmp
+            score += watch
+            score /= 3
+            self.performance_data["success_score"] = score
             
             # Get top performing topics
             top_topics = self.performance_data.sort_values(
@@ -162,7 +353,7 @@ Consider our audience prefers content with:
 - Best posted on {', '.join(analysis.get('success_patterns', {}).get('best_upload_days', ['weekdays']))}
 """
         
-        logger.debug(f"LLM prompt for topic generation:\n{prompt}")
+        logger.debug("LLM prompt for topic generation:\n%s", prompt)
         
         # Simulated LLM response
         suggestions = [
@@ -173,6 +364,16 @@ Consider our audience prefers content with:
         
         return suggestions[:num_suggestions]
     
+    def _load_qc_summary(self, qc_file: Path) -> Optional[tuple]:
+        """Load one QC report as (video_id, summary), or None if it can't be parsed"""
+        try:
+            stat = qc_file.stat()
+            video_id = qc_file.stem.replace("_qc_report", "")
+            return video_id, _qc_summary(str(qc_file), stat.st_mtime_ns, stat.st_size)
+        except Exception as e:
+            logger.warning(f"Failed to parse QC report {qc_file}: {str(e)}")
+            return None
+    
     def load_past_upload_data(
         self,
         log_filepath: Path = None,
@@ -192,34 +393,38 @@ Consider our audience prefers content with:
         qc_report_dir = qc_report_dir or config.qc_report_dir
         
         try:
-            # Parse upload logs (simplified example)
+            # Parse upload logs (simplified example). With LOG_BINARY_OPERATIONS
+            # the upload records go to .nlog files instead of the text log
             upload_data = []
-            with open(log_filepath, 'r') as f:
-                for line in f:
-                    if '"operation": "upload_to_' in line and '"status": "completed"' in line:
-                        try:
-                            log_entry = json.loads(line.split('|')[-1])
-                            upload_data.append({
-                                "platform": log_entry.get("platform"),
-                                "video_id": log_entry.get("video_id"),
-                                "timestamp": log_entry.get("timestamp"),
-                                "duration_sec": log_entry.get("duration_sec")
-                            })
-                        except json.JSONDecodeError:
-                            continue
-            
-            # Parse QC reports (simplified example)
+            nlog_paths = sorted(log_filepath.parent.glob(f"{log_filepath.stem}*.nlog"))
+            if log_filepath.exists() or not nlog_paths:
+                with open(log_filepath, 'rb', buffering=1 << 20) as f:
+                    for line in f:
+                        # Cheap byte-level filter before any decoding or parsing
+                        if _UPLOAD_OP_MARK in line and _COMPLETED_MARK in line:
+                            try:
+                                log_entry = _json_loads(line.rpartition(b'|')[2])
+                            except json.JSONDecodeError:  # orjson's error subclasses it
+                                continue
+                            if _is_completed_upload(log_entry):
+                                upload_data.append(_upload_record(log_entry))
+            for nlog_path in nlog_paths:
+                records, _ = read_records(nlog_path)
+                for log_entry in records:
+                    if _is_completed_upload(log_entry):
+                        log_entry.setdefault(
+                            "timestamp", datetime.fromtimestamp(log_entry["created"]).isoformat()
+                        )
+                        upload_data.append(_upload_record(log_entry))
+            
+            # Parse QC reports (simplified example); reads overlap across threads
+            qc_files = list(qc_report_dir.glob("*.json"))
             qc_data = {}
-            for qc_file in qc_report_dir.glob("*.json"):
-                try:
-                    report = load_json_file(qc_file)
-                    video_id = qc_file.stem.replace("_qc_report", "")
-                    qc_data[video_id] = {
-                        "issues": report.get("issues", []),
-                        "score": report.get("score", 0)
-                    }
-                except Exception as e:
-                    logger.warning(f"Failed to parse QC report {qc_file}: {str(e)}")
+            if qc_files:
+                with ThreadPoolExecutor(max_workers=min(32, len(qc_files))) as executor:
+                    for entry in executor.map(self._load_qc_summary, qc_files):
+                        if entry:
+                            qc_data[entry[0]] = entry[1]
             
             # TODO: In production, would merge with existing performance data
             logger.info(f"Loaded {len(upload_data)} upload records and {len(qc_data)} QC reports")
@@ -337,7 +542,7 @@ Consider our audience prefers content with:
             self.schedule["scheduled"].append(entry)
             
             # Save schedule
-            save_json_file(self.schedule, config.schedule_file)
+            _save_packed(self.schedule, config.schedule_packed, config.schedule_file)
             
             duration = time.time() - start_time
             log_operation(logger, "schedule_new_upload", "completed", {
@@ -385,14 +590,23 @@ Consider our audience prefers content with:
                 "qc_issues": []
             }
             
-            # Append to performance data
-            self.performance_data = pd.concat([
-                self.performance_data,
-                pd.DataFrame([new_data])
-            ], ignore_index=True)
-            
-            # Save to CSV
-            self.performance_data.to_csv(config.performance_csv, index=False)
+            # Persist only the new rows (a new Parquet partition, or a CSV append);
+            # the in-memory frame is extended lazily the next time performance is analyzed
+            new_rows = [new_data]
+            new_frame = pd.DataFrame(new_rows).reindex(columns=self._columns)
+            if pyarrow is not None:
+                # Store list values as JSON text so every partition has the same schema
+                if "qc_issues" in new_frame:
+                    new_frame["qc_issues"] = new_frame["qc_issues"].map(json.dumps)
+                self._write_partition(new_frame)
+            else:
+                new_frame.to_csv(
+                    config.performance_csv,
+                    mode='a',
+                    header=not config.performance_csv.exists(),
+                    index=False
+                )
+            self._pending_rows.extend(new_rows)
             
             duration = time.time() - start_time
             log_operation(logger, "update_performance_metrics", "completed", {
@@ -1,33 +1,74 @@
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any
-from src.utils.file_utils import load_json_file
+from typing import Dict, Any, Tuple
+from src.utils.main_config import get_main_config
 
 # Load main configuration
-_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
-_main_config = load_json_file(_CONFIG_PATH)
+_main_config = get_main_config()
+_ingestion_settings = _main_config["module_specific"]["ingestion_engine"]
 
+@dataclass(frozen=True, slots=True)
 class IngestionConfig:
-    """Configuration for the Ingestion Engine module"""
-    
-    def __init__(self):
-        # Paths from main config
-        self.base_data_path = Path(_main_config["base_settings"]["base_data_path"])
-        self.input_dir = self.base_data_path / "input"
-        self.output_dir = self.base_data_path / _main_config["paths"]["ingestion_output_dir"]
-        self.temp_dir = self.base_data_path / _main_config["paths"]["temp_dir"]
-        
-        # Module-specific settings
-        self.max_file_size_mb = _main_config["module_specific"]["ingestion_engine"]["max_file_size_mb"]
-        self.timeout_seconds = _main_config["module_specific"]["ingestion_engine"]["timeout_seconds"]
-        
-        # OCR settings
-        self.ocr_language = "eng"  # Default language for pytesseract
-        self.ocr_config = "--psm 6"  # Page segmentation mode
-        
-        # HTML scraping settings
-        self.valid_content_tags = ["article", "section", "div"]
-        self.min_content_length = 500  # Minimum chars to consider valid content
+    """
+    Configuration for the Ingestion Engine module
+
+    Frozen so derived values (paths, byte limits) are computed once in
+    __post_init__; use dataclasses.replace() to get a variant.
+    """
+
+    # Paths from main config
+    base_data_path: Path = Path(_main_config["base_settings"]["base_data_path"])
+    ingestion_output_dir: str = _main_config["paths"]["ingestion_output_dir"]
+    temp_dir_name: str = _main_config["paths"]["temp_dir"]
+
+    # Module-specific settings
+    max_file_size_mb: int = _ingestion_settings["max_file_size_mb"]
+    timeout_seconds: int = _ingestion_settings["timeout_seconds"]
+
+    # PDF extraction: documents with at least pdf_parallel_min_pages pages
+    # are extracted in batches of pdf_pages_per_task across worker processes
+    pdf_workers: int = min(os.cpu_count() or 1, 4)
+    pdf_pages_per_task: int = 10
+    pdf_parallel_min_pages: int = 20
+
+    # OCR settings
+    ocr_language: str = "eng"  # Default language for pytesseract
+    ocr_psm: int = 6  # Page segmentation mode: single uniform block of text
+    ocr_workers: int = os.cpu_count() or 1  # Threads used by read_images_batch
+    ocr_list_batch_size: int = 50  # Images per tesseract call in read_images_list
+
+    # OCR preprocessing (requires opencv-python): adaptive threshold
+    # neighbourhood size (odd, in pixels) and the constant subtracted from it
+    ocr_preprocess: bool = True
+    ocr_threshold_block_size: int = 31
+    ocr_threshold_offset: int = 10
+
+    # HTML scraping settings
+    http_pool_connections: int = 16
+    http_pool_maxsize: int = 32
+    http_retries: int = 3
+    valid_content_tags: Tuple[str, ...] = ("article", "section", "div")
+    min_content_length: int = 500  # Minimum chars to consider valid content
+
+    # Derived in __post_init__
+    input_dir: Path = field(init=False)
+    output_dir: Path = field(init=False)
+    temp_dir: Path = field(init=False)
+    max_file_size_bytes: int = field(init=False)
+    ocr_config: str = field(init=False)
+
+    def __post_init__(self):
+        temp_dir = self.base_data_path / self.temp_dir_name
+        derived = {
+            "input_dir": self.base_data_path / "input",
+            "output_dir": self.base_data_path / self.ingestion_output_dir,
+            "temp_dir": temp_dir,
+            "max_file_size_bytes": self.max_file_size_mb * 1024 * 1024,
+            "ocr_config": f"--psm {self.ocr_psm}"
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
 
 # Singleton config instance
 config = IngestionConfig()
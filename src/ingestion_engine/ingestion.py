@@ -1,36 +1,306 @@
 import os
 import time
+import asyncio
+import functools
+import importlib
+import importlib.util
 import json
+import shlex
+import subprocess
+import tempfile
+import threading
+import weakref
+import multiprocessing
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Dict, Any
-import PyPDF2
-from PIL import Image
-import pytesseract
-from bs4 import BeautifulSoup
+from typing import Optional, Dict, Any, List, Union, Callable, TYPE_CHECKING
 
 from src.utils.logging_utils import setup_logging, log_operation
 from src.utils.file_utils import (
     create_directory_if_not_exists,
-    get_file_size,
     save_text_file,
     save_json_file,
     clean_filename
 )
 from .config import config
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 # Initialize logging
 logger = setup_logging("ingestion_engine")
 
+# BeautifulSoup backend: lxml's C parser when installed
+HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Source type auto-detection
+_PDF_EXTS = ('.pdf',)
+_IMG_EXTS = ('.png', '.jpg', '.jpeg', '.webp', '.tif', '.tiff')
+_HTML_EXTS = ('.html', '.htm')
+_URL_PREFIXES = ('http://', 'https://')
+
+# Read size for streamed HTTP downloads
+HTTP_CHUNK_SIZE = 64 * 1024
+
+# Formats tesseract (leptonica) decodes itself, so they can be passed by path
+TESSERACT_NATIVE_FORMATS = ('.png', '.jpg', '.jpeg', '.tif', '.tiff', '.bmp')
+
+# Tesseract's internal OpenMP threading scales poorly; throughput is better
+# with single-threaded tesseract calls running side by side. Applied only to
+# tesseract itself, never to this process's environment.
+TESSERACT_OMP_THREAD_LIMIT = "1"
+
+@functools.lru_cache(maxsize=None)
+def _optional_module(name: str):
+    """
+    Import a module on first use, returning None if it isn't installed.
+    
+    The extraction backends (PDF, OCR, HTML) are heavy to import, so each
+    is loaded only when a source of that kind is actually processed.
+    Optional accelerators: fitz (PyMuPDF), cv2 (OpenCV), tesserocr, aiohttp.
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _load_tesserocr():
+    """
+    Import tesserocr (None if not installed) with tesseract's OpenMP threads limited.
+    
+    OpenMP reads OMP_THREAD_LIMIT once, when its runtime is loaded along
+    with the tesseract library, so the variable is set only for the import
+    and restored afterwards.
+    """
+    previous = os.environ.get("OMP_THREAD_LIMIT")
+    if previous is None:
+        os.environ["OMP_THREAD_LIMIT"] = TESSERACT_OMP_THREAD_LIMIT
+    try:
+        return _optional_module("tesserocr")
+    finally:
+        if previous is None:
+            os.environ.pop("OMP_THREAD_LIMIT", None)
+
+def _run_tesseract(input_path: str) -> str:
+    """
+    Run the tesseract CLI on an image (or a list file of image paths).
+    
+    Like pytesseract, but the child process gets OMP_THREAD_LIMIT in its own
+    environment.
+    
+    Args:
+        input_path: Image file, or text file listing one image path per line
+        
+    Returns:
+        Recognized text (form-feed-separated pages for a list file)
+    """
+    import pytesseract
+    env = dict(os.environ)
+    env.setdefault("OMP_THREAD_LIMIT", TESSERACT_OMP_THREAD_LIMIT)
+    result = subprocess.run(
+        [pytesseract.pytesseract.tesseract_cmd, input_path, "stdout",
+         "-l", config.ocr_language, *shlex.split(config.ocr_config)],
+        capture_output=True,
+        env=env,
+        check=True
+    )
+    return result.stdout.decode("utf-8")
+
+def _checked_file_size(path: str, kind: str) -> int:
+    """
+    Stat a source file once, checking that it exists and is within the size limit.
+    
+    Args:
+        path: Path to the file
+        kind: Label used in error messages (e.g. "PDF")
+        
+    Returns:
+        File size in bytes
+    """
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{kind} file not found: {path}") from None
+    if size > config.max_file_size_bytes:
+        raise ValueError(f"{kind} exceeds maximum size of {config.max_file_size_mb}MB")
+    return size
+
+def _decode_capped(chunks, encoding: Optional[str]) -> str:
+    """
+    Join downloaded body chunks, enforcing config.max_file_size_mb.
+    
+    Args:
+        chunks: Iterable of bytes chunks
+        encoding: Declared charset of the response, if any
+        
+    Returns:
+        The decoded body
+    """
+    limit = config.max_file_size_bytes
+    parts = []
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+        if total > limit:
+            raise ValueError(f"HTML exceeds maximum size of {config.max_file_size_mb}MB")
+        parts.append(chunk)
+    return b"".join(parts).decode(encoding or "utf-8", errors="replace")
+
+async def _capped_chunks_async(chunks):
+    """Async counterpart of the size check in _decode_capped, stopping the download early"""
+    limit = config.max_file_size_bytes
+    total = 0
+    async for chunk in chunks:
+        total += len(chunk)
+        if total > limit:
+            raise ValueError(f"HTML exceeds maximum size of {config.max_file_size_mb}MB")
+        yield chunk
+
+def _pdf_page_count(pdf_path: str) -> int:
+    """Return the number of pages in a PDF"""
+    fitz = _optional_module("fitz")
+    if fitz is not None:
+        with fitz.open(pdf_path) as doc:
+            return doc.page_count
+    import PyPDF2
+    return len(PyPDF2.PdfReader(pdf_path).pages)
+
+def _extract_pdf_pages(pdf_path: str, start: int, stop: int) -> str:
+    """Extract the text of pages [start, stop) from a PDF (runs in a worker process)"""
+    fitz = _optional_module("fitz")
+    if fitz is not None:
+        with fitz.open(pdf_path) as doc:
+            return "\n".join(doc[i].get_text() for i in range(start, stop))
+    import PyPDF2
+    reader = PyPDF2.PdfReader(pdf_path)
+    # extract_text() can return None for image-only pages
+    return "\n".join(reader.pages[i].extract_text() or "" for i in range(start, stop))
+
+def _load_ocr_image(image_path: str) -> Union["Image.Image", str]:
+    """
+    Load an image for OCR.
+    
+    With OpenCV available (and config.ocr_preprocess set) the image is
+    converted to grayscale and binarized with an adaptive threshold, which
+    both improves accuracy and shortens tesseract's segmentation pass.
+    Otherwise formats tesseract reads natively are returned as the path
+    itself, skipping a PIL decode (and pytesseract's temp file re-encode);
+    anything else is opened with PIL.
+    """
+    from PIL import Image
+    
+    cv2 = _optional_module("cv2") if config.ocr_preprocess else None
+    if cv2 is not None:
+        arr = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if arr is not None:
+            arr = cv2.adaptiveThreshold(
+                arr, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+                config.ocr_threshold_block_size, config.ocr_threshold_offset
+            )
+            return Image.fromarray(arr)
+    if image_path.lower().endswith(TESSERACT_NATIVE_FORMATS):
+        return image_path
+    return Image.open(image_path)
+
+@functools.lru_cache(maxsize=1)
+def _content_strainer():
+    """SoupStrainer so only candidate content tags are built into the tree while parsing"""
+    from bs4 import SoupStrainer
+    return SoupStrainer(config.valid_content_tags)
+
+def _main_content_lxml(html_content: str) -> str:
+    """
+    Main-content heuristic on an lxml.html tree.
+    
+    The first element of the highest-priority tag in config.valid_content_tags
+    whose text reaches config.min_content_length wins; otherwise the whole
+    document's text is used. One C-level parse serves both the per-tag XPath
+    lookups and the fallback.
+    """
+    from lxml import html as lxml_html
+    
+    if not html_content.strip():
+        return ""
+    tree = lxml_html.fromstring(html_content)
+    for tag in config.valid_content_tags:
+        for el in tree.xpath(f"//{tag}"):
+            text = "".join(el.itertext()).strip()
+            if len(text) >= config.min_content_length:
+                return text
+    return "".join(tree.itertext()).strip()
+
+def _main_content_soup(html_content: str) -> str:
+    """BeautifulSoup implementation of the main-content heuristic (see _main_content_lxml)"""
+    from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_content_strainer())
+    for tag in config.valid_content_tags:
+        for el in soup.find_all(tag):
+            text = el.get_text().strip()
+            if len(text) >= config.min_content_length:
+                return text
+    
+    # Fallback to body if no content found (needs the full tree)
+    return BeautifulSoup(html_content, HTML_PARSER).get_text().strip()
+
 class IngestionEngine:
-    """Core engine for ingesting content from various sources"""
+    """
+    Core engine for ingesting content from various sources.
+    
+    The engine is a per-process singleton: constructing it again returns the
+    existing instance, so directory setup, the HTTP session, the cache index
+    and OCR handles are created once.
+    """
+    
+    _instance: Optional["IngestionEngine"] = None
+    _instance_lock = threading.Lock()
+    _initialized = False
+    
+    def __new__(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
     
     def __init__(self):
+        if self._initialized:
+            return
+        self._initialized = True
+        
         # Ensure directories exist
         create_directory_if_not_exists(config.input_dir)
         create_directory_if_not_exists(config.output_dir)
         create_directory_if_not_exists(config.temp_dir)
         
+        # Long-lived tesseract handles (tesserocr only), one per OCR thread,
+        # created when an OCR pool thread starts (or on a caller thread's
+        # first OCR call). The pool is created on first batch and reused, so
+        # the number of handles stays bounded by config.ocr_workers.
+        self._ocr_local = threading.local()
+        self._ocr_apis = []
+        self._ocr_lock = threading.Lock()
+        self._ocr_executor = None
+        
+        # Pooled keep-alive session for scrape_html, with retries on
+        # transient failures (requests already negotiates gzip/deflate)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=config.http_pool_connections,
+            pool_maxsize=config.http_pool_maxsize,
+            max_retries=Retry(total=config.http_retries, backoff_factor=0.2,
+                              status_forcelist=(502, 503, 504))
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        
+        # aiohttp sessions for scrape_html_async, one per event loop (a session
+        # is bound to the loop it was created on, and each asyncio.run is a new loop)
+        self._aiohttp_sessions = weakref.WeakKeyDictionary()
+        
         logger.info("Ingestion Engine initialized with config:")
         logger.info(f"Input directory: {config.input_dir}")
         logger.info(f"Output directory: {config.output_dir}")
@@ -48,31 +318,23 @@ class IngestionEngine:
         log_operation(logger, "read_pdf", "started", {"file": pdf_path})
         
         try:
-            if not os.path.exists(pdf_path):
-                raise FileNotFoundError(f"PDF file not found: {pdf_path}")
-                
-            file_size = get_file_size(pdf_path)
-            if file_size and file_size > config.max_file_size_mb * 1024 * 1024:
-                raise ValueError(f"PDF exceeds maximum size of {config.max_file_size_mb}MB")
+            file_size = _checked_file_size(pdf_path, "PDF")
             
-            text = ""
-            with open(pdf_path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-                for page in reader.pages:
-                    text += page.extract_text() + "\n"
+            page_count = _pdf_page_count(pdf_path)
+            text = self._extract_pdf_text(pdf_path, page_count)
             
             result = {
                 "content": text.strip(),
                 "metadata": {
                     "source": pdf_path,
-                    "pages": len(reader.pages),
+                    "pages": page_count,
                     "size_bytes": file_size,
                     "source_type": "pdf"
                 }
             }
             
             log_operation(logger, "read_pdf", "completed", 
-                         {"file": pdf_path, "pages": len(reader.pages), "chars": len(text)})
+                         {"file": pdf_path, "pages": page_count, "chars": len(text)})
             return result
             
         except Exception as e:
@@ -80,6 +342,39 @@ class IngestionEngine:
                          {"file": pdf_path, "error": str(e)}, level="ERROR")
             return None
 
+    def _extract_pdf_text(self, pdf_path: str, page_count: int) -> str:
+        """
+        Extract the text of all pages, in page order.
+        
+        Large documents are split into batches of config.pdf_pages_per_task
+        pages that are extracted in parallel worker processes (PyPDF2 is pure
+        Python, so threads would serialize on the GIL). Inside a worker process
+        (main's PDF pool, process_sources_batch) the document is extracted
+        serially: the outer pool already spreads work across the cores, and a
+        nested spawn pool per document would oversubscribe them.
+        
+        Args:
+            pdf_path: Path to PDF file
+            page_count: Number of pages in the document
+            
+        Returns:
+            Text of all pages joined by newlines
+        """
+        batch = config.pdf_pages_per_task
+        workers = min(config.pdf_workers, -(-page_count // batch))
+        in_worker = multiprocessing.parent_process() is not None
+        if page_count < config.pdf_parallel_min_pages or workers < 2 or in_worker:
+            return _extract_pdf_pages(pdf_path, 0, page_count)
+        
+        starts = range(0, page_count, batch)
+        stops = [min(start + batch, page_count) for start in starts]
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            parts = list(executor.map(_extract_pdf_pages, [pdf_path] * len(starts), starts, stops))
+        return "\n".join(parts)
+
     def read_image_with_ocr(self, image_path: str) -> Optional[Dict[str, Any]]:
         """
         Extract text from an image using OCR.
@@ -93,16 +388,11 @@ class IngestionEngine:
         log_operation(logger, "read_image_with_ocr", "started", {"file": image_path})
         
         try:
-            if not os.path.exists(image_path):
-                raise FileNotFoundError(f"Image file not found: {image_path}")
-                
-            file_size = get_file_size(image_path)
-            if file_size and file_size > config.max_file_size_mb * 1024 * 1024:
-                raise ValueError(f"Image exceeds maximum size of {config.max_file_size_mb}MB")
+            file_size = _checked_file_size(image_path, "Image")
             
             # Alternative: Cloud OCR services could be used here
-            img = Image.open(image_path)
-            text = pytesseract.image_to_string(img, lang=config.ocr_language, config=config.ocr_config)
+            img = _load_ocr_image(image_path)
+            text = self._ocr_image(img)
             
             result = {
                 "content": text.strip(),
@@ -123,6 +413,159 @@ class IngestionEngine:
                          {"file": image_path, "error": str(e)}, level="ERROR")
             return None
 
+    def _ocr_image(self, img: Union["Image.Image", str]) -> str:
+        """
+        Run OCR on a loaded image or an image file path.
+        
+        With tesserocr installed each thread keeps its own PyTessBaseAPI for
+        the life of the engine, so language data is loaded once per thread;
+        otherwise a tesseract process is spawned per call.
+        """
+        tesserocr = _load_tesserocr()
+        if tesserocr is None:
+            if isinstance(img, str):
+                return _run_tesseract(img)
+            import pytesseract
+            return pytesseract.image_to_string(img, lang=config.ocr_language, config=config.ocr_config)
+        
+        api = self._thread_ocr_api(tesserocr)
+        if isinstance(img, str):
+            api.SetImageFile(img)
+        else:
+            api.SetImage(img)
+        return api.GetUTF8Text()
+
+    def _thread_ocr_api(self, tesserocr):
+        """The calling thread's PyTessBaseAPI, created on first use"""
+        api = getattr(self._ocr_local, "api", None)
+        if api is None:
+            api = tesserocr.PyTessBaseAPI(lang=config.ocr_language, psm=config.ocr_psm)
+            self._ocr_local.api = api
+            with self._ocr_lock:
+                self._ocr_apis.append(api)
+        return api
+
+    def _init_ocr_thread(self) -> None:
+        """OCR pool thread initializer: load this thread's tesseract handle up front"""
+        tesserocr = _load_tesserocr()
+        if tesserocr is not None:
+            self._thread_ocr_api(tesserocr)
+
+    def _get_ocr_executor(self) -> ThreadPoolExecutor:
+        """The engine's OCR thread pool, created on first use"""
+        with self._ocr_lock:
+            if self._ocr_executor is None:
+                self._ocr_executor = ThreadPoolExecutor(
+                    max_workers=config.ocr_workers,
+                    thread_name_prefix="ocr",
+                    initializer=self._init_ocr_thread
+                )
+            return self._ocr_executor
+
+    def read_images_batch(self, image_paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        OCR several images concurrently.
+        
+        Tesseract releases the GIL while recognizing, so a thread per core
+        scales close to linearly with tesseract limited to one OpenMP thread.
+        The thread pool (and each thread's tesseract handle) is shared by
+        all batches until close().
+        
+        Args:
+            image_paths: Paths to image files
+            
+        Returns:
+            One result per input path, in order (None for failures)
+        """
+        if len(image_paths) < 2:
+            return [self.read_image_with_ocr(path) for path in image_paths]
+        
+        return list(self._get_ocr_executor().map(self.read_image_with_ocr, image_paths))
+
+    def read_images_list(self, image_paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        OCR several images with one tesseract invocation per batch.
+        
+        Tesseract accepts a text file listing image paths and emits one
+        form-feed-separated page per image, so process startup and language
+        data loading are paid once per batch of config.ocr_list_batch_size
+        images instead of once per image. Images are read as-is (no OpenCV
+        preprocessing); a batch whose output can't be mapped back to its
+        inputs is retried image by image.
+        
+        Args:
+            image_paths: Paths to image files
+            
+        Returns:
+            One result per input path, in order (None for failures)
+        """
+        log_operation(logger, "read_images_list", "started", {"images": len(image_paths)})
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(image_paths)
+        sizes = {}
+        for i, path in enumerate(image_paths):
+            try:
+                sizes[i] = _checked_file_size(path, "Image")
+            except (OSError, ValueError) as e:
+                log_operation(logger, "read_images_list", "skipped",
+                             {"file": path, "error": str(e)}, level="WARNING")
+        
+        indices = list(sizes)
+        batch_size = config.ocr_list_batch_size
+        for start in range(0, len(indices), batch_size):
+            batch = indices[start:start + batch_size]
+            try:
+                with tempfile.NamedTemporaryFile(
+                    "w", suffix=".txt", dir=config.temp_dir, delete=False, encoding="utf-8"
+                ) as list_file:
+                    list_file.write("\n".join(os.path.abspath(image_paths[i]) for i in batch))
+                try:
+                    output = _run_tesseract(list_file.name)
+                finally:
+                    os.unlink(list_file.name)
+                pages = output.split("\f")
+                if len(pages) < len(batch):
+                    raise ValueError(f"expected {len(batch)} pages, got {len(pages)}")
+            except Exception as e:
+                log_operation(logger, "read_images_list", "batch_fallback",
+                             {"images": len(batch), "error": str(e)}, level="WARNING")
+                for i in batch:
+                    results[i] = self.read_image_with_ocr(image_paths[i])
+                continue
+            
+            for i, text in zip(batch, pages):
+                results[i] = {
+                    "content": text.strip(),
+                    "metadata": {
+                        "source": image_paths[i],
+                        "size_bytes": sizes[i],
+                        "source_type": "image",
+                        "ocr_language": config.ocr_language
+                    }
+                }
+        
+        log_operation(logger, "read_images_list", "completed",
+                     {"images": len(image_paths), "succeeded": sum(r is not None for r in results)})
+        return results
+
+    def close(self) -> None:
+        """Stop the OCR thread pool and release any tesseract handles that were created"""
+        with self._ocr_lock:
+            executor, self._ocr_executor = self._ocr_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._ocr_lock:
+            apis, self._ocr_apis = self._ocr_apis, []
+        for api in apis:
+            api.End()
+        self._ocr_local = threading.local()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def scrape_html(self, url_or_filepath: str) -> Optional[Dict[str, Any]]:
         """
         Extract main content from a webpage or local HTML file.
@@ -137,48 +580,26 @@ class IngestionEngine:
         
         try:
             # Determine if source is URL or file
-            is_url = url_or_filepath.startswith(('http://', 'https://'))
+            is_url = url_or_filepath.startswith(_URL_PREFIXES)
             
             if is_url:
-                response = requests.get(url_or_filepath, timeout=config.timeout_seconds)
-                response.raise_for_status()
-                html_content = response.text
+                with self._http.get(url_or_filepath, timeout=config.timeout_seconds,
+                                    stream=True) as response:
+                    response.raise_for_status()
+                    html_content = _decode_capped(
+                        response.iter_content(HTTP_CHUNK_SIZE), response.encoding
+                    )
             else:
-                if not os.path.exists(url_or_filepath):
-                    raise FileNotFoundError(f"HTML file not found: {url_or_filepath}")
-                with open(url_or_filepath, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-            
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Find main content - heuristic approach
-            main_content = None
-            for tag in config.valid_content_tags:
-                elements = soup.find_all(tag)
-                for el in elements:
-                    text = el.get_text().strip()
-                    if len(text) >= config.min_content_length:
-                        main_content = text
-                        break
-                if main_content:
-                    break
-            
-            # Fallback to body if no content found
-            if not main_content:
-                main_content = soup.get_text().strip()
+                try:
+                    with open(url_or_filepath, 'r', encoding='utf-8') as f:
+                        html_content = f.read()
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"HTML file not found: {url_or_filepath}") from None
             
-            result = {
-                "content": main_content,
-                "metadata": {
-                    "source": url_or_filepath,
-                    "source_type": "html",
-                    "is_url": is_url,
-                    "content_heuristic": "found" if main_content else "fallback"
-                }
-            }
+            result = self._build_html_result(html_content, url_or_filepath, is_url)
             
             log_operation(logger, "scrape_html", "completed", 
-                         {"source": url_or_filepath, "chars": len(main_content)})
+                         {"source": url_or_filepath, "chars": len(result["content"])})
             return result
             
         except Exception as e:
@@ -186,62 +607,255 @@ class IngestionEngine:
                          {"source": url_or_filepath, "error": str(e)}, level="ERROR")
             return None
 
-    def process_source(self, source_path_or_url: str, source_type: str = None) -> Optional[Dict[str, Any]]:
+    async def scrape_html_async(self, url_or_filepath: str) -> Optional[Dict[str, Any]]:
         """
-        Main method to process a source based on its type.
+        Async variant of scrape_html for concurrent multi-URL crawls.
+        
+        URLs are fetched with the running loop's aiohttp session (or requests
+        in a worker thread when aiohttp isn't installed), and the CPU-bound
+        BeautifulSoup parse runs in a worker thread so the event loop stays
+        free for other fetches.
         
         Args:
-            source_path_or_url: Path or URL to the source
-            source_type: One of 'pdf', 'image', 'html' (auto-detected if None)
+            url_or_filepath: URL or path to HTML file
             
         Returns:
-            Dictionary with content and metadata, or None if failed
+            Dictionary with 'content' (text) and metadata, or None if failed
         """
-        start_time = time.time()
+        is_url = url_or_filepath.startswith(_URL_PREFIXES)
+        aiohttp = _optional_module("aiohttp")
+        if not is_url or aiohttp is None:
+            return await asyncio.to_thread(self.scrape_html, url_or_filepath)
+        
+        log_operation(logger, "scrape_html", "started", {"source": url_or_filepath})
         
-        # Auto-detect source type if not specified
+        try:
+            async with self._get_aiohttp_session(aiohttp).get(url_or_filepath) as response:
+                response.raise_for_status()
+                chunks = [chunk async for chunk in _capped_chunks_async(
+                    response.content.iter_chunked(HTTP_CHUNK_SIZE)
+                )]
+                html_content = _decode_capped(chunks, response.charset)
+            
+            result = await asyncio.to_thread(
+                self._build_html_result, html_content, url_or_filepath, is_url
+            )
+            
+            log_operation(logger, "scrape_html", "completed", 
+                         {"source": url_or_filepath, "chars": len(result["content"])})
+            return result
+            
+        except Exception as e:
+            log_operation(logger, "scrape_html", "failed", 
+                         {"source": url_or_filepath, "error": str(e)}, level="ERROR")
+            return None
+
+    def _build_html_result(self, html_content: str, source: str, is_url: bool) -> Dict[str, Any]:
+        """Parse HTML and pick its main content with the tag-priority heuristic"""
+        main_content = None
+        if HTML_PARSER == "lxml":
+            try:
+                main_content = _main_content_lxml(html_content)
+            except ValueError as e:
+                # e.g. str input carrying an XML encoding declaration
+                logger.debug(f"lxml could not parse {source}, using BeautifulSoup: {str(e)}")
+        if main_content is None:
+            main_content = _main_content_soup(html_content)
+        
+        return {
+            "content": main_content,
+            "metadata": {
+                "source": source,
+                "source_type": "html",
+                "is_url": is_url,
+                "content_heuristic": "found" if main_content else "fallback"
+            }
+        }
+
+    def _get_aiohttp_session(self, aiohttp):
+        """The running event loop's aiohttp session, created on first use"""
+        loop = asyncio.get_running_loop()
+        session = self._aiohttp_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=config.timeout_seconds)
+            )
+            self._aiohttp_sessions[loop] = session
+        return session
+
+    async def aclose(self) -> None:
+        """Close the running loop's aiohttp session, if any; call before the loop shuts down"""
+        session = self._aiohttp_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    def _resolve_source_type(self, source_path_or_url: str, source_type: Optional[str]) -> Optional[str]:
+        """Auto-detect the source type if not given; None (logged) if unknown or unsupported"""
         if not source_type:
-            if source_path_or_url.lower().endswith('.pdf'):
+            lowered = source_path_or_url.lower()
+            if lowered.endswith(_PDF_EXTS):
                 source_type = 'pdf'
-            elif source_path_or_url.lower().split('?')[0].endswith(('.png', '.jpg', '.jpeg')):
+            elif lowered.split('?', 1)[0].endswith(_IMG_EXTS):
                 source_type = 'image'
-            elif source_path_or_url.startswith(('http://', 'https://')):
+            elif source_path_or_url.startswith(_URL_PREFIXES):
                 source_type = 'html'
             else:
-                source_type = 'html' if source_path_or_url.lower().endswith('.html') else None
+                source_type = 'html' if lowered.endswith(_HTML_EXTS) else None
                 
         if not source_type:
             logger.error(f"Could not determine source type for: {source_path_or_url}")
             return None
-            
-        logger.info(f"Processing {source_type} source: {source_path_or_url}")
+        if source_type not in self._PROCESSORS:
+            logger.error(f"Unsupported source type: {source_type}")
+            return None
+        return source_type
+
+    def _save_result(self, result: Dict[str, Any], source_path_or_url: str, start_time: float) -> None:
+        """Write a processed source to the output directory and record where it went"""
+        output_filename = clean_filename(Path(source_path_or_url).stem)
+        output_path = config.output_dir / f"{output_filename}.json"
         
-        # Dispatch to appropriate reader
-        processor = {
-            'pdf': self.read_pdf,
-            'image': self.read_image_with_ocr,
-            'html': self.scrape_html
-        }.get(source_type)
+        if save_json_file(result, output_path):
+            logger.info(f"Saved processed content to: {output_path}")
+            result['metadata']['output_path'] = str(output_path)
+        else:
+            logger.warning(f"Failed to save output for: {source_path_or_url}")
         
-        if not processor:
-            logger.error(f"Unsupported source type: {source_type}")
+        # Log performance
+        duration = time.time() - start_time
+        logger.info(f"Processing completed in {duration:.2f} seconds")
+
+    def process_source(self, source_path_or_url: str, source_type: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Main method to process a source based on its type.
+        
+        Args:
+            source_path_or_url: Path or URL to the source
+            source_type: One of 'pdf', 'image', 'html' (auto-detected if None)
+            
+        Returns:
+            Dictionary with content and metadata, or None if failed
+        """
+        start_time = time.time()
+        source_type = self._resolve_source_type(source_path_or_url, source_type)
+        if not source_type:
             return None
             
-        result = processor(source_path_or_url)
+        logger.info(f"Processing {source_type} source: {source_path_or_url}")
+        
+        # Dispatch to appropriate reader
+        result = self._PROCESSORS[source_type](self, source_path_or_url)
         
         # Save results if successful
         if result:
-            output_filename = clean_filename(Path(source_path_or_url).stem)
-            output_path = config.output_dir / f"{output_filename}.json"
-            
-            if save_json_file(result, output_path):
-                logger.info(f"Saved processed content to: {output_path}")
-                result['metadata']['output_path'] = str(output_path)
-            else:
-                logger.warning(f"Failed to save output for: {source_path_or_url}")
+            self._save_result(result, source_path_or_url, start_time)
             
-            # Log performance
-            duration = time.time() - start_time
-            logger.info(f"Processing completed in {duration:.2f} seconds")
+        return result
+
+    async def process_source_async(self, source_path_or_url: str, source_type: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Async variant of process_source for use on an event loop.
+        
+        Web pages are fetched with scrape_html_async, so the download doesn't
+        tie up a worker thread; every other source runs process_source in a
+        worker thread.
+        
+        Args:
+            source_path_or_url: Path or URL to the source
+            source_type: One of 'pdf', 'image', 'html' (auto-detected if None)
             
+        Returns:
+            Dictionary with content and metadata, or None if failed
+        """
+        start_time = time.time()
+        source_type = self._resolve_source_type(source_path_or_url, source_type)
+        if source_type != 'html' or not source_path_or_url.startswith(_URL_PREFIXES):
+            if not source_type:
+                return None
+            return await asyncio.to_thread(self.process_source, source_path_or_url, source_type)
+        
+        logger.info(f"Processing {source_type} source: {source_path_or_url}")
+        result = await self.scrape_html_async(source_path_or_url)
+        if result:
+            await asyncio.to_thread(self._save_result, result, source_path_or_url, start_time)
         return result
+
+    # Reader per source type (plain functions; called with the engine as self)
+    _PROCESSORS = {
+        'pdf': read_pdf,
+        'image': read_image_with_ocr,
+        'html': scrape_html
+    }
+
+def process_sources_batch(
+    sources: List[str],
+    workers: Optional[int] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Process many sources in parallel worker processes.
+    
+    Each worker builds one IngestionEngine and reuses it for every source it
+    is handed (see process_source_in_worker).
+    
+    Args:
+        sources: Paths or URLs to process
+        workers: Number of worker processes (defaults to the CPU count)
+        progress_callback: Called as progress_callback(done, total) after each source
+        
+    Returns:
+        One dict per source, in input order, with 'source', 'status'
+        ('completed' or 'failed') and 'result' (the process_source output or None)
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(sources)
+    if not sources:
+        return []
+    
+    workers = min(workers or os.cpu_count() or 1, len(sources))
+    log_operation(logger, "process_sources_batch", "started",
+                 {"sources": len(sources), "workers": workers})
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {
+            executor.submit(process_source_in_worker, source): i
+            for i, source in enumerate(sources)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                log_operation(logger, "process_sources_batch", "source_failed",
+                             {"source": sources[i], "error": str(e)}, level="ERROR")
+                result = None
+            results[i] = {
+                "source": sources[i],
+                "status": "completed" if result else "failed",
+                "result": result
+            }
+            if progress_callback:
+                progress_callback(done, len(sources))
+    
+    log_operation(logger, "process_sources_batch", "completed",
+                 {"sources": len(sources),
+                  "failed": sum(r["status"] == "failed" for r in results)})
+    return results
+
+def process_source_in_worker(source_path_or_url: str, source_type: str = None) -> Optional[Dict[str, Any]]:
+    """
+    Process a source from a worker process (e.g. a ProcessPoolExecutor).
+    
+    Bound methods of the parent's engine are not sent across process
+    boundaries; each worker process uses its own IngestionEngine singleton.
+    
+    Args:
+        source_path_or_url: Path or URL to the source
+        source_type: One of 'pdf', 'image', 'html' (auto-detected if None)
+        
+    Returns:
+        Dictionary with content and metadata, or None if failed
+    """
+    return IngestionEngine().process_source(source_path_or_url, source_type)
@@ -1,11 +1,10 @@
 import os
 from pathlib import Path
 from typing import Dict, Any
-from src.utils.file_utils import load_json_file
+from src.utils.main_config import get_main_config
 
 # Load main configuration
-_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
-_main_config = load_json_file(_CONFIG_PATH)
+_main_config = get_main_config()
 
 class QCConfig:
     """Configuration for the Quality Control module"""
@@ -24,6 +23,36 @@ class QCConfig:
         }
         self.llm_temperature = 0.3  # Lower for more deterministic QC
         self.max_tokens = 2000
+        self.bulk_prompt_word_budget = int(self.max_tokens * 0.6)  # Input words per packed prompt
+        self.bulk_max_items = 5  # Scripts per packed prompt, so all reviews fit in max_tokens
+        # Serve placeholder results instead of calling the API (development default)
+        self.simulate_llm = _main_config["module_specific"].get("quality_control", {}).get("simulate_llm", True)
+        
+        # API throughput limits (shared across LLM clients of the account)
+        self.max_concurrency = 8
+        self.requests_per_minute = 500
+        self.tokens_per_minute = 150000
+        self.max_retries = 3
+        self.retry_delay = 5  # Seconds, when a 429 carries no Retry-After
+        
+        # Batch API polling (bulk reviews via generate_qc_reports_batch)
+        self.batch_poll_interval = 30  # Seconds
+        self.batch_timeout_seconds = 24 * 3600
+        
+        # Script review cache (reviews are deterministic per script/prompt/model)
+        self.review_cache_dir = self.output_dir / "_cache"
+        self.review_cache_ttl = 7 * 24 * 3600  # Seconds
+        self.review_cache_max_entries = 512
+        
+        # Semantic cache for compare_texts (cosine similarity of embeddings)
+        self.semantic_cache_enabled = True
+        self.semantic_cache_path = self.output_dir / "_semcache.npz"
+        self.semantic_cache_threshold = 0.97
+        self.semantic_cache_max_entries = 2048
+        self.semantic_cache_save_every = 32  # New entries between saves (the rest are saved at exit)
+        self.embedding_model = "text-embedding-3-small"
+        self.embedding_max_tokens = 8191  # The embedding model's input limit
+        self.embedding_max_words = 4000  # Word cap when tiktoken isn't installed (~1.3+ tokens per word)
         
         # Thresholds
         self.grammar_error_threshold = 3  # Max allowed grammar issues
@@ -37,9 +66,10 @@ class QCConfig:
         self.visual_alignment_prompt = "visual_alignment_prompt.txt"  # Placeholder
         self.pacing_analysis_prompt = "pacing_analysis_prompt.txt"
         
-        # ASR settings (placeholder for Whisper)
-        self.asr_model = "base"  # small, medium, large
+        # ASR settings (faster-whisper)
+        self.asr_model = "base"  # small, medium, large-v3
         self.asr_language = "en"
+        self.asr_workers = 2  # Transcriptions the model runs concurrently
         
         # Ensure directories exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
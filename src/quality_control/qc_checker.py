@@ -1,21 +1,101 @@
-import os
 import json
 import time
+import asyncio
+import functools
+import hashlib
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import pandas as pd
+from typing import Dict, List, Optional, Any
+import requests
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 from src.utils.logging_utils import setup_logging, log_operation
 from src.utils.file_utils import (
-    create_directory_if_not_exists,
     save_json_file,
-    load_json_file
+    save_json_file_async
 )
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.http_client import get_shared_client, run_sync
+from src.utils.cache_utils import JsonCache
 from .config import config
 from src.utils.api_keys import OPENAI_API_KEY  # Import API key
 
 # Initialize logging
 logger = setup_logging("quality_control")
 
+# Share of each review in the combined QC score
+SCRIPT_SCORE_WEIGHT = 0.6
+VIDEO_SCORE_WEIGHT = 0.4
+
+# Stand-ins for a missing review, so _generate_summary reads one local per review
+_EMPTY_SCRIPT_REVIEW: Dict[str, Any] = {}
+_EMPTY_VIDEO_REVIEW: Dict[str, Any] = {}
+
+@dataclass(slots=True)
+class _ReviewSummary:
+    """Result of QualityControl._generate_summary"""
+    critical_issues: int = 0
+    warnings: int = 0
+    passed_checks: int = 0
+    overall_score: float = 0
+    recommendations: List[str] = field(default_factory=list)
+    status: str = ""
+    
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "critical_issues": self.critical_issues,
+            "warnings": self.warnings,
+            "passed_checks": self.passed_checks,
+            "overall_score": self.overall_score,
+            "recommendations": self.recommendations,
+            "status": self.status
+        }
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt_cached(path: str) -> str:
+    """Read a prompt file once; failures propagate and are not cached"""
+    with open(path, 'r') as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=4)
+def _embedding_encoding(model: str):
+    """tiktoken encoding used by an embedding model"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+def _truncate_for_embedding(text: str) -> tuple:
+    """
+    Cut text to the embedding model's input limit
+    
+    Counted in tokens with tiktoken when installed, else capped at
+    config.embedding_max_words words.
+    
+    Returns:
+        tuple: (truncated text, its token count or estimate)
+    """
+    if tiktoken is None:
+        words = text.split()[:config.embedding_max_words]
+        return " ".join(words), len(words)
+    encoding = _embedding_encoding(config.embedding_model)
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) > config.embedding_max_tokens:
+        tokens = tokens[:config.embedding_max_tokens]
+        text = encoding.decode(tokens)
+    return text, len(tokens)
+
 class LLMQCClient:
     """Wrapper class for LLM-based quality checks"""
     
@@ -23,17 +103,215 @@ class LLMQCClient:
         self.api_key = OPENAI_API_KEY
         self.base_url = "https://api.openai.com/v1"
         self.timeout = 30
+        # Shared pooled AsyncClient and concurrency cap, bound to the event loop they were created on
+        self._client = None
+        self._semaphore = None
+        self._client_loop = None
+        # Requests/tokens per minute budget shared with other clients of the account
+        self._limiter = get_rate_limiter(
+            "openai", config.requests_per_minute, config.tokens_per_minute
+        )
+        # compare_texts responses looked up by embedding similarity
+        self._semantic_cache = None
+    
+    def _bind_loop(self) -> None:
+        """Pick up the loop's shared AsyncClient and create a semaphore for it (they can't cross loops)"""
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            self._client = get_shared_client()
+            self._semaphore = asyncio.Semaphore(config.max_concurrency)
+            self._client_loop = loop
+    
+    async def _post(self, path: str, payload: Dict[str, Any], estimated_tokens: int):
+        """
+        POST to the API within the concurrency and rate limits
+        
+        HTTP 429 responses are retried after their Retry-After delay.
+        """
+        self._bind_loop()
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        async with self._semaphore:
+            for attempt in range(config.max_retries):
+                await self._limiter.acquire(estimated_tokens)
+                if self._client is not None:
+                    response = await self._client.post(
+                        f"{self.base_url}{path}",
+                        json=payload, headers=headers, timeout=self.timeout
+                    )
+                else:
+                    response = await asyncio.to_thread(
+                        requests.post, f"{self.base_url}{path}",
+                        json=payload, headers=headers, timeout=self.timeout
+                    )
+                if response.status_code != 429 or attempt == config.max_retries - 1:
+                    break
+                delay = float(response.headers.get("Retry-After") or config.retry_delay)
+                logger.warning(f"LLM QC request rate limited, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        response.raise_for_status()
+        return response
+    
+    async def _request_json(self, prompt: str, model: str) -> Optional[Dict[str, Any]]:
+        """
+        Send a prompt to the chat completions API and parse the JSON reply
         
+        Args:
+            prompt: Fully formatted prompt
+            model: Model name
+            
+        Returns:
+            dict: Parsed JSON object from the model, or None if failed
+        """
+        payload = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": config.llm_temperature,
+            "max_tokens": config.max_tokens,
+            "response_format": {"type": "json_object"}
+        }
+        try:
+            response = await self._post(
+                "/chat/completions", payload, len(prompt.split()) + config.max_tokens
+            )
+            content = _json_loads(response.content)["choices"][0]["message"]["content"]
+            return _json_loads(content)
+        except Exception as e:
+            logger.error(f"LLM QC request failed: {str(e)}")
+            return None
+    
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text with the embeddings API
+        
+        Args:
+            text: Text to embed (truncated to the model's input limit)
+            
+        Returns:
+            list: Embedding vector, or None if failed
+        """
+        text, tokens = _truncate_for_embedding(text)
+        try:
+            response = await self._post(
+                "/embeddings",
+                {"model": config.embedding_model, "input": text},
+                tokens
+            )
+            return _json_loads(response.content)["data"][0]["embedding"]
+        except Exception as e:
+            logger.error(f"Embedding request failed: {str(e)}")
+            return None
+    
+    def _get_semantic_cache(self):
+        """Load the compare_texts semantic cache on first use (keeps numpy off the import path)"""
+        if self._semantic_cache is None:
+            from .semantic_cache import SemanticCache
+            self._semantic_cache = SemanticCache(
+                config.semantic_cache_path,
+                threshold=config.semantic_cache_threshold,
+                max_entries=config.semantic_cache_max_entries,
+                save_every=config.semantic_cache_save_every
+            )
+        return self._semantic_cache
+        
+    def run_batch(self, prompts: Dict[str, str], model: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Run JSON-reply prompts through the OpenAI Batch API
+        
+        Uploads a JSONL request file, creates a batch with a 24h completion
+        window, polls until it finishes and parses the output file.
+        
+        Args:
+            prompts: Fully formatted prompts keyed by custom_id
+            model: Model name
+            
+        Returns:
+            dict: Parsed JSON reply per custom_id (missing or None where a request failed)
+        """
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "temperature": config.llm_temperature,
+                    "max_tokens": config.max_tokens,
+                    "response_format": {"type": "json_object"}
+                }
+            })
+            for custom_id, prompt in prompts.items()
+        ]
+        
+        try:
+            upload = requests.post(
+                f"{self.base_url}/files",
+                headers=headers,
+                data={"purpose": "batch"},
+                files={"file": ("qc_batch.jsonl", "\n".join(lines).encode("utf-8"))},
+                timeout=self.timeout
+            )
+            upload.raise_for_status()
+            
+            batch = requests.post(
+                f"{self.base_url}/batches",
+                headers=headers,
+                json={
+                    "input_file_id": upload.json()["id"],
+                    "endpoint": "/v1/chat/completions",
+                    "completion_window": "24h"
+                },
+                timeout=self.timeout
+            )
+            batch.raise_for_status()
+            batch_info = batch.json()
+            log_operation(logger, "run_batch", "submitted",
+                         {"batch_id": batch_info["id"], "requests": len(lines)})
+            
+            deadline = time.monotonic() + config.batch_timeout_seconds
+            while batch_info["status"] not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Batch {batch_info['id']} still {batch_info['status']}")
+                time.sleep(config.batch_poll_interval)
+                poll = requests.get(f"{self.base_url}/batches/{batch_info['id']}",
+                                    headers=headers, timeout=self.timeout)
+                poll.raise_for_status()
+                batch_info = poll.json()
+            
+            if batch_info["status"] != "completed" or not batch_info.get("output_file_id"):
+                raise RuntimeError(f"Batch {batch_info['id']} ended as {batch_info['status']}")
+            
+            output = requests.get(f"{self.base_url}/files/{batch_info['output_file_id']}/content",
+                                  headers=headers, timeout=self.timeout)
+            output.raise_for_status()
+        except Exception as e:
+            log_operation(logger, "run_batch", "failed", {"error": str(e)}, level="ERROR")
+            return {}
+        
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            response = record.get("response") or {}
+            try:
+                content = response["body"]["choices"][0]["message"]["content"]
+                results[record["custom_id"]] = _json_loads(content)
+            except (KeyError, IndexError, TypeError, ValueError):
+                logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                results[record["custom_id"]] = None
+        return results
+    
     def _load_prompt(self, prompt_name: str) -> Optional[str]:
         """Load a prompt template from file"""
         try:
-            with open(config.prompt_dir / prompt_name, 'r') as f:
-                return f.read()
+            return _load_prompt_cached(str(config.prompt_dir / prompt_name))
         except Exception as e:
             logger.error(f"Failed to load prompt {prompt_name}: {str(e)}")
             return None
     
-    def analyze_text(
+    async def analyze_text_async(
         self,
         text: str,
         prompt_template: str,
@@ -59,11 +337,11 @@ class LLMQCClient:
         # Format prompt with content
         full_prompt = prompt.format(text=text, **format_args)
         
-        # Simulate LLM call (in production, use actual API)
-        logger.debug(f"LLM analysis prompt:\n{full_prompt}")
+        logger.debug("LLM analysis prompt:\n%s", full_prompt)
+        if not config.simulate_llm:
+            return await self._request_json(full_prompt, model or config.llm_models["general_qc"])
         
-        # Placeholder response - in production would call:
-        # response = requests.post(f"{self.base_url}/chat/completions", ...)
+        # Placeholder response (config.simulate_llm)
         return {
             "issues": [
                 {"type": "grammar", "description": "Incorrect verb tense", "suggestion": "Change 'go' to 'went'"},
@@ -73,7 +351,17 @@ class LLMQCClient:
             "summary": "Generally good with minor improvements needed"
         }
     
-    def compare_texts(
+    def analyze_text(
+        self,
+        text: str,
+        prompt_template: str,
+        model: str = None,
+        **format_args
+    ) -> Optional[Dict[str, Any]]:
+        """Perform LLM analysis on text (blocking wrapper around analyze_text_async)"""
+        return run_sync(self.analyze_text_async(text, prompt_template, model, **format_args))
+    
+    async def compare_texts_async(
         self,
         reference: str,
         actual: str,
@@ -99,10 +387,28 @@ class LLMQCClient:
         # Format prompt with content
         full_prompt = prompt.format(reference=reference, actual=actual)
         
-        # Simulate LLM call
-        logger.debug(f"LLM comparison prompt:\n{full_prompt}")
+        logger.debug("LLM comparison prompt:\n%s", full_prompt)
+        if not config.simulate_llm:
+            model = model or config.llm_models["general_qc"]
+            if not config.semantic_cache_enabled:
+                return await self._request_json(full_prompt, model)
+            
+            # Near-identical (reference, actual) pairs recur across iterations
+            # of the same video; reuse the earlier comparison for those
+            cache = self._get_semantic_cache()
+            scope = f"{prompt_template}:{model}"
+            embedding = await self._embed(f"{reference}|||{actual}")
+            if embedding is not None:
+                cached = cache.lookup(scope, embedding)
+                if cached is not None:
+                    return cached
+            result = await self._request_json(full_prompt, model)
+            if result is not None and embedding is not None:
+                if cache.add(scope, embedding, result):
+                    await asyncio.to_thread(cache.save)
+            return result
         
-        # Placeholder response
+        # Placeholder response (config.simulate_llm)
         return {
             "pacing_issues": [
                 {"position": "0:45-1:10", "issue": "Speech too fast", "suggestion": "Slow down by 20%"},
@@ -113,18 +419,143 @@ class LLMQCClient:
             ],
             "sync_score": 0.85
         }
+    
+    async def analyze_texts_bulk_async(
+        self,
+        texts: List[str],
+        model: str = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Review several short scripts with as few LLM calls as possible
+        
+        Scripts are packed into numbered sections under one copy of the
+        script review prompt (so its instructions are sent once per group
+        rather than once per script) and the model returns one review per
+        section. Groups hold at most config.bulk_max_items scripts whose
+        combined words stay within config.bulk_prompt_word_budget. Scripts
+        whose review is missing from a reply (e.g. one cut off at max_tokens)
+        are reviewed individually with analyze_text_async.
+        
+        Args:
+            texts: Script texts to review
+            model: Override default model
+            
+        Returns:
+            list: Review per text ({issues, score, summary}), None where it failed
+        """
+        model = model or config.llm_models["script_review"]
+        prompt = self._load_prompt(config.script_review_prompt)
+        if not prompt:
+            return [None] * len(texts)
+        
+        groups: List[List[int]] = []
+        group_words = 0
+        for i, text in enumerate(texts):
+            words = len(text.split())
+            if (not groups or len(groups[-1]) >= config.bulk_max_items
+                    or group_words + words > config.bulk_prompt_word_budget):
+                groups.append([])
+                group_words = 0
+            groups[-1].append(i)
+            group_words += words
+        
+        async def analyze_group(indices: List[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+            by_index: Dict[int, Optional[Dict[str, Any]]] = {}
+            if len(indices) > 1 and not config.simulate_llm:
+                sections = "\n".join(
+                    f"--- SCRIPT {n}:\n{texts[i]}" for n, i in enumerate(indices, start=1)
+                )
+                bulk_prompt = (
+                    f"The text below holds {len(indices)} separate scripts, each starting with "
+                    '"--- SCRIPT <number>:". Review each script on its own as instructed, and '
+                    'return a JSON object {"results": [...]} with one entry per script: the '
+                    'review object you would return for that script alone, plus "index": '
+                    "<script number>.\n\n" + prompt.format(text=sections)
+                )
+                reply = await self._request_json(bulk_prompt, model)
+                entries = reply.get("results") if isinstance(reply, dict) else None
+                for entry in entries if isinstance(entries, list) else ():
+                    number = entry.get("index") if isinstance(entry, dict) else None
+                    if isinstance(number, int) and 1 <= number <= len(indices):
+                        by_index[indices[number - 1]] = entry
+            
+            # Whatever the packed reply didn't cover is reviewed one by one
+            missing = [i for i in indices if i not in by_index]
+            if missing and len(indices) > 1 and not config.simulate_llm:
+                logger.warning(f"Bulk review returned {len(indices) - len(missing)} of "
+                               f"{len(indices)} results, reviewing the rest individually")
+            analyses = await asyncio.gather(*(
+                self.analyze_text_async(texts[i], config.script_review_prompt, model)
+                for i in missing
+            ))
+            by_index.update(zip(missing, analyses))
+            return by_index
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        for by_index in await asyncio.gather(*(analyze_group(g) for g in groups)):
+            for i, analysis in by_index.items():
+                results[i] = analysis
+        return results
+    
+    def analyze_texts_bulk(self, texts: List[str], model: str = None) -> List[Optional[Dict[str, Any]]]:
+        """Review several short scripts (blocking wrapper around analyze_texts_bulk_async)"""
+        return run_sync(self.analyze_texts_bulk_async(texts, model))
+    
+    def compare_texts(
+        self,
+        reference: str,
+        actual: str,
+        prompt_template: str,
+        model: str = None
+    ) -> Optional[Dict[str, Any]]:
+        """Compare two texts using LLM (blocking wrapper around compare_texts_async)"""
+        return run_sync(self.compare_texts_async(reference, actual, prompt_template, model))
 
 class QualityControl:
     """Core quality control checks for educational content"""
     
     def __init__(self):
         self.llm_client = LLMQCClient()
-        create_directory_if_not_exists(config.output_dir)
+        # Script reviews keyed by script text + prompt + model
+        self._review_cache = JsonCache(config.review_cache_dir, max_entries=config.review_cache_max_entries)
+        # faster-whisper model, loaded by the first transcription
+        self._asr = None
+        self._asr_lock = threading.Lock()
         logger.info("Quality Control initialized")
         
+    def _get_asr_model(self):
+        """
+        Load the faster-whisper model on first use (shared by all transcriptions)
+        
+        Returns:
+            WhisperModel: Loaded model, or None if faster-whisper is not installed
+        """
+        with self._asr_lock:
+            if self._asr is None:
+                try:
+                    from faster_whisper import WhisperModel
+                    import ctranslate2
+                except ImportError:
+                    return None
+                # INT8 weights; activations in FP16 on GPU (CPUs lack fast FP16)
+                if ctranslate2.get_cuda_device_count() > 0:
+                    device, compute_type = "cuda", "int8_float16"
+                else:
+                    device, compute_type = "cpu", "int8"
+                self._asr = WhisperModel(
+                    config.asr_model,
+                    device=device,
+                    compute_type=compute_type,
+                    num_workers=config.asr_workers
+                )
+                logger.info(f"Loaded ASR model {config.asr_model} on {device} ({compute_type})")
+            return self._asr
+    
     def _transcribe_audio(self, video_path: Path) -> Optional[str]:
         """
-        Transcribe audio from video (placeholder for Whisper implementation)
+        Transcribe audio from video with faster-whisper
+        
+        Falls back to a simulated transcription when faster-whisper is not installed.
         
         Args:
             video_path: Path to video file
@@ -133,19 +564,27 @@ class QualityControl:
             str: Transcribed text or None if failed
         """
         try:
-            # In production, would use:
-            # import whisper
-            # model = whisper.load_model(config.asr_model)
-            # result = model.transcribe(str(video_path), language=config.asr_language)
-            # return result["text"]
-            
-            logger.info(f"Would transcribe audio from {video_path} using {config.asr_model} model")
-            return "This is a simulated transcription of the video audio content."
+            model = self._get_asr_model()
+            if model is None:
+                logger.info(f"faster-whisper not installed; simulating transcription of {video_path}")
+                return "This is a simulated transcription of the video audio content."
+            
+            segments, _info = model.transcribe(
+                str(video_path),
+                language=config.asr_language,
+                vad_filter=True
+            )
+            # Segments are decoded lazily while iterating
+            return " ".join(segment.text.strip() for segment in segments)
         except Exception as e:
             logger.error(f"Audio transcription failed: {str(e)}")
             return None
     
-    def run_script_review(self, script_text: str) -> Optional[Dict[str, Any]]:
+    async def _transcribe_audio_async(self, video_path: Path) -> Optional[str]:
+        """Transcribe audio in a worker thread (CTranslate2 releases the GIL while decoding)"""
+        return await asyncio.to_thread(self._transcribe_audio, video_path)
+    
+    async def run_script_review_async(self, script_text: str) -> Optional[Dict[str, Any]]:
         """
         Perform comprehensive script review
         
@@ -160,33 +599,32 @@ class QualityControl:
                      {"text_length": len(script_text)})
         
         try:
+            model = config.llm_models["script_review"]
+            cache_key = self._review_cache_key(script_text, model)
+            cached = await asyncio.to_thread(self._review_cache.get, cache_key) if cache_key else None
+            if cached and time.time() - cached["created"] < config.review_cache_ttl:
+                log_operation(logger, "run_script_review", "cached", {"key": cache_key})
+                return cached["review"]
+            
             # Run LLM analysis
-            result = self.llm_client.analyze_text(
+            result = await self.llm_client.analyze_text_async(
                 text=script_text,
                 prompt_template=config.script_review_prompt,
-                model=config.llm_models["script_review"]
+                model=model
             )
             
             if not result:
                 raise RuntimeError("LLM analysis returned no results")
             
             # Process results
-            grammar_issues = [issue for issue in result.get("issues", []) 
-                            if issue["type"] == "grammar"]
-            clarity_issues = [issue for issue in result.get("issues", []) 
-                            if issue["type"] == "clarity"]
-            
-            review_result = {
-                "grammar_issues": grammar_issues,
-                "clarity_issues": clarity_issues,
-                "score": result.get("score", 0),
-                "summary": result.get("summary", ""),
-                "timestamp": time.time()
-            }
+            review_result = self._build_script_review(result)
+            if cache_key:
+                await asyncio.to_thread(self._review_cache.set, cache_key,
+                                        {"created": time.time(), "review": review_result})
             
             duration = time.time() - start_time
             log_operation(logger, "run_script_review", "completed", {
-                "issues_found": len(grammar_issues) + len(clarity_issues),
+                "issues_found": len(review_result["grammar_issues"]) + len(review_result["clarity_issues"]),
                 "score": review_result["score"],
                 "duration_sec": duration
             })
@@ -199,7 +637,40 @@ class QualityControl:
             }, level="ERROR")
             return None
     
-    def run_video_review(
+    def _review_cache_key(self, script_text: str, model: str) -> Optional[str]:
+        """Key a script review by everything that determines it (None if the prompt is missing)"""
+        prompt = self.llm_client._load_prompt(config.script_review_prompt)
+        if prompt is None:
+            return None
+        digest = hashlib.blake2b(digest_size=16, usedforsecurity=False)
+        for part in (model, prompt, script_text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
+    
+    def _build_script_review(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a raw LLM analysis into a script review result"""
+        # Sort issues into their categories in one pass; other types are dropped
+        grammar_issues, clarity_issues = [], []
+        bucket = {"grammar": grammar_issues.append, "clarity": clarity_issues.append}
+        for issue in result.get("issues", ()):
+            add = bucket.get(issue.get("type"))
+            if add:
+                add(issue)
+        
+        return {
+            "grammar_issues": grammar_issues,
+            "clarity_issues": clarity_issues,
+            "score": result.get("score", 0),
+            "summary": result.get("summary", ""),
+            "timestamp": time.time()
+        }
+    
+    def run_script_review(self, script_text: str) -> Optional[Dict[str, Any]]:
+        """Perform comprehensive script review (blocking wrapper around run_script_review_async)"""
+        return run_sync(self.run_script_review_async(script_text))
+    
+    async def run_video_review_async(
         self,
         video_path: Path,
         script_text: str
@@ -220,12 +691,12 @@ class QualityControl:
         
         try:
             # Step 1: Transcribe audio
-            transcribed_text = self._transcribe_audio(video_path)
+            transcribed_text = await self._transcribe_audio_async(video_path)
             if not transcribed_text:
                 raise RuntimeError("Audio transcription failed")
             
             # Step 2: Compare with script
-            comparison = self.llm_client.compare_texts(
+            comparison = await self.llm_client.compare_texts_async(
                 reference=script_text,
                 actual=transcribed_text,
                 prompt_template=config.pacing_analysis_prompt,
@@ -266,7 +737,15 @@ class QualityControl:
             }, level="ERROR")
             return None
     
-    def generate_qc_report(
+    def run_video_review(
+        self,
+        video_path: Path,
+        script_text: str
+    ) -> Optional[Dict[str, Any]]:
+        """Review video against script (blocking wrapper around run_video_review_async)"""
+        return run_sync(self.run_video_review_async(video_path, script_text))
+    
+    async def generate_qc_report_async(
         self,
         script_text: str,
         video_path: Path = None
@@ -290,22 +769,28 @@ class QualityControl:
         
         try:
             report = {
-                "script_review": self.run_script_review(script_text),
+                "script_review": None,
                 "video_review": None,
                 "summary": {},
                 "timestamp": time.time()
             }
             
-            # Add video review if video provided
+            # The reviews are independent; when a video is provided, its
+            # transcription and comparison overlap the script review
             if video_path:
-                report["video_review"] = self.run_video_review(video_path, script_text)
+                report["script_review"], report["video_review"] = await asyncio.gather(
+                    self.run_script_review_async(script_text),
+                    self.run_video_review_async(video_path, script_text)
+                )
+            else:
+                report["script_review"] = await self.run_script_review_async(script_text)
             
             # Generate overall summary
             report["summary"] = self._generate_summary(report)
             
             # Save report
             report_path = config.output_dir / f"{source_name}_qc_report.json"
-            save_json_file(report, report_path)
+            await save_json_file_async(report, report_path)
             
             duration = time.time() - start_time
             log_operation(logger, "generate_qc_report", "completed", {
@@ -323,66 +808,141 @@ class QualityControl:
             }, level="ERROR")
             return None
     
+    def generate_qc_report(
+        self,
+        script_text: str,
+        video_path: Path = None
+    ) -> Optional[Path]:
+        """Generate comprehensive QC report (blocking wrapper around generate_qc_report_async)"""
+        return run_sync(self.generate_qc_report_async(script_text, video_path))
+    
+    def generate_qc_reports_batch(
+        self,
+        scripts: List[str],
+        source_names: Optional[List[str]] = None,
+        use_batch_api: bool = True
+    ) -> List[Optional[Path]]:
+        """
+        Generate script-only QC reports for many scripts
+        
+        By default reviews are submitted as one OpenAI batch (half the cost of
+        individual requests and outside the per-minute limits), which can take
+        up to the 24h completion window. With use_batch_api=False the scripts
+        are reviewed right away, several per request (analyze_texts_bulk);
+        use generate_qc_report for latency-sensitive single reviews.
+        
+        Args:
+            scripts: Script texts to review
+            source_names: Report name per script (defaults to batch_<index>)
+            use_batch_api: Submit through the Batch API instead of packed requests
+            
+        Returns:
+            list: Report path per script, or None where the review failed
+        """
+        source_names = source_names or [f"batch_{i}" for i in range(len(scripts))]
+        log_operation(logger, "generate_qc_reports_batch", "started", {"scripts": len(scripts)})
+        
+        if config.simulate_llm or not use_batch_api:
+            analyses = self.llm_client.analyze_texts_bulk(scripts, model=config.llm_models["script_review"])
+        else:
+            prompt = self.llm_client._load_prompt(config.script_review_prompt)
+            if not prompt:
+                return [None] * len(scripts)
+            replies = self.llm_client.run_batch(
+                {str(i): prompt.format(text=text) for i, text in enumerate(scripts)},
+                model=config.llm_models["script_review"]
+            )
+            analyses = [replies.get(str(i)) for i in range(len(scripts))]
+        
+        report_paths = []
+        for name, analysis in zip(source_names, analyses):
+            if not analysis:
+                report_paths.append(None)
+                continue
+            report = {
+                "script_review": self._build_script_review(analysis),
+                "video_review": None,
+                "summary": {},
+                "timestamp": time.time()
+            }
+            report["summary"] = self._generate_summary(report)
+            report_path = config.output_dir / f"{name}_qc_report.json"
+            report_paths.append(report_path if save_json_file(report, report_path) else None)
+        
+        log_operation(logger, "generate_qc_reports_batch", "completed", {
+            "scripts": len(scripts),
+            "reports": sum(path is not None for path in report_paths)
+        })
+        return report_paths
+    
     def _generate_summary(self, report: Dict[str, Any]) -> Dict[str, Any]:
         """Generate overall summary from review results"""
-        summary = {
-            "critical_issues": 0,
-            "warnings": 0,
-            "passed_checks": 0,
-            "overall_score": 0,
-            "recommendations": []
-        }
+        script_review = report.get("script_review") or _EMPTY_SCRIPT_REVIEW
+        video_review = report.get("video_review") or _EMPTY_VIDEO_REVIEW
+        if script_review is _EMPTY_SCRIPT_REVIEW and video_review is _EMPTY_VIDEO_REVIEW:
+            status = "needs_review" if 0 < config.warning_score_threshold else "approved"
+            return _ReviewSummary(status=status).as_dict()
+        
+        critical_issues = warnings = 0
+        overall_score = 0
+        recommendations = []
         
         # Process script review
-        if report.get("script_review"):
-            script_score = report["script_review"].get("score", 0)
-            grammar_issues = len(report["script_review"].get("grammar_issues", []))
-            clarity_issues = len(report["script_review"].get("clarity_issues", []))
+        if script_review is not _EMPTY_SCRIPT_REVIEW:
+            script_score = script_review.get("score", 0)
+            grammar_issues = len(script_review.get("grammar_issues", ()))
+            clarity_issues = len(script_review.get("clarity_issues", ()))
             
             if grammar_issues > config.grammar_error_threshold:
-                summary["critical_issues"] += 1
-                summary["recommendations"].append("Fix grammar issues in script")
+                critical_issues += 1
+                recommendations.append("Fix grammar issues in script")
             elif grammar_issues > 0:
-                summary["warnings"] += 1
+                warnings += 1
             
             if clarity_issues > 0:
-                summary["warnings"] += 1
-                summary["recommendations"].append("Improve script clarity")
-            
-            summary["overall_score"] += script_score * 0.6  # 60% weight
+                warnings += 1
+                recommendations.append("Improve script clarity")
+            
+            # Script-only reports use the script score as is (1-5 scale)
+            if video_review is _EMPTY_VIDEO_REVIEW:
+                overall_score = round(script_score, 1)
+            else:
+                overall_score = script_score * SCRIPT_SCORE_WEIGHT
         
         # Process video review
-        if report.get("video_review"):
-            pacing_issues = len(report["video_review"].get("pacing_issues", []))
-            mismatches = len(report["video_review"].get("content_mismatches", []))
-            visual_score = report["video_review"].get("visual_alignment", {}).get("score", 1)
+        if video_review is not _EMPTY_VIDEO_REVIEW:
+            pacing_issues = len(video_review.get("pacing_issues", ()))
+            mismatches = len(video_review.get("content_mismatches", ()))
+            visual_score = video_review.get("visual_alignment", _EMPTY_VIDEO_REVIEW).get("score", 1)
             
             if pacing_issues > 0:
-                summary["warnings"] += 1
-                summary["recommendations"].append("Adjust video pacing")
+                warnings += 1
+                recommendations.append("Adjust video pacing")
             
             if mismatches > 0:
-                summary["critical_issues"] += 1
-                summary["recommendations"].append("Fix content mismatches")
+                critical_issues += 1
+                recommendations.append("Fix content mismatches")
             
             if visual_score < config.min_visual_sync_score:
-                summary["warnings"] += 1
-                summary["recommendations"].append("Improve visual-narration sync")
+                warnings += 1
+                recommendations.append("Improve visual-narration sync")
             
-            summary["overall_score"] += visual_score * 0.4  # 40% weight
-        
-        # Calculate overall score (1-5 scale)
-        if report.get("script_review") and report.get("video_review"):
-            summary["overall_score"] = round(summary["overall_score"], 1)
-        elif report.get("script_review"):
-            summary["overall_score"] = round(report["script_review"].get("score", 0), 1)
+            overall_score += visual_score * VIDEO_SCORE_WEIGHT
+            if script_review is not _EMPTY_SCRIPT_REVIEW:
+                overall_score = round(overall_score, 1)
         
         # Final assessment
-        if summary["critical_issues"] > 0:
-            summary["status"] = "needs_revision"
-        elif summary["warnings"] > 0 or summary["overall_score"] < config.warning_score_threshold:
-            summary["status"] = "needs_review"
+        if critical_issues > 0:
+            status = "needs_revision"
+        elif warnings > 0 or overall_score < config.warning_score_threshold:
+            status = "needs_review"
         else:
-            summary["status"] = "approved"
+            status = "approved"
         
-        return summary
+        return _ReviewSummary(
+            critical_issues=critical_issues,
+            warnings=warnings,
+            overall_score=overall_score,
+            recommendations=recommendations,
+            status=status
+        ).as_dict()
@@ -0,0 +1,141 @@
+import os
+import atexit
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from src.utils.logging_utils import setup_logging
+
+# Initialize logging
+logger = setup_logging("semantic_cache")
+
+class SemanticCache:
+    """
+    Response cache looked up by embedding similarity instead of exact key.
+
+    Embeddings are stored L2-normalized in one float32 matrix, so a lookup is
+    a single matrix-vector product giving the cosine similarity to every
+    entry. Entries are partitioned by scope (e.g. prompt template + model) so
+    only responses produced the same way can be reused.
+
+    The file holds the whole matrix, so it is rewritten only every save_every
+    new entries (add() says when) and once more at interpreter exit.
+    """
+
+    def __init__(self, path: Path, threshold: float = 0.97, max_entries: int = 2048, save_every: int = 32):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.save_every = save_every
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+        self._scopes = np.empty(0, dtype=str)
+        self._responses = []
+        self._load()
+        atexit.register(self.flush)
+
+    def _load(self) -> None:
+        """Read the cache file if present; a corrupt file just starts an empty cache"""
+        if not self.path.exists():
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                self._embeddings = data["embeddings"].astype(np.float32, copy=False)
+                self._scopes = data["scopes"]
+                self._responses = [json.loads(r) for r in data["responses"]]
+            logger.debug(f"Loaded {len(self._responses)} semantic cache entries from {self.path}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable semantic cache {self.path}: {str(e)}")
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, scope: str, embedding) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached response closest to `embedding` within `scope`
+
+        Args:
+            scope: Partition the entry was stored under
+            embedding: Query embedding
+
+        Returns:
+            dict: Cached response if its similarity reaches the threshold, else None
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            if not self._responses or self._embeddings.shape[1] != vector.shape[0]:
+                return None
+            scores = self._embeddings @ vector
+            scores[self._scopes != scope] = -1.0
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            logger.debug(f"Semantic cache hit (similarity {scores[best]:.3f})")
+            return self._responses[best]
+
+    def add(self, scope: str, embedding, response: Dict[str, Any]) -> bool:
+        """
+        Store a response under its query embedding (oldest entries are dropped past max_entries)
+
+        Args:
+            scope: Partition to store the entry under
+            embedding: Query embedding
+            response: JSON-serializable response
+
+        Returns:
+            bool: True once save_every entries are unsaved, i.e. save() is due
+        """
+        vector = self._normalize(embedding)[np.newaxis, :]
+        with self._lock:
+            if not self._responses or self._embeddings.shape[1] != vector.shape[1]:
+                # First entry, or the embedding model changed dimensions
+                self._embeddings = vector
+                self._scopes = np.array([scope])
+                self._responses = [response]
+            else:
+                self._embeddings = np.vstack((self._embeddings, vector))[-self.max_entries:]
+                self._scopes = np.append(self._scopes, scope)[-self.max_entries:]
+                self._responses = (self._responses + [response])[-self.max_entries:]
+            self._unsaved += 1
+            return self._unsaved >= self.save_every
+
+    def save(self) -> bool:
+        """
+        Persist the cache (written to a temp file and renamed into place)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        with self._lock:
+            embeddings, scopes = self._embeddings, self._scopes
+            responses = np.array([json.dumps(r) for r in self._responses])
+            unsaved, self._unsaved = self._unsaved, 0
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.savez(f, embeddings=embeddings, scopes=scopes, responses=responses)
+            os.replace(tmp_path, self.path)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save semantic cache {self.path}: {str(e)}")
+            with self._lock:
+                self._unsaved += unsaved
+            return False
+
+    def flush(self) -> bool:
+        """
+        Save the cache if it has unsaved entries (registered to run at exit)
+
+        Returns:
+            bool: True if nothing was pending or the save succeeded
+        """
+        with self._lock:
+            pending = self._unsaved
+        return self.save() if pending else True
@@ -1,11 +1,10 @@
 import os
 from pathlib import Path
 from typing import Dict, Any
-from src.utils.file_utils import load_json_file
+from src.utils.main_config import get_main_config
 
 # Load main configuration
-_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
-_main_config = load_json_file(_CONFIG_PATH)
+_main_config = get_main_config()
 
 class ScriptGeneratorConfig:
     """Configuration for the Script Generator module"""
@@ -23,8 +22,18 @@ class ScriptGeneratorConfig:
         self.temperature = llm_config["temperature"]
         self.max_tokens = 2000
         self.timeout_seconds = 30
+        # Serve canned responses instead of calling the API (development default)
+        self.simulate_llm = llm_config.get("simulate_llm", True)
+        # Stream completions so the script file is written while tokens arrive
+        self.stream_llm = llm_config.get("stream", True)
+        
+        # API throughput limits (shared across LLM clients of the account)
+        self.max_concurrency = llm_config.get("max_concurrency", 8)
+        self.requests_per_minute = llm_config.get("requests_per_minute", 500)
+        self.tokens_per_minute = llm_config.get("tokens_per_minute", 150000)
         
         # Script generation settings
+        self.default_script_length_seconds = _main_config["base_settings"]["default_script_length_seconds"]
         self.default_language = "English"
         self.default_tone = "informative"
         self.min_script_words = 200
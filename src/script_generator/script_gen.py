@@ -2,21 +2,68 @@ import os
 import time
 import json
 import re
+import asyncio
+import functools
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable
+import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
 from src.utils.logging_utils import setup_logging, log_operation
 from src.utils.file_utils import (
     create_directory_if_not_exists,
-    save_text_file,
-    save_json_file,
-    load_json_file
+    save_text_file_async,
+    save_json_file_async
 )
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.http_client import get_shared_client, run_sync
 from .config import config
 from src.utils.api_keys import OPENAI_API_KEY  # Import API key
 
 # Initialize logging
 logger = setup_logging("script_generator")
 
+# Created once per process rather than per ScriptGenerator
+create_directory_if_not_exists(config.output_dir)
+
+# Markers the prompt asks the model to emit
+_KEYWORDS_RE = re.compile(r"\[KEYWORDS:(.*?)\]", re.DOTALL)
+_SUMMARY_RE = re.compile(r"\[SECTION: Summary\](.*?)(?:\n\n|\Z)", re.DOTALL)
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt_cached(path: str) -> str:
+    """Read a prompt template once; failures propagate and are not cached"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+# Connection-level failures worth retrying; HTTP status errors are handled separately
+_TRANSPORT_ERRORS = (requests.ConnectionError, requests.Timeout) + (
+    (httpx.TransportError,) if httpx is not None else ()
+)
+
+def _is_retryable_status(status_code: int) -> bool:
+    """Rate limiting and server errors are transient; other statuses are final"""
+    return status_code == 429 or status_code >= 500
+
+def _backoff_delay(response, attempt: int) -> float:
+    """Seconds to wait before the next attempt: Retry-After when given, else exponential backoff"""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return float(retry_after)
+    except (TypeError, ValueError):
+        return config.retry_delay * 2 ** attempt
+
 class LLMClient:
     """Wrapper class for LLM API calls"""
     
@@ -24,70 +71,236 @@ class LLMClient:
         self.api_key = OPENAI_API_KEY
         self.base_url = "https://api.openai.com/v1"
         self.timeout = config.timeout_seconds
+        # Shared pooled AsyncClient and concurrency cap, bound to the event loop they were created on
+        self._client = None
+        self._semaphore = None
+        self._client_loop = None
+        # Requests/tokens per minute budget shared with other clients of the account
+        self._limiter = get_rate_limiter(
+            "openai", config.requests_per_minute, config.tokens_per_minute
+        )
+    
+    def _bind_loop(self) -> None:
+        """Pick up the loop's shared AsyncClient and create a semaphore for it (they can't cross loops)"""
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            self._client = get_shared_client()
+            self._semaphore = asyncio.Semaphore(config.max_concurrency)
+            self._client_loop = loop
+    
+    async def _post_chat(self, payload: Dict[str, Any], estimated_tokens: int):
+        """
+        POST a chat completion within the concurrency and rate limits
         
-    def generate_text(self, prompt: str, model: str, temperature: float) -> Optional[Dict[str, Any]]:
+        This is the only retry layer for LLM calls: HTTP 429 responses wait
+        for their Retry-After delay, 5xx responses and connection errors back
+        off exponentially, up to config.max_retries attempts in total.
         """
-        Make API call to LLM service
+        self._bind_loop()
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        async with self._semaphore:
+            for attempt in range(config.max_retries):
+                last_attempt = attempt == config.max_retries - 1
+                await self._limiter.acquire(estimated_tokens)
+                try:
+                    if self._client is not None:
+                        response = await self._client.post(
+                            f"{self.base_url}/chat/completions",
+                            json=payload, headers=headers, timeout=self.timeout
+                        )
+                    else:
+                        response = await asyncio.to_thread(
+                            requests.post, f"{self.base_url}/chat/completions",
+                            json=payload, headers=headers, timeout=self.timeout
+                        )
+                except _TRANSPORT_ERRORS as e:
+                    if last_attempt:
+                        raise
+                    delay = _backoff_delay(None, attempt)
+                    logger.warning(f"LLM API request failed ({e}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                    continue
+                if not _is_retryable_status(response.status_code) or last_attempt:
+                    break
+                delay = _backoff_delay(response, attempt)
+                logger.warning(f"LLM API returned {response.status_code}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        response.raise_for_status()
+        return response
+    
+    def _simulated_response(self, prompt: str) -> Dict[str, Any]:
+        """Canned response used while config.simulate_llm is set (development)"""
+        return {
+            "choices": [{
+                "text": "This is a simulated LLM response. In production, this would be the actual generated script.",
+                "finish_reason": "length",
+                "index": 0
+            }],
+            "usage": {
+                "prompt_tokens": len(prompt.split()),
+                "completion_tokens": 150,
+                "total_tokens": len(prompt.split()) + 150
+            }
+        }
+    
+    async def generate_text_async(self, prompt: str, model: str, temperature: float) -> Optional[Dict[str, Any]]:
         """
-        # Implementation note: In production, you would use the actual API client library
-        # This is a simplified version showing the interface
+        Make API call to LLM service without blocking the event loop
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        Args:
+            prompt: Fully formatted prompt
+            model: Model name
+            temperature: Sampling temperature
+            
+        Returns:
+            dict: Response with choices[0]["text"] and usage, or None if failed
+        """
+        try:
+            logger.info("Calling LLM API with model %s", model)
+            if config.simulate_llm:
+                return self._simulated_response(prompt)
+            
+            payload = {
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": temperature,
+                "max_tokens": config.max_tokens
+            }
+            response = await self._post_chat(payload, len(prompt.split()) + config.max_tokens)
+            data = _json_loads(response.content)
+            
+            # Expose chat message content under the completions-style "text" key
+            for choice in data.get("choices", []):
+                choice.setdefault("text", choice.get("message", {}).get("content", ""))
+            return data
+            
+        except Exception as e:
+            logger.error(f"LLM API call failed: {str(e)}")
+            return None
+    
+    async def generate_text_stream_async(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        on_text: Callable[[str], Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Stream a completion, handing each text delta to on_text as it arrives
         
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "temperature": temperature,
-            "max_tokens": config.max_tokens
-        }
+        Lets callers overlap their own work (e.g. writing the script file)
+        with the remaining network time. Without httpx, or in simulate mode,
+        the whole text is delivered as a single delta. 429/5xx responses and
+        connection errors are retried like _post_chat, as long as no text has
+        been delivered yet.
+        
+        Args:
+            prompt: Fully formatted prompt
+            model: Model name
+            temperature: Sampling temperature
+            on_text: Called with each text fragment, in order
+            
+        Returns:
+            dict: Same shape as generate_text_async once the stream ends, or None if failed
+        """
+        if config.simulate_llm or httpx is None:
+            response = await self.generate_text_async(prompt, model, temperature)
+            if response:
+                on_text(response["choices"][0]["text"])
+            return response
         
         try:
-            # Simulating API call - replace with actual implementation
-            logger.info(f"Calling LLM API with model {model}")
-            
-            # In real implementation:
-            # response = requests.post(f"{self.base_url}/completions",
-            #                       json=payload,
-            #                       headers=headers,
-            #                       timeout=self.timeout)
-            # response.raise_for_status()
-            # return response.json()
-            
-            # Simulated response for development
-            return {
-                "choices": [{
-                    "text": "This is a simulated LLM response. In production, this would be the actual generated script.",
-                    "finish_reason": "length",
-                    "index": 0
-                }],
-                "usage": {
-                    "prompt_tokens": len(prompt.split()),
-                    "completion_tokens": 150,
-                    "total_tokens": len(prompt.split()) + 150
+            logger.info("Streaming LLM API response with model %s", model)
+            self._bind_loop()
+            headers = {"Authorization": f"Bearer {self.api_key}"}
+            payload = {
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "temperature": temperature,
+                "max_tokens": config.max_tokens,
+                "stream": True,
+                "stream_options": {"include_usage": True}
+            }
+            
+            parts = []
+            usage = None
+            finish_reason = None
+            async with self._semaphore:
+                for attempt in range(config.max_retries):
+                    last_attempt = attempt == config.max_retries - 1
+                    await self._limiter.acquire(len(prompt.split()) + config.max_tokens)
+                    delay = None
+                    try:
+                        async with self._client.stream("POST", f"{self.base_url}/chat/completions",
+                                                       json=payload, headers=headers,
+                                                       timeout=self.timeout) as response:
+                            if _is_retryable_status(response.status_code) and not last_attempt:
+                                delay = _backoff_delay(response, attempt)
+                                logger.warning(f"LLM API returned {response.status_code}, retrying in {delay:.1f}s")
+                            else:
+                                response.raise_for_status()
+                                async for line in response.aiter_lines():
+                                    if not line.startswith("data:"):
+                                        continue
+                                    data = line[5:].strip()
+                                    if data == "[DONE]":
+                                        break
+                                    event = _json_loads(data)
+                                    usage = event.get("usage") or usage
+                                    for choice in event.get("choices") or ():
+                                        delta = (choice.get("delta") or {}).get("content")
+                                        if delta:
+                                            parts.append(delta)
+                                            on_text(delta)
+                                        finish_reason = choice.get("finish_reason") or finish_reason
+                    except _TRANSPORT_ERRORS as e:
+                        # Text already handed to on_text can't be taken back
+                        if parts or last_attempt:
+                            raise
+                        delay = _backoff_delay(None, attempt)
+                        logger.warning(f"LLM API stream failed ({e}), retrying in {delay:.1f}s")
+                    if delay is None:
+                        break
+                    await asyncio.sleep(delay)
+            
+            text = "".join(parts)
+            if usage is None:
+                prompt_tokens = len(prompt.split())
+                completion_tokens = len(text.split())
+                usage = {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens
                 }
+            return {
+                "choices": [{"text": text, "finish_reason": finish_reason, "index": 0}],
+                "usage": usage
             }
             
         except Exception as e:
-            logger.error(f"LLM API call failed: {str(e)}")
+            logger.error(f"LLM API stream failed: {str(e)}")
             return None
+    
+    def generate_text(self, prompt: str, model: str, temperature: float) -> Optional[Dict[str, Any]]:
+        """
+        Make API call to LLM service (blocking wrapper around generate_text_async)
+        """
+        return run_sync(self.generate_text_async(prompt, model, temperature))
 
 class ScriptGenerator:
     """Core class for generating educational scripts from ingested content"""
     
     def __init__(self):
         self.llm_client = LLMClient()
-        create_directory_if_not_exists(config.output_dir)
+        # Joined once; per-script output paths are plain string concatenation
+        self._output_prefix = os.path.join(config.output_dir, "script_")
         logger.info("Script Generator initialized")
         
     def _load_prompt_template(self) -> Optional[str]:
         """Load the prompt template from file"""
         prompt_file = config.prompt_dir / "educational_script_prompt.txt"
         try:
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _load_prompt_cached(str(prompt_file))
         except Exception as e:
             logger.error(f"Failed to load prompt template: {str(e)}")
             return None
@@ -101,17 +314,14 @@ class ScriptGenerator:
         """Extract structured information from the generated script"""
         # Extract keywords
         keywords = []
-        if "[KEYWORDS:" in raw_script:
-            kw_match = re.search(r"\[KEYWORDS:(.*?)\]", raw_script)
-            if kw_match:
-                keywords = [k.strip() for k in kw_match.group(1).split(",")]
-                raw_script = raw_script.replace(kw_match.group(0), "").strip()
+        kw_match = _KEYWORDS_RE.search(raw_script)
+        if kw_match:
+            keywords = list(map(str.strip, kw_match.group(1).split(",")))
+            raw_script = raw_script.replace(kw_match.group(0), "").strip()
         
-        # Extract summary
-        summary = ""
-        if "[SECTION: Summary]" in raw_script:
-            summary_part = raw_script.split("[SECTION: Summary]")[1]
-            summary = summary_part.split("\n\n")[0].strip()
+        # Extract summary (up to the first blank line after the marker)
+        summary_match = _SUMMARY_RE.search(raw_script)
+        summary = summary_match.group(1).strip() if summary_match else ""
         
         return {
             "full_script": raw_script,
@@ -119,7 +329,7 @@ class ScriptGenerator:
             "summary": summary
         }
     
-    def generate_script(
+    async def generate_script_async(
         self,
         ingested_data_json: Dict[str, Any],
         topic: Optional[str] = None,
@@ -155,7 +365,7 @@ class ScriptGenerator:
             if not tone:
                 tone = config.default_tone
             if not summary_target_seconds:
-                summary_target_seconds = _main_config["defaults"]["default_script_length_seconds"]
+                summary_target_seconds = config.default_script_length_seconds
             
             # Load and format prompt template
             prompt_template = self._load_prompt_template()
@@ -172,20 +382,36 @@ class ScriptGenerator:
                 word_count=word_count
             )
             
-            # Call LLM API
-            llm_response = None
-            for attempt in range(config.max_retries):
-                llm_response = self.llm_client.generate_text(
+            source_name = Path(ingested_data_json["metadata"]["source"]).stem
+            text_path = f"{self._output_prefix}{source_name}.txt"
+            
+            # Call LLM API (transient failures are retried inside the client)
+            if config.stream_llm:
+                # Raw text reaches disk while it streams in, under a temporary
+                # name so a failed stream never leaves a truncated script behind
+                partial_path = f"{text_path}.part"
+                try:
+                    with open(partial_path, 'w', encoding='utf-8') as partial:
+                        llm_response = await self.llm_client.generate_text_stream_async(
+                            prompt=prompt,
+                            model=config.llm_model,
+                            temperature=config.temperature,
+                            on_text=partial.write
+                        )
+                    if llm_response:
+                        os.replace(partial_path, text_path)
+                finally:
+                    if os.path.exists(partial_path):
+                        os.remove(partial_path)
+            else:
+                llm_response = await self.llm_client.generate_text_async(
                     prompt=prompt,
                     model=config.llm_model,
                     temperature=config.temperature
                 )
-                if llm_response:
-                    break
-                time.sleep(config.retry_delay)
             
             if not llm_response:
-                raise RuntimeError("Failed to get valid response from LLM after retries")
+                raise RuntimeError("Failed to get valid response from LLM")
             
             # Process the response
             raw_script = llm_response["choices"][0]["text"]
@@ -216,17 +442,12 @@ class ScriptGenerator:
                 }
             }
             
-            # Save outputs
-            source_name = Path(ingested_data_json["metadata"]["source"]).stem
-            output_prefix = config.output_dir / f"script_{source_name}"
-            
-            # Save human-readable text
-            text_path = f"{output_prefix}.txt"
-            save_text_file(result["script"], text_path)
-            
-            # Save structured JSON
-            json_path = f"{output_prefix}.json"
-            save_json_file(result, json_path)
+            # Save outputs: human-readable text and structured JSON, written concurrently
+            json_path = f"{self._output_prefix}{source_name}.json"
+            await asyncio.gather(
+                save_text_file_async(result["script"], text_path),
+                save_json_file_async(result, json_path)
+            )
             
             log_operation(logger, "generate_script", "completed", {
                 "source": ingested_data_json["metadata"]["source"],
@@ -244,3 +465,30 @@ class ScriptGenerator:
                 "duration_sec": time.time() - start_time
             }, level="ERROR")
             return None
+    
+    def generate_script(
+        self,
+        ingested_data_json: Dict[str, Any],
+        topic: Optional[str] = None,
+        language: str = None,
+        tone: str = None,
+        summary_target_seconds: int = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate an educational script (blocking wrapper around generate_script_async)
+        """
+        return run_sync(self.generate_script_async(
+            ingested_data_json, topic, language, tone, summary_target_seconds
+        ))
+
+    async def generate_scripts_async(self, items: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Generate several scripts concurrently
+        
+        Args:
+            items: Keyword arguments for generate_script_async, one dict per script
+            
+        Returns:
+            list: One result (or None) per item, in order
+        """
+        return await asyncio.gather(*(self.generate_script_async(**item) for item in items))
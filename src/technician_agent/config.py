@@ -1,11 +1,16 @@
 import os
+import sys
 from pathlib import Path
-from typing import Dict, List, Any
-from src.utils.file_utils import load_json_file
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
+from src.utils.main_config import get_main_config
 
 # Load main configuration
-_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
-_main_config = load_json_file(_CONFIG_PATH)
+_main_config = get_main_config()
+
+def _frozen_lookup(table: Dict[str, Any]) -> Mapping[str, Any]:
+    """Read-only view of a module-name table with interned keys, for identity-fast lookups"""
+    return MappingProxyType({sys.intern(key): value for key, value in table.items()})
 
 class TechnicianConfig:
     """Configuration for the Technician Agent module"""
@@ -17,27 +22,32 @@ class TechnicianConfig:
         self.qc_report_dir = self.base_data_path / "qc_reports"
         self.diagnostic_dir = self.base_data_path / "diagnostics"
         
+        # Log scanning: fan files out to worker processes once this much
+        # unread log data has accumulated
+        self.log_parse_workers = min(os.cpu_count() or 1, 8)
+        self.log_parallel_min_bytes = 32 * 1024 * 1024
+        
         # Thresholds
         self.error_threshold = 3  # Min errors to flag
         self.warning_threshold = 10
         self.performance_threshold = 5.0  # Seconds
         
         # Module alternatives
-        self.tool_alternatives = {
-            "pytesseract": ["google-cloud-vision", "easyocr", "paddleocr"],
-            "ffmpeg": ["opencv", "moviepy"],
-            "manim": ["blender", "after-effects-api"],
-            "whisper": ["google-speech-to-text", "azure-speech"]
-        }
+        self.tool_alternatives = _frozen_lookup({
+            "pytesseract": ("google-cloud-vision", "easyocr", "paddleocr"),
+            "ffmpeg": ("opencv", "moviepy"),
+            "manim": ("blender", "after-effects-api"),
+            "whisper": ("google-speech-to-text", "azure-speech")
+        })
         
         # Performance benchmarks
-        self.expected_timings = {
+        self.expected_timings = _frozen_lookup({
             "ingestion": 30.0,
             "script_generation": 60.0,
             "animation": 120.0,
             "voice_generation": 30.0,
             "video_composition": 60.0
-        }
+        })
         
         # Hardware recommendations
         self.hardware_requirements = {
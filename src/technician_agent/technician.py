@@ -1,14 +1,37 @@
 import os
 import re
+import sys
 import json
+import mmap
+import hashlib
+import functools
 import importlib
+import importlib.util
+import importlib.metadata
+import multiprocessing
 import subprocess
 import platform
 import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import pandas as pd
-from src.utils.logging_utils import setup_logging, log_operation
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.utils import canonicalize_name
+except ImportError:
+    Requirement = None
+
+from src.utils.logging_utils import setup_logging, log_operation, flush_logs
+from src.utils.inflate_logs import module_name as nlog_module_name, read_records
 from src.utils.file_utils import (
     create_directory_if_not_exists,
     save_json_file,
@@ -20,6 +43,321 @@ from .config import config
 # Initialize logging
 logger = setup_logging("technician_agent")
 
+# Markers _parse_log_file collects: a structured ERROR/WARNING level or a
+# duration_sec timing field. Log context is compact JSON when written with
+# orjson and uses ", "/": " separators with stdlib json, so both are accepted
+_LEVEL_PREFIX = b'"level":'
+_LEVEL_RE = re.compile(rb'"level": ?"(ERROR|WARNING)"')
+
+def _find_level(data, pos: int, end: int) -> Tuple[int, Optional[bytes]]:
+    """Locate the next ERROR/WARNING level marker in data[pos:end] as (index, level), or (-1, None)"""
+    while True:
+        index = data.find(_LEVEL_PREFIX, pos, end)
+        if index == -1:
+            return -1, None
+        match = _LEVEL_RE.match(data, index, end)
+        if match:
+            return index, match.group(1)
+        pos = index + 1
+
+def _parse_log_file(log_path: Path, offset: int = 0) -> Tuple[Dict[str, Any], int]:
+    """
+    Parse a single log file for errors and warnings
+    
+    Module-level so analyze_logs can fan files out to worker processes.
+    
+    Args:
+        log_path: Path to the log file
+        offset: Byte offset to start reading from (0 for the whole file)
+        
+    Returns:
+        tuple: (parsed log data, byte offset of the end of the parsed data)
+    """
+    # Performance samples are kept column-wise (one list per field) so
+    # _analyze_performance can hand them to pandas without per-row dicts
+    modules, operations, durations = [], [], []
+    log_data = {
+        "errors": [],
+        "warnings": Counter(),  # Repeated warnings collapse to a count
+        "performance": {"module": modules, "operation": operations, "duration": durations}
+    }
+    
+    try:
+        with open(log_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # A file smaller than the offset was rotated; start over
+            if offset > size:
+                offset = 0
+            if offset == size:
+                return log_data, offset
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Leave a partially written last line for the next scan
+                end = mm.rfind(b"\n", offset) + 1
+                pos = offset
+                # Next ERROR/WARNING level and duration_sec positions (-1: none
+                # left, -2: not searched yet). Literal finds skip unmarked data
+                # much faster than a regex, and each is only repeated once the
+                # scan has passed it
+                level_at, level = -2, None
+                duration_at = -2
+                while pos < end:
+                    if level_at != -1 and level_at < pos:
+                        level_at, level = _find_level(mm, pos, end)
+                    if duration_at != -1 and duration_at < pos:
+                        duration_at = mm.find(b"duration_sec", pos, end)
+                    if level_at == -1 and duration_at == -1:
+                        break  # Nothing left to collect
+                    
+                    # Copy out only the line holding the first marker
+                    marker = min(at for at in (level_at, duration_at) if at != -1)
+                    line_start = max(mm.rfind(b"\n", pos, marker) + 1, pos)
+                    line_end = mm.find(b"\n", marker, end)
+                    pos = offset = line_end + 1
+                    line = mm[line_start:line_end]
+                    line_level = level if -1 < level_at < line_end else None
+                    has_duration = -1 < duration_at < line_end
+                    
+                    # The JSON metadata follows the last '|'; decoded at most once
+                    payload = line.rsplit(b'|', 1)[-1]
+                    parsed = None
+                    if line_level == b"ERROR":
+                        try:
+                            parsed = _json_loads(payload)
+                            log_data["errors"].append({
+                                "module": parsed.get("name", "unknown"),
+                                "message": parsed.get("error", "unknown"),
+                                "timestamp": parsed.get("timestamp", "")
+                            })
+                        except ValueError:  # json.JSONDecodeError, orjson.JSONDecodeError
+                            log_data["errors"].append({
+                                "module": "unknown",
+                                "message": line.decode('utf-8', errors='replace').strip(),
+                                "timestamp": ""
+                            })
+                    elif line_level == b"WARNING":
+                        log_data["warnings"][line.decode('utf-8', errors='replace').strip()] += 1
+                    
+                    # Extract performance data
+                    if has_duration:
+                        try:
+                            perf_data = parsed if parsed is not None else _json_loads(payload)
+                            if "duration_sec" in perf_data:
+                                # Module names are a small closed set; interning them
+                                # shares one string per name across all samples
+                                modules.append(sys.intern(str(perf_data.get("name", "unknown"))))
+                                operations.append(perf_data.get("operation", "unknown"))
+                                durations.append(perf_data.get("duration_sec", 0))
+                        except ValueError:  # json.JSONDecodeError, orjson.JSONDecodeError
+                            continue
+                offset = max(offset, end)
+    except Exception as e:
+        logger.error(f"Failed to parse log file {log_path}: {str(e)}")
+        
+    return log_data, offset
+
+def _parse_nlog_file(log_path: Path, offset: int = 0) -> Tuple[Dict[str, Any], int]:
+    """
+    Collect performance samples from a binary operation log (.nlog)
+    
+    With LOG_BINARY_OPERATIONS only operation records below WARNING go to
+    .nlog files, so errors and warnings are still found in the text logs.
+    
+    Args:
+        log_path: Path to the .nlog file
+        offset: Byte offset to start reading from (0 for the whole file)
+        
+    Returns:
+        tuple: (parsed log data, byte offset of the end of the parsed data)
+    """
+    modules, operations, durations = [], [], []
+    log_data = {
+        "errors": [],
+        "warnings": Counter(),
+        "performance": {"module": modules, "operation": operations, "duration": durations}
+    }
+    try:
+        records, offset = read_records(Path(log_path), offset)
+    except Exception as e:
+        logger.error(f"Failed to parse log file {log_path}: {str(e)}")
+        return log_data, offset
+    
+    default_module = sys.intern(nlog_module_name(Path(log_path)))
+    for record in records:
+        if "duration_sec" in record:
+            name = record.get("name")
+            modules.append(sys.intern(str(name)) if name else default_module)
+            operations.append(record["operation"])
+            durations.append(record["duration_sec"])
+    return log_data, offset
+
+def _findings_bytes(findings: Dict[str, Any]) -> bytes:
+    """Canonical (key-sorted) JSON encoding of the findings, for change detection"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(findings, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(findings, sort_keys=True, default=str).encode("utf-8")
+
+def _list_files(directory: Path, suffix: str) -> List[os.DirEntry]:
+    """
+    List the files in a directory ending with `suffix` (empty if the directory is missing)
+    
+    os.scandir yields the entry type from the directory listing itself, so
+    unlike Path.glob no per-entry stat or Path object is needed.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(suffix) and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
+@functools.lru_cache(maxsize=256)
+def _qc_summary(path: str, mtime_ns: int, size: int) -> Tuple[Optional[str], int, float]:
+    """
+    (status, critical_issues, overall_score) of a QC report
+    
+    Cached on (path, mtime, size) like load_json_file_cached, but only these
+    fields are kept, not the whole report.
+    """
+    summary = load_json_file(path).get("summary", {})
+    return (
+        summary.get("status"),
+        summary.get("critical_issues", 0),
+        summary.get("overall_score", 0)
+    )
+
+def _parse_log_files(log_files: List[os.DirEntry], offsets: List[int]) -> List[Tuple[Dict[str, Any], int]]:
+    """
+    Parse log files, across worker processes when there is enough new data
+    
+    Spawning workers costs more than scanning a few MB, so small scans
+    (the usual incremental case) stay in-process.
+    
+    Args:
+        log_files: Directory entries of the log files to parse
+        offsets: Byte offset to resume each file from
+        
+    Returns:
+        list: (parsed log data, end offset) per file, in input order
+    """
+    pending = 0
+    for log_file, offset in zip(log_files, offsets):
+        try:
+            pending += max(log_file.stat().st_size - offset, 0)
+        except OSError:
+            continue
+    log_paths = [log_file.path for log_file in log_files]
+    workers = min(config.log_parse_workers, len(log_files))
+    if workers < 2 or pending < config.log_parallel_min_bytes:
+        return [_parse_log_file(log_path, offset) for log_path, offset in zip(log_paths, offsets)]
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return list(executor.map(_parse_log_file, log_paths, offsets))
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> Tuple[Tuple[str, str], ...]:
+    """Static platform details (platform.processor() may fork a subprocess)"""
+    return (
+        ("os", platform.system()),
+        ("os_version", platform.version()),
+        ("processor", platform.processor()),
+        ("python_version", platform.python_version())
+    )
+
+def _dependency_conflicts() -> List[str]:
+    """
+    List unsatisfied requirements of installed distributions, worded like `pip check`
+    
+    Resolved in-process from importlib.metadata when `packaging` is available;
+    otherwise falls back to running pip check in a subprocess.
+    """
+    if Requirement is None:
+        result = subprocess.run(
+            [sys.executable, "-m", "pip", "check"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            check=False
+        )
+        if result.returncode == 0:
+            return []
+        # pip check reports conflicts on stdout; stderr carries pip's own errors
+        return [line.strip() for line in (result.stdout or result.stderr).splitlines()]
+    
+    installed = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed.setdefault(canonicalize_name(name), dist)
+    
+    conflicts = []
+    for dist in installed.values():
+        name, version = dist.metadata["Name"], dist.version
+        for requirement_text in dist.requires or ():
+            try:
+                requirement = Requirement(requirement_text)
+            except InvalidRequirement:
+                continue
+            # Skip requirements of extras and of other platforms/Python versions
+            if requirement.marker and not requirement.marker.evaluate({"extra": ""}):
+                continue
+            dependency = installed.get(canonicalize_name(requirement.name))
+            if dependency is None:
+                conflicts.append(f"{name} {version} requires {requirement.name}, which is not installed.")
+            elif not requirement.specifier.contains(dependency.version, prereleases=True):
+                conflicts.append(
+                    f"{name} {version} has requirement {requirement}, "
+                    f"but you have {requirement.name} {dependency.version}."
+                )
+    return conflicts
+
+@functools.lru_cache(maxsize=1)
+def _dependency_issues(environment: Tuple[str, Optional[str]]) -> Tuple[Dict[str, Any], ...]:
+    """
+    Find missing tool modules and pip conflicts in the running environment
+    
+    Installed packages rarely change within a process, so the result is
+    cached per environment (sys.prefix, VIRTUAL_ENV); callers get copies.
+    """
+    issues = []
+    required_modules = [
+        "pytesseract", "ffmpeg", "manimgl", "whisper",
+        "openai", "elevenlabs", "svgwrite"
+    ]
+    
+    # Only presence matters, so locate each module without executing it
+    for module in required_modules:
+        try:
+            found = importlib.util.find_spec(module) is not None
+            message = f"No module named '{module}'"
+        except (ImportError, ValueError) as e:
+            found, message = False, str(e)
+        if not found:
+            issues.append({
+                "module": module,
+                "issue": "missing",
+                "message": message,
+                "alternatives": config.tool_alternatives.get(module, ())
+            })
+    
+    # Check pip conflicts
+    try:
+        for line in _dependency_conflicts():
+            issues.append({
+                "module": "pip_conflict",
+                "issue": "dependency_conflict",
+                "message": line,
+                "alternatives": []
+            })
+    except Exception as e:
+        logger.error(f"Failed to check dependency conflicts: {str(e)}")
+        
+    return tuple(issues)
+
 class TechnicianAgent:
     """Self-aware system maintenance and optimization agent"""
     
@@ -31,132 +369,76 @@ class TechnicianAgent:
             "warnings": [],
             "performance_issues": [],
             "dependency_issues": [],
+            "qc_issues": [],
             "hardware_issues": []
         }
+        # End offset of each log file as of the last analyze_logs call
+        self.log_offsets: Dict[str, int] = {}
+        # Bumped whenever analyze_logs replaces the findings; suggestions
+        # are rebuilt only when it has moved
+        self._findings_version = 0
+        self._suggestions: Optional[Tuple[int, Dict[str, Any]]] = None
         logger.info("Technician Agent initialized")
         
     def _generate_system_report(self) -> Dict[str, Any]:
         """Generate system hardware and software report"""
         return {
-            "system": {
-                "os": platform.system(),
-                "os_version": platform.version(),
-                "processor": platform.processor(),
-                "python_version": platform.python_version()
-            },
+            "system": dict(_platform_info()),
             "timings": {},
             "resource_usage": {}  # Placeholder for actual monitoring
         }
     
-    def _parse_log_file(self, log_path: Path) -> Dict[str, Any]:
-        """Parse a single log file for errors and warnings"""
-        log_data = {
-            "errors": [],
-            "warnings": [],
-            "performance": []
-        }
-        
-        try:
-            with open(log_path, 'r') as f:
-                for line in f:
-                    if '"level": "ERROR"' in line:
-                        try:
-                            error_data = json.loads(line.split('|')[-1])
-                            log_data["errors"].append({
-                                "module": error_data.get("name", "unknown"),
-                                "message": error_data.get("error", "unknown"),
-                                "timestamp": error_data.get("timestamp", "")
-                            })
-                        except json.JSONDecodeError:
-                            log_data["errors"].append({
-                                "module": "unknown",
-                                "message": line.strip(),
-                                "timestamp": ""
-                            })
-                    elif '"level": "WARNING"' in line:
-                        log_data["warnings"].append(line.strip())
-                    
-                    # Extract performance data
-                    if "duration_sec" in line:
-                        try:
-                            perf_data = json.loads(line.split('|')[-1])
-                            if "duration_sec" in perf_data:
-                                log_data["performance"].append({
-                                    "module": perf_data.get("name", "unknown"),
-                                    "operation": perf_data.get("operation", "unknown"),
-                                    "duration": perf_data.get("duration_sec", 0)
-                                })
-                        except json.JSONDecodeError:
-                            continue
-        except Exception as e:
-            logger.error(f"Failed to parse log file {log_path}: {str(e)}")
-            
-        return log_data
-    
-    def _check_dependencies(self) -> List[Dict[str, str]]:
-        """Check for missing or broken dependencies"""
-        issues = []
-        required_modules = [
-            "pytesseract", "ffmpeg", "manimgl", "whisper",
-            "openai", "elevenlabs", "svgwrite"
-        ]
-        
-        for module in required_modules:
-            try:
-                importlib.import_module(module)
-            except ImportError as e:
-                issues.append({
-                    "module": module,
-                    "issue": "missing",
-                    "message": str(e),
-                    "alternatives": config.tool_alternatives.get(module, [])
-                })
+    def _check_dependencies(self, refresh: bool = False) -> List[Dict[str, str]]:
+        """
+        Check for missing or broken dependencies
         
-        # Check pip conflicts
-        try:
-            result = subprocess.run(
-                ["pip", "check"],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode != 0:
-                for line in result.stderr.splitlines():
-                    issues.append({
-                        "module": "pip_conflict",
-                        "issue": "dependency_conflict",
-                        "message": line.strip(),
-                        "alternatives": []
-                    })
-        except Exception as e:
-            logger.error(f"Failed to run pip check: {str(e)}")
+        Args:
+            refresh: Re-run the checks instead of using this environment's cached result
             
-        return issues
+        Returns:
+            list: Dependency issues
+        """
+        if refresh:
+            _dependency_issues.cache_clear()
+            importlib.invalidate_caches()  # Let find_spec see newly installed packages
+        environment = (sys.prefix, os.environ.get("VIRTUAL_ENV"))
+        return [dict(issue) for issue in _dependency_issues(environment)]
     
     def _analyze_performance(self, log_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Analyze performance against expected benchmarks"""
         issues = []
         
         # Group performance data by module
-        perf_df = pd.DataFrame(log_data["performance"])
-        if not perf_df.empty:
+        performance = log_data["performance"]
+        if performance["duration"]:
+            # Imported here so agents that never analyze logs don't pay for pandas
+            import pandas as pd
+            perf_df = pd.DataFrame(
+                {"module": performance["module"], "duration": performance["duration"]},
+                copy=False
+            )
             avg_times = perf_df.groupby("module")["duration"].mean()
             
-            for module, avg_time in avg_times.items():
-                expected = config.expected_timings.get(module, 0)
-                if expected and avg_time > expected * 1.5:  # 50% over expected
-                    issues.append({
-                        "module": module,
-                        "actual_time": avg_time,
-                        "expected_time": expected,
-                        "issue": "performance_bottleneck"
-                    })
+            # Compare every module with its benchmark at once; modules
+            # without one (expected 0) are never flagged
+            expected = avg_times.index.map(config.expected_timings).fillna(0).to_numpy(dtype=float)
+            actual = avg_times.to_numpy(dtype=float)
+            over = (expected > 0) & (actual > expected * 1.5)  # 50% over expected
+            for module, avg_time, expected_time in zip(avg_times.index[over], actual[over], expected[over]):
+                issues.append({
+                    "module": module,
+                    "actual_time": float(avg_time),
+                    "expected_time": float(expected_time),
+                    "issue": "performance_bottleneck"
+                })
         
         return issues
     
     def analyze_logs(
         self,
         log_directory: Path = None,
-        qc_report_directory: Path = None
+        qc_report_directory: Path = None,
+        since: Optional[Dict[str, int]] = None
     ) -> Dict[str, Any]:
         """
         Analyze system logs and QC reports for issues
@@ -164,6 +446,8 @@ class TechnicianAgent:
         Args:
             log_directory: Directory containing log files
             qc_report_directory: Directory containing QC reports
+            since: Optional byte offsets per log file name from a previous scan;
+                only the data appended after each offset is analyzed
             
         Returns:
             dict: Analysis results with found issues
@@ -172,6 +456,10 @@ class TechnicianAgent:
         log_directory = log_directory or config.log_dir
         qc_report_directory = qc_report_directory or config.qc_report_dir
         
+        # This process's own buffered records must be on disk before the scan,
+        # or the saved offsets would move past records never analyzed
+        flush_logs()
+        
         log_operation(logger, "analyze_logs", "started", {
             "log_dir": str(log_directory),
             "qc_dir": str(qc_report_directory)
@@ -179,41 +467,64 @@ class TechnicianAgent:
         
         try:
             # Process log files
-            all_log_data = {"errors": [], "warnings": [], "performance": []}
-            for log_file in log_directory.glob("*.log"):
-                log_data = self._parse_log_file(log_file)
+            all_log_data = {
+                "errors": [],
+                "warnings": Counter(),
+                "performance": {"module": [], "operation": [], "duration": []}
+            }
+            since = since or {}
+            log_files = _list_files(log_directory, ".log")
+            offsets = [since.get(log_file.name, 0) for log_file in log_files]
+            parsed = _parse_log_files(log_files, offsets)
+            # Binary operation logs (LOG_BINARY_OPERATIONS) hold the timings
+            # that no longer reach the text logs
+            nlog_files = _list_files(log_directory, ".nlog")
+            log_files += nlog_files
+            parsed += [
+                _parse_nlog_file(nlog_file.path, since.get(nlog_file.name, 0))
+                for nlog_file in nlog_files
+            ]
+            for log_file, (log_data, offset) in zip(log_files, parsed):
+                self.log_offsets[log_file.name] = offset
                 all_log_data["errors"].extend(log_data["errors"])
-                all_log_data["warnings"].extend(log_data["warnings"])
-                all_log_data["performance"].extend(log_data["performance"])
+                all_log_data["warnings"].update(log_data["warnings"])
+                for column, values in log_data["performance"].items():
+                    all_log_data["performance"][column].extend(values)
             
             # Process QC reports
             qc_issues = []
-            for qc_file in qc_report_directory.glob("*.json"):
+            for qc_file in _list_files(qc_report_directory, ".json"):
                 try:
-                    report = load_json_file(qc_file)
-                    if report.get("summary", {}).get("status") == "needs_revision":
+                    stat = qc_file.stat()
+                    status, critical_issues, score = _qc_summary(qc_file.path, stat.st_mtime_ns, stat.st_size)
+                    if status == "needs_revision":
                         qc_issues.append({
-                            "source": qc_file.stem,
-                            "issues": report["summary"].get("critical_issues", 0),
-                            "score": report["summary"].get("overall_score", 0)
+                            "source": os.path.splitext(qc_file.name)[0],
+                            "issues": critical_issues,
+                            "score": score
                         })
                 except Exception as e:
-                    logger.warning(f"Failed to process QC report {qc_file}: {str(e)}")
+                    logger.warning(f"Failed to process QC report {qc_file.path}: {str(e)}")
             
             # Analyze findings
             self.findings["errors"] = all_log_data["errors"]
-            self.findings["warnings"] = all_log_data["warnings"]
+            self.findings["warnings"] = [
+                f"{message} (x{count})" if count > 1 else message
+                for message, count in all_log_data["warnings"].items()
+            ]
             self.findings["performance_issues"] = self._analyze_performance(all_log_data)
             self.findings["dependency_issues"] = self._check_dependencies()
             self.findings["qc_issues"] = qc_issues
             
             # Check hardware (placeholder)
             self.findings["hardware_issues"] = self._check_hardware()
+            self._findings_version += 1
             
             duration = time.time() - start_time
             log_operation(logger, "analyze_logs", "completed", {
                 "errors_found": len(self.findings["errors"]),
-                "warnings_found": len(self.findings["warnings"]),
+                "warnings_found": sum(all_log_data["warnings"].values()),
+                "unique_warnings": len(self.findings["warnings"]),
                 "performance_issues": len(self.findings["performance_issues"]),
                 "duration_sec": duration
             })
@@ -244,9 +555,15 @@ class TechnicianAgent:
         """
         Generate improvement suggestions based on analysis
         
+        The result is reused until the next analyze_logs call and should be
+        treated as read-only.
+        
         Returns:
             dict: Suggested improvements and alternatives
         """
+        if self._suggestions is not None and self._suggestions[0] == self._findings_version:
+            return self._suggestions[1]
+        
         suggestions = {
             "critical": [],
             "recommended": [],
@@ -270,7 +587,7 @@ class TechnicianAgent:
         
         # Performance issues
         for issue in self.findings["performance_issues"]:
-            alternatives = config.tool_alternatives.get(issue["module"], [])
+            alternatives = config.tool_alternatives.get(issue["module"], ())
             suggestion = {
                 "action": f"Optimize {issue['module']} (took {issue['actual_time']:.1f}s, expected {issue['expected_time']:.1f}s)",
                 "alternatives": alternatives
@@ -291,6 +608,7 @@ class TechnicianAgent:
                     "alternatives": []
                 })
         
+        self._suggestions = (self._findings_version, suggestions)
         return suggestions
     
     def perform_maintenance_actions(self) -> Dict[str, Any]:
@@ -337,19 +655,34 @@ class TechnicianAgent:
         """
         log_path = config.diagnostic_dir / "diagnostic.log"
         md_path = config.diagnostic_dir / "upgrade_plan.md"
+        hash_path = config.diagnostic_dir / ".report.sha256"
         
-        # Save raw diagnostic data
-        save_json_file(self.findings, log_path)
+        md_content = self._generate_markdown_report(self.suggest_improvements())
         
-        # Generate human-readable markdown report
-        md_content = self._generate_markdown_report()
-        save_text_file(md_content, md_path)
+        # Skip both writes when the findings and report body match the last
+        # run; the "Generated:" timestamp line is left out of the digest
+        title, _, body = md_content.split("\n", 2)
+        digest = hashlib.sha256(_findings_bytes(self.findings))
+        digest.update(f"{title}\n{body}".encode("utf-8"))
+        report_hash = digest.hexdigest()
+        try:
+            previous_hash = hash_path.read_text(encoding="utf-8").strip()
+        except OSError:
+            previous_hash = None
+        if previous_hash == report_hash and log_path.exists() and md_path.exists():
+            logger.debug("Diagnostic report unchanged, skipping write")
+            return (log_path, md_path)
+        
+        # Save raw diagnostic data and the human-readable markdown report
+        if save_json_file(self.findings, log_path) and save_text_file(md_content, md_path):
+            save_text_file(report_hash, hash_path)
         
         return (log_path, md_path)
     
-    def _generate_markdown_report(self) -> str:
-        """Generate markdown format upgrade plan"""
-        suggestions = self.suggest_improvements()
+    def _generate_markdown_report(self, suggestions: Optional[Dict[str, Any]] = None) -> str:
+        """Generate markdown format upgrade plan from suggest_improvements() output"""
+        if suggestions is None:
+            suggestions = self.suggest_improvements()
         
         md_lines = [
             "# AutoEd System Upgrade Plan",
@@ -1,11 +1,10 @@
 import os
 from pathlib import Path
 from typing import Dict, Any
-from src.utils.file_utils import load_json_file
+from src.utils.main_config import get_main_config
 
 # Load main configuration
-_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
-_main_config = load_json_file(_CONFIG_PATH)
+_main_config = get_main_config()
 
 class UploaderConfig:
     """Configuration for the Uploader module"""
@@ -15,6 +14,16 @@ class UploaderConfig:
         self.base_data_path = Path(_main_config["base_settings"]["base_data_path"])
         self.output_dir = self.base_data_path / _main_config["paths"]["final_videos_dir"]
         self.log_dir = self.base_data_path / "logs"
+        # OAuth token saved after the first authorization (owner-readable only)
+        self.youtube_token_path = self.base_data_path / "credentials" / "youtube_token.json"
+        
+        # Platforms targeted when none are specified
+        self.default_platforms = ["youtube", "tiktok", "instagram"]
+        
+        # Retry policy shared by all platforms: backoff cap in seconds and
+        # HTTP statuses that fail immediately instead of being retried
+        self.retry_max_delay = 60
+        self.non_retryable_statuses = frozenset({400, 401, 403, 404})
         
         # Platform settings
         self.platforms = {
@@ -25,7 +34,8 @@ class UploaderConfig:
                 "default_privacy": "private",
                 "max_retries": 5,
                 "retry_delay": 5,
-                "chunk_size": 1024 * 1024 * 10,  # 10MB chunks
+                "chunk_size": 64 * 1024 * 1024,  # 64MiB chunks (multiple of 256KiB)
+                "single_request_max_bytes": 100 * 1024 * 1024,  # Smaller videos skip chunking
                 "timeout": 30
             },
             "tiktok": {
@@ -1,13 +1,22 @@
 import os
+import mmap
 import time
-import json
+import random
+import asyncio
+import threading
+import contextlib
 import requests
 from pathlib import Path
 from typing import Optional, Dict, Any
+import httplib2
+from google.auth.exceptions import RefreshError
+from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaFileUpload, MediaUpload
 from src.utils.logging_utils import setup_logging, log_operation
 from src.utils.file_utils import (
     create_directory_if_not_exists,
@@ -25,30 +34,124 @@ from src.utils.api_keys import (
 # Initialize logging
 logger = setup_logging("uploader")
 
+YOUTUBE_SCOPES = ["https://www.googleapis.com/auth/youtube.upload"]
+
+class MmapMediaUpload(MediaUpload):
+    """
+    Resumable upload body served straight from a read-only mmap of the video.
+    
+    getbytes hands out memoryview slices of the mapping, so each chunk goes
+    from the page cache to the socket without being copied into a Python
+    bytes object first.
+    """
+    
+    def __init__(self, mapped: mmap.mmap, mimetype: str, chunksize: int, resumable: bool = True):
+        super().__init__()
+        self._mapped = mapped
+        self._mimetype = mimetype
+        self._chunksize = chunksize
+        self._resumable = resumable
+    
+    def chunksize(self) -> int:
+        return self._chunksize
+    
+    def mimetype(self) -> str:
+        return self._mimetype
+    
+    def size(self) -> int:
+        return len(self._mapped)
+    
+    def resumable(self) -> bool:
+        return self._resumable
+    
+    def getbytes(self, begin: int, length: int) -> memoryview:
+        """Slice of the mapping; a negative length means through the end (single-request uploads)"""
+        end = len(self._mapped) if length < 0 else begin + length
+        return memoryview(self._mapped)[begin:end]
+    
+    def has_stream(self) -> bool:
+        return False
+
+@contextlib.contextmanager
+def _map_video(video_path: Path):
+    """
+    Map a video file read-only for the duration of a multi-platform upload.
+    
+    Every platform reads from the same mapping, so the file occupies a single
+    set of page-cache pages instead of one in-memory copy per platform.
+    Yields None if the file cannot be mapped (e.g. it is empty).
+    """
+    mapped = None
+    try:
+        with open(video_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            # Uploads read front to back; let the kernel read ahead aggressively
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not map {video_path}, uploads will read it from disk: {str(e)}")
+    
+    try:
+        yield mapped
+    finally:
+        if mapped is not None:
+            try:
+                mapped.close()
+            except BufferError:
+                # A chunk view is still referenced (e.g. by a traceback);
+                # the mapping is released when the last view is collected
+                pass
+
+def _is_retryable(error: Exception) -> bool:
+    """False for HTTP client errors (bad request, auth, permission, not found) that retrying can't fix"""
+    if isinstance(error, HttpError):
+        status = error.resp.status
+    elif isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+    else:
+        return True
+    return status not in config.non_retryable_statuses
+
 class Uploader:
     """Core class for uploading videos to multiple platforms"""
     
     def __init__(self):
         create_directory_if_not_exists(config.log_dir)
         self.youtube_service = None
+        self._youtube_lock = threading.Lock()
+        
+        # Platform name -> upload method; add an entry here to support a new platform
+        self._dispatch = {
+            "youtube": self.upload_to_youtube,
+            "tiktok": self.upload_to_tiktok,
+            "instagram": self.upload_to_instagram_reels
+        }
         logger.info("Uploader initialized")
         
     def _get_youtube_service(self):
         """Initialize YouTube API service with OAuth"""
         if self.youtube_service:
             return self.youtube_service
-            
+        
+        # Concurrent uploads must not each start their own OAuth flow
+        with self._youtube_lock:
+            if self.youtube_service:
+                return self.youtube_service
+            return self._build_youtube_service()
+    
+    def _build_youtube_service(self):
+        """Build the YouTube client on stored or fresh credentials (caller holds _youtube_lock)"""
         try:
-            # Note: In production, you would store and reuse credentials
-            flow = InstalledAppFlow.from_client_secrets_file(
-                YOUTUBE_CLIENT_SECRETS,
-                scopes=["https://www.googleapis.com/auth/youtube.upload"]
+            credentials = self._load_youtube_credentials()
+            # One authorized keep-alive transport for every request and upload chunk
+            http = AuthorizedHttp(
+                credentials,
+                http=httplib2.Http(timeout=config.platforms["youtube"]["timeout"])
             )
-            credentials = flow.run_local_server(port=8080)
             self.youtube_service = build(
                 "youtube",
                 "v3",
-                credentials=credentials,
+                http=http,
                 cache_discovery=False
             )
             return self.youtube_service
@@ -56,26 +159,73 @@ class Uploader:
             logger.error(f"YouTube OAuth failed: {str(e)}")
             return None
     
+    def _load_youtube_credentials(self) -> Credentials:
+        """
+        Reuse the stored YouTube token, refreshing it if expired
+        
+        The interactive OAuth flow only runs when there is no usable token;
+        its result is saved for later runs.
+        
+        Returns:
+            Credentials: Valid OAuth credentials
+        """
+        token_path = config.youtube_token_path
+        credentials = None
+        if token_path.exists():
+            try:
+                credentials = Credentials.from_authorized_user_file(str(token_path), YOUTUBE_SCOPES)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable YouTube token {token_path}: {str(e)}")
+        
+        if credentials and credentials.expired and credentials.refresh_token:
+            try:
+                credentials.refresh(Request())
+            except RefreshError as e:
+                logger.warning(f"YouTube token refresh failed, re-authorizing: {str(e)}")
+                credentials = None
+        
+        if not credentials or not credentials.valid:
+            flow = InstalledAppFlow.from_client_secrets_file(YOUTUBE_CLIENT_SECRETS, scopes=YOUTUBE_SCOPES)
+            credentials = flow.run_local_server(port=8080)
+        
+        # Save the (possibly refreshed) token, readable by the owner only
+        try:
+            create_directory_if_not_exists(token_path.parent)
+            fd = os.open(token_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(credentials.to_json())
+        except OSError as e:
+            logger.warning(f"Could not save YouTube token to {token_path}: {str(e)}")
+        return credentials
+    
     def _generate_metadata(self, platform: str, script_json: Dict[str, Any]) -> Dict[str, Any]:
         """Generate platform-specific metadata from script"""
         template = config.metadata_templates.get(platform, {})
         content_attrs = script_json.get("metadata", {}).get("content_attributes", {})
         
+        # Placeholder values are computed once and shared by every template field
+        format_context = {
+            "topic": content_attrs.get("topic", "Educational Content"),
+            "summary": content_attrs.get("summary", "Automatically generated educational content"),
+            "keywords": ", ".join(content_attrs.get("keywords", ()))
+        }
+        
         metadata = {}
         for key, value in template.items():
             if isinstance(value, str):
-                metadata[key] = value.format(
-                    topic=content_attrs.get("topic", "Educational Content"),
-                    summary=content_attrs.get("summary", "Automatically generated educational content"),
-                    keywords=", ".join(content_attrs.get("keywords", []))
-                )
+                metadata[key] = value.format_map(format_context)
             else:
                 metadata[key] = value
                 
         return metadata
     
     def _retry_upload(self, platform: str, func, *args, **kwargs) -> Optional[Dict[str, Any]]:
-        """Wrapper for retry logic with exponential backoff"""
+        """
+        Wrapper for retry logic with capped, jittered exponential backoff
+        
+        Client errors that cannot succeed on retry (see _is_retryable) are
+        raised immediately.
+        """
         max_retries = config.platforms[platform]["max_retries"]
         base_delay = config.platforms[platform]["retry_delay"]
         
@@ -83,13 +233,14 @@ class Uploader:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                if attempt == max_retries - 1:
+                if attempt == max_retries - 1 or not _is_retryable(e):
                     raise
                 
-                delay = base_delay * (2 ** attempt)
+                # Jitter keeps concurrent uploads from retrying in lockstep
+                delay = min(config.retry_max_delay, base_delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
                 logger.warning(
                     f"Upload attempt {attempt + 1} failed for {platform}. "
-                    f"Retrying in {delay} seconds. Error: {str(e)}"
+                    f"Retrying in {delay:.1f} seconds. Error: {str(e)}"
                 )
                 time.sleep(delay)
     
@@ -99,7 +250,8 @@ class Uploader:
         script_json: Dict[str, Any],
         category_id: str = None,
         tags: list = None,
-        privacy_status: str = None
+        privacy_status: str = None,
+        video_data: Optional[mmap.mmap] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Upload video to YouTube
@@ -110,6 +262,7 @@ class Uploader:
             category_id: YouTube category ID
             tags: List of tags
             privacy_status: 'public', 'private', or 'unlisted'
+            video_data: Optional read-only mapping of the video file to upload from
             
         Returns:
             dict: YouTube API response, or None if failed
@@ -145,20 +298,44 @@ class Uploader:
                 }
             }
             
-            # Create media upload
-            media = MediaFileUpload(
-                str(video_path),
-                chunksize=config.platforms["youtube"]["chunk_size"],
-                resumable=True
+            # Create media upload, streaming chunks from the shared mapping when available.
+            # Videos up to single_request_max_bytes go up in one request (chunksize -1);
+            # larger ones in big chunks so per-request overhead is amortized
+            youtube_config = config.platforms["youtube"]
+            file_size = len(video_data) if video_data is not None else get_file_size(video_path)
+            if file_size is not None and file_size <= youtube_config["single_request_max_bytes"]:
+                chunk_size = -1
+            else:
+                chunk_size = youtube_config["chunk_size"]
+            if video_data is not None:
+                media = MmapMediaUpload(
+                    video_data,
+                    mimetype="video/mp4",
+                    chunksize=chunk_size,
+                    resumable=True
+                )
+            else:
+                media = MediaFileUpload(
+                    str(video_path),
+                    chunksize=chunk_size,
+                    resumable=True
+                )
+            
+            # Execute upload with retry; the request is resumable, so a retry
+            # continues from the last chunk the server acknowledged
+            request = youtube.videos().insert(
+                part=",".join(body.keys()),
+                body=body,
+                media_body=media
             )
             
-            # Execute upload with retry
             def _upload():
-                return youtube.videos().insert(
-                    part=",".join(body.keys()),
-                    body=body,
-                    media_body=media
-                ).execute()
+                response = None
+                while response is None:
+                    status, response = request.next_chunk()
+                    if status:
+                        logger.debug("YouTube upload %d%% complete", int(status.progress() * 100))
+                return response
             
             response = self._retry_upload("youtube", _upload)
             
@@ -181,7 +358,8 @@ class Uploader:
     def upload_to_tiktok(
         self,
         video_path: Path,
-        script_json: Dict[str, Any]
+        script_json: Dict[str, Any],
+        video_data: Optional[mmap.mmap] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Upload video to TikTok
@@ -189,6 +367,7 @@ class Uploader:
         Args:
             video_path: Path to video file
             script_json: Script data for metadata
+            video_data: Optional read-only mapping of the video file to upload from
             
         Returns:
             dict: TikTok API response, or None if failed
@@ -233,7 +412,8 @@ class Uploader:
     def upload_to_instagram_reels(
         self,
         video_path: Path,
-        script_json: Dict[str, Any]
+        script_json: Dict[str, Any],
+        video_data: Optional[mmap.mmap] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Upload video to Instagram Reels
@@ -241,6 +421,7 @@ class Uploader:
         Args:
             video_path: Path to video file
             script_json: Script data for metadata
+            video_data: Optional read-only mapping of the video file to upload from
             
         Returns:
             dict: Instagram API response, or None if failed
@@ -294,7 +475,8 @@ class Uploader:
         platforms: list = None
     ) -> Dict[str, Optional[Dict[str, Any]]]:
         """
-        Upload video to all configured platforms
+        Upload video to all configured platforms (blocking wrapper around
+        upload_all_platforms_async; from a coroutine use that instead)
         
         Args:
             video_path: Path to video file
@@ -302,21 +484,62 @@ class Uploader:
             platforms: List of platforms to upload to (default: all)
             
         Returns:
-            dict: Results from each platform's upload
+            dict: Results from each platform's upload (None for failed uploads)
         """
-        if not platforms:
-            platforms = ["youtube", "tiktok", "instagram"]
+        return asyncio.run(self.upload_all_platforms_async(video_path, script_json, platforms))
+    
+    async def upload_all_platforms_async(
+        self,
+        video_path: Path,
+        script_json: Dict[str, Any],
+        platforms: list = None
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Upload video to all configured platforms concurrently
+        
+        Platform uploads are independent network-bound operations, so each one
+        runs in its own worker thread and the total time is bounded by the
+        slowest platform rather than the sum of all of them.
+        
+        Args:
+            video_path: Path to video file
+            script_json: Script data for metadata
+            platforms: List of platforms to upload to (default: all)
             
+        Returns:
+            dict: Results from each platform's upload (None for failed uploads)
+        """
+        if not platforms:
+            platforms = config.default_platforms
+        
+        with _map_video(video_path) as video_data:
+            responses = await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._upload_one, platform, video_path, script_json, video_data)
+                    for platform in platforms
+                ),
+                return_exceptions=True
+            )
+        
         results = {}
-        for platform in platforms:
-            if platform == "youtube":
-                results["youtube"] = self.upload_to_youtube(video_path, script_json)
-            elif platform == "tiktok":
-                results["tiktok"] = self.upload_to_tiktok(video_path, script_json)
-            elif platform == "instagram":
-                results["instagram"] = self.upload_to_instagram_reels(video_path, script_json)
-            else:
-                logger.warning(f"Unknown platform: {platform}")
-                results[platform] = None
-                
+        for platform, response in zip(platforms, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Upload to {platform} raised: {str(response)}")
+                response = None
+            results[platform] = response
+        
         return results
+    
+    def _upload_one(
+        self,
+        platform: str,
+        video_path: Path,
+        script_json: Dict[str, Any],
+        video_data: Optional[mmap.mmap] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Upload video to a single platform by name"""
+        upload = self._dispatch.get(platform)
+        if upload is None:
+            logger.warning(f"Unknown platform: {platform}")
+            return None
+        return upload(video_path, script_json, video_data=video_data)
@@ -0,0 +1,127 @@
+import json
+import hashlib
+from pathlib import Path
+from typing import Any, Optional, Dict
+from .logging_utils import setup_logging
+from .file_utils import (
+    create_directory_if_not_exists,
+    load_json_file,
+    save_json_file
+)
+
+# Initialize logger for cache operations
+logger = setup_logging("cache_utils")
+
+def hash_file(filepath: str, chunk_size: int = 1024 * 1024) -> Optional[str]:
+    """
+    Compute the SHA-256 digest of a file's contents.
+
+    Args:
+        filepath: Path to the file
+        chunk_size: Bytes read per iteration
+
+    Returns:
+        str: Hex digest, or None if the file could not be read
+    """
+    try:
+        digest = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    except OSError as e:
+        logger.debug(f"Could not hash {filepath}: {str(e)}")
+        return None
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a filesystem-safe cache key from arbitrary parts.
+
+    Args:
+        parts: Values identifying the cached computation
+
+    Returns:
+        str: Hex digest usable as a file name
+    """
+    joined = "\x1f".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha256(joined.encode('utf-8')).hexdigest()
+
+class JsonCache:
+    """Filesystem-backed JSON cache with least-frequently-used eviction"""
+
+    def __init__(self, cache_dir: Path, max_entries: int = 256):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.index_path = self.cache_dir / "_index.json"
+        create_directory_if_not_exists(self.cache_dir)
+
+        # Hit counts per key, used to pick eviction victims
+        self._hits: Dict[str, int] = {}
+        if self.index_path.exists():
+            self._hits = load_json_file(self.index_path) or {}
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                value = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Discarding unreadable cache entry {entry_path}: {str(e)}")
+            self.delete(key)
+            return None
+
+        self._hits[key] = self._hits.get(key, 0) + 1
+        save_json_file(self._hits, self.index_path)
+        logger.debug(f"Cache hit: {key}")
+        return value
+
+    def set(self, key: str, value: Any) -> bool:
+        """
+        Store a value, evicting the least frequently used entries if full.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+
+        Returns:
+            bool: True if the value was stored
+        """
+        if key not in self._hits:
+            self._evict(self.max_entries - 1)
+
+        if not save_json_file(value, self._entry_path(key)):
+            return False
+
+        self._hits.setdefault(key, 0)
+        save_json_file(self._hits, self.index_path)
+        return True
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry from the cache"""
+        self._entry_path(key).unlink(missing_ok=True)
+        self._hits.pop(key, None)
+
+    def _evict(self, keep: int) -> None:
+        """Drop least frequently used entries until at most `keep` remain"""
+        excess = len(self._hits) - max(keep, 0)
+        if excess <= 0:
+            return
+
+        victims = sorted(self._hits, key=self._hits.get)[:excess]
+        for key in victims:
+            self.delete(key)
+        logger.info(f"Evicted {len(victims)} cache entries from {self.cache_dir}")
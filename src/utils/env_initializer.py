@@ -1,12 +1,13 @@
 import os
 import sys
+import functools
 from pathlib import Path
-from dotenv import load_dotenv
-from typing import List, Tuple, Optional
-from src.utils.logging_utils import setup_logger
+from dotenv import dotenv_values
+from typing import Dict, Optional
+from src.utils.logging_utils import setup_logging
 
 # Initialize logger
-logger = setup_logger("env_initializer")
+logger = setup_logging("env_initializer")
 
 # Define mandatory and optional environment variables
 MANDATORY_ENV_VARS = {
@@ -21,10 +22,17 @@ OPTIONAL_ENV_VARS = {
     "LOG_LEVEL": "Logging level (default: INFO)",
 }
 
+# .env path whose values were last applied to os.environ by initialize_env
+_active_env_path: Optional[str] = None
+
 def initialize_env(env_path: Optional[Path] = None) -> bool:
     """
     Initialize and validate environment variables from .env file.
     
+    Each .env file is parsed once; calling again with the active path is a
+    no-op, while switching paths re-applies that file's values. Call
+    clear_env_cache() to force the files to be read again.
+    
     Args:
         env_path: Optional custom path to .env file. If None, looks in project root.
         
@@ -34,28 +42,45 @@ def initialize_env(env_path: Optional[Path] = None) -> bool:
     Raises:
         SystemExit: If mandatory variables are missing.
     """
+    global _active_env_path
+    
     # Determine .env file path
     if env_path is None:
         env_path = Path(__file__).parent.parent.parent / ".env"
+    env_path_str = str(env_path)
+    if env_path_str == _active_env_path:
+        return True
     
-    # Load environment variables
-    if env_path.exists():
-        load_dotenv(dotenv_path=env_path, override=True)
+    # Apply the file's values over the process environment (like override=True)
+    os.environ.update({var: value for var, value in _read_env_file(env_path_str).items() if value is not None})
+    _validate_env()
+    _active_env_path = env_path_str
+    return True
+
+@functools.cache
+def _read_env_file(env_path_str: str) -> Dict[str, Optional[str]]:
+    """Parse the .env file at env_path_str (cached per path; empty if it can't be read)"""
+    env_path = Path(env_path_str)
+    
+    # A single open both checks for and reads the file
+    try:
+        with open(env_path, encoding='utf-8') as env_file:
+            values = dotenv_values(stream=env_file)
         logger.info(f"Loaded environment variables from {env_path}")
-    else:
+        return values
+    except FileNotFoundError:
         logger.warning(f".env file not found at {env_path} - checking system environment")
+    except OSError as e:
+        logger.warning(f"Could not read .env file at {env_path}: {str(e)} - checking system environment")
+    return {}
+
+def _validate_env() -> None:
+    """Check the known variables in os.environ, exiting if a mandatory one is missing"""
+    env_values = {var: os.getenv(var) for var in (*MANDATORY_ENV_VARS, *OPTIONAL_ENV_VARS)}
     
     # Validate environment variables
-    missing_mandatory = []
-    missing_optional = []
-    
-    for var, desc in MANDATORY_ENV_VARS.items():
-        if os.getenv(var) is None:
-            missing_mandatory.append((var, desc))
-    
-    for var, desc in OPTIONAL_ENV_VARS.items():
-        if os.getenv(var) is None:
-            missing_optional.append((var, desc))
+    missing_mandatory = [(var, desc) for var, desc in MANDATORY_ENV_VARS.items() if env_values[var] is None]
+    missing_optional = [(var, desc) for var, desc in OPTIONAL_ENV_VARS.items() if env_values[var] is None]
     
     # Handle missing variables
     if missing_mandatory:
@@ -82,8 +107,12 @@ def initialize_env(env_path: Optional[Path] = None) -> bool:
         for var, desc in missing_optional:
             warning_msg += f"  - {var}: {desc}\n"
         logger.warning(warning_msg)
-    
-    return True
+
+def clear_env_cache() -> None:
+    """Forget parsed .env files so the next initialize_env reads and applies its file again"""
+    global _active_env_path
+    _read_env_file.cache_clear()
+    _active_env_path = None
 
 def get_env_variable(name: str, default: Optional[str] = None) -> str:
     """
@@ -97,4 +126,11 @@ def get_env_variable(name: str, default: Optional[str] = None) -> str:
         str: Value of the environment variable
         
     Raises:
-        ValueError: If variable is mandatory
+        ValueError: If variable is mandatory and not set
+    """
+    value = os.environ.get(name)
+    if value is None:
+        if name in MANDATORY_ENV_VARS:
+            raise ValueError(f"Mandatory environment variable {name} is not set")
+        return default
+    return value
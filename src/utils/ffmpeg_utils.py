@@ -0,0 +1,159 @@
+import platform
+import functools
+import subprocess
+from typing import List
+from .logging_utils import setup_logging
+
+# Initialize logger for ffmpeg helpers
+logger = setup_logging("ffmpeg_utils")
+
+# Software fallback used when no hardware encoder is available
+SOFTWARE_H264_ENCODER = "libx264"
+
+# Hardware H.264 encoders, if ffmpeg reports them
+NVENC_H264_ENCODER = "h264_nvenc"
+VIDEOTOOLBOX_H264_ENCODER = "h264_videotoolbox"  # Apple Silicon / macOS
+
+# ffmpeg stderr fragments that mean the encoder itself could not start (no
+# GPU, driver or free encode session) rather than a problem with the inputs
+_ENCODER_INIT_ERRORS = (
+    "no nvenc capable devices",
+    "cannot load libcuda",
+    "cannot load nvcuda",
+    "cannot load libnvidia-encode",
+    "openencodesessionex failed",
+    "initializeencoder failed",
+    "nvenc api version",
+    "driver does not support the required nvenc api",
+    "error while opening encoder",
+    "could not open encoder",
+    "cannot create compression session",  # VideoToolbox
+)
+
+# Encoder-specific output arguments
+_ENCODER_ARGS = {
+    NVENC_H264_ENCODER: [
+        "-c:v", NVENC_H264_ENCODER,
+        "-preset", "p4",
+        "-tune", "hq",
+        "-rc", "vbr",
+        "-cq", "19",
+        "-b:v", "0"
+    ],
+    VIDEOTOOLBOX_H264_ENCODER: ["-c:v", VIDEOTOOLBOX_H264_ENCODER],
+    SOFTWARE_H264_ENCODER: ["-c:v", SOFTWARE_H264_ENCODER]
+}
+
+@functools.lru_cache(maxsize=8)
+def list_encoders(ffmpeg_path: str = "ffmpeg") -> frozenset:
+    """
+    List the video encoders compiled into an ffmpeg binary.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+
+    Returns:
+        frozenset: Encoder names (empty if ffmpeg could not be run)
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Could not query ffmpeg encoders: {str(e)}")
+        return frozenset()
+
+    # Encoder lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+    encoders = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) >= 2 and parts[0].startswith("V"):
+            encoders.add(parts[1])
+    return frozenset(encoders)
+
+@functools.lru_cache(maxsize=8)
+def encoder_works(encoder: str, ffmpeg_path: str = "ffmpeg") -> bool:
+    """
+    Check that an encoder can actually encode on this machine.
+
+    Hardware encoders are compiled into many ffmpeg builds regardless of
+    whether a supported GPU and driver are present, so a listed encoder is
+    only trusted after a one-frame test encode succeeds.
+
+    Args:
+        encoder: Encoder name (e.g. 'h264_nvenc')
+        ffmpeg_path: ffmpeg executable
+
+    Returns:
+        bool: True if the test encode succeeded
+    """
+    try:
+        result = subprocess.run(
+            [
+                ffmpeg_path, "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=c=black:s=256x256:r=25",
+                "-frames:v", "1", "-pix_fmt", "yuv420p",
+                "-c:v", encoder, "-f", "null", "-"
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Could not test encoder {encoder}: {str(e)}")
+        return False
+    if result.returncode != 0:
+        logger.info(f"Encoder {encoder} is listed but unusable: {result.stderr.strip()[-200:]}")
+        return False
+    return True
+
+def detect_h264_encoder(ffmpeg_path: str = "ffmpeg") -> str:
+    """
+    Pick the fastest working H.264 encoder: NVENC when a test encode
+    succeeds, else VideoToolbox on macOS, else libx264.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+
+    Returns:
+        str: Encoder name
+    """
+    encoders = list_encoders(ffmpeg_path)
+    if NVENC_H264_ENCODER in encoders and encoder_works(NVENC_H264_ENCODER, ffmpeg_path):
+        logger.info("Using NVENC hardware H.264 encoder")
+        return NVENC_H264_ENCODER
+    # Builds elsewhere may list VideoToolbox without the hardware to back it
+    if (platform.system() == "Darwin" and VIDEOTOOLBOX_H264_ENCODER in encoders
+            and encoder_works(VIDEOTOOLBOX_H264_ENCODER, ffmpeg_path)):
+        logger.info("Using VideoToolbox hardware H.264 encoder")
+        return VIDEOTOOLBOX_H264_ENCODER
+    return SOFTWARE_H264_ENCODER
+
+def is_encoder_init_failure(stderr: str) -> bool:
+    """
+    Tell whether a failed ffmpeg run failed because its encoder could not start.
+
+    Args:
+        stderr: ffmpeg's stderr output
+
+    Returns:
+        bool: True for encoder/driver initialization errors, False for anything
+        else (bad input, filter error, missing file, ...)
+    """
+    stderr = stderr.lower()
+    return any(fragment in stderr for fragment in _ENCODER_INIT_ERRORS)
+
+def encoder_args(encoder: str) -> List[str]:
+    """
+    Get the ffmpeg output arguments for an encoder.
+
+    Args:
+        encoder: Encoder name (e.g. 'h264_nvenc', 'libx264')
+
+    Returns:
+        list: ffmpeg arguments selecting and tuning the encoder
+    """
+    return list(_ENCODER_ARGS.get(encoder, ["-c:v", encoder]))
@@ -1,12 +1,24 @@
-import os
 import json
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Iterator, TextIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from .logging_utils import setup_logger
 
 # Initialize logger for file operations
 logger = setup_logger("file_utils")
 
+# Small dedicated pool for the *_async helpers, so disk writes neither block
+# the event loop nor queue behind work in the default executor
+_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="file-io")
+
 def create_directory_if_not_exists(path: str) -> bool:
     """
     Create a directory if it doesn't exist.
@@ -36,7 +48,7 @@ def get_file_size(filepath: str) -> Optional[int]:
         int: File size in bytes or None if file doesn't exist
     """
     try:
-        size = os.path.getsize(filepath)
+        size = Path(filepath).stat().st_size
         logger.debug(f"File size retrieved for {filepath}: {size} bytes")
         return size
     except FileNotFoundError:
@@ -58,14 +70,49 @@ def save_text_file(content: str, filepath: str) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        Path(filepath).write_text(content, encoding='utf-8')
         logger.info(f"Text file saved successfully: {filepath}")
         return True
     except Exception as e:
         logger.error(f"Failed to save text file {filepath}: {str(e)}")
         return False
 
+@contextlib.contextmanager
+def stream_text_file_writer(filepath: str, buffer_size: int = 1 << 20) -> Iterator[TextIO]:
+    """
+    Open a text file for incremental writing, for content too large to build
+    as one string first. Errors propagate to the caller.
+    
+    Args:
+        filepath: Destination file path
+        buffer_size: Write buffer size in bytes
+        
+    Yields:
+        TextIO: Handle to write to; flushed and closed when the block exits
+    """
+    with open(filepath, 'w', encoding='utf-8', buffering=buffer_size) as f:
+        yield f
+    logger.info(f"Text file saved successfully: {filepath}")
+
+def save_bytes_file(data: bytes, filepath: str) -> bool:
+    """
+    Save binary content (e.g. audio) to a file.
+    
+    Args:
+        data: Bytes to save
+        filepath: Destination file path
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        Path(filepath).write_bytes(data)
+        logger.info(f"Binary file saved successfully: {filepath}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save binary file {filepath}: {str(e)}")
+        return False
+
 def load_json_file(filepath: str) -> Optional[Dict[str, Any]]:
     """
     Load data from a JSON file.
@@ -77,14 +124,48 @@ def load_json_file(filepath: str) -> Optional[Dict[str, Any]]:
         dict: Parsed JSON data or None if failed
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        raw = Path(filepath).read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         logger.debug(f"JSON file loaded successfully: {filepath}")
         return data
     except FileNotFoundError:
         logger.warning(f"JSON file not found: {filepath}")
         return None
-    except json.JSONDecodeError:
+    except ValueError:  # json.JSONDecodeError, orjson.JSONDecodeError
+        logger.error(f"Invalid JSON format in file: {filepath}")
+        return None
+    except Exception as e:
+        logger.error(f"Failed to load JSON file {filepath}: {str(e)}")
+        return None
+
+@functools.lru_cache(maxsize=64)
+def _load_json_cached(filepath: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file; cached on (path, mtime, size) so unchanged files are parsed once"""
+    data = Path(filepath).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def load_json_file_cached(filepath: str) -> Optional[Dict[str, Any]]:
+    """
+    Load data from a JSON file, reusing the parsed result while the file is unchanged.
+    
+    The returned object is shared between callers and must be treated as
+    read-only; use load_json_file for data that will be modified. Entries are
+    keyed by the resolved path, so every spelling of a path shares one parse.
+    
+    Args:
+        filepath: Path to JSON file
+        
+    Returns:
+        dict: Parsed JSON data or None if failed
+    """
+    try:
+        resolved = Path(filepath).resolve()
+        stat = resolved.stat()
+        return _load_json_cached(str(resolved), stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        logger.warning(f"JSON file not found: {filepath}")
+        return None
+    except ValueError:  # json.JSONDecodeError, orjson.JSONDecodeError
         logger.error(f"Invalid JSON format in file: {filepath}")
         return None
     except Exception as e:
@@ -104,14 +185,42 @@ def save_json_file(data: Dict[str, Any], filepath: str, indent: int = 2) -> bool
         bool: True if successful, False otherwise
     """
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=indent)
+        payload = None
+        if orjson is not None and indent in (2, None):
+            try:
+                options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                if indent:
+                    options |= orjson.OPT_INDENT_2
+                payload = orjson.dumps(data, option=options)
+            except TypeError:
+                payload = None  # Types orjson rejects; let json report or handle them
+        if payload is None:
+            payload = json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8')
+        Path(filepath).write_bytes(payload)
         logger.info(f"JSON file saved successfully: {filepath}")
         return True
     except Exception as e:
         logger.error(f"Failed to save JSON file {filepath}: {str(e)}")
         return False
 
+async def save_text_file_async(content: str, filepath: str) -> bool:
+    """Save text content to a file without blocking the event loop (see save_text_file)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, save_text_file, content, filepath)
+
+async def save_bytes_file_async(data: bytes, filepath: str) -> bool:
+    """Save binary content to a file without blocking the event loop (see save_bytes_file)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, save_bytes_file, data, filepath)
+
+async def save_json_file_async(data: Dict[str, Any], filepath: str, indent: int = 2) -> bool:
+    """Save data to a JSON file without blocking the event loop (see save_json_file)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, save_json_file, data, filepath, indent)
+
+# Characters not allowed in filenames, each mapped to "_"
+_CLEAN_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*\0'})
+
 def clean_filename(filename: str) -> str:
     """
     Sanitize a filename by removing invalid characters.
@@ -122,7 +231,4 @@ def clean_filename(filename: str) -> str:
     Returns:
         str: Sanitized filename
     """
-    invalid_chars = '<>:"/\\|?*\0'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename
+    return filename.translate(_CLEAN_TABLE)
@@ -0,0 +1,92 @@
+import atexit
+import asyncio
+import importlib.util
+import threading
+import weakref
+from typing import Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+from .logging_utils import setup_logging
+
+# Initialize logger for the shared HTTP client
+logger = setup_logging("http_client")
+
+# Pool limits for the shared client; HTTP/2 (needs the h2 package)
+# multiplexes concurrent requests to one host over a single TLS connection
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_TIMEOUT = 30.0
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One client per event loop: httpx connections are tied to the loop that
+# opened them, and the sync wrappers run each call under its own asyncio.run
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+def get_shared_client() -> Optional["httpx.AsyncClient"]:
+    """
+    Return the connection-pooled AsyncClient for the running event loop.
+
+    Callers pass absolute URLs and may override the timeout per request.
+
+    Returns:
+        httpx.AsyncClient: Shared client, or None if httpx is not installed
+    """
+    if httpx is None:
+        return None
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=DEFAULT_TIMEOUT
+            )
+            _clients[loop] = client
+            logger.debug(f"Created shared HTTP client (http2={HTTP2_AVAILABLE})")
+        return client
+
+async def aclose_shared_client() -> None:
+    """Close the running loop's shared client; call before the loop shuts down"""
+    with _clients_lock:
+        client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+def run_sync(coro):
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Like asyncio.run, this starts a fresh event loop (so it must not be called
+    while one is running; await the coroutine there instead). The loop's
+    shared client is closed before the loop ends, so blocking wrappers don't
+    leave a client and its connection pool behind on every call.
+    """
+    async def run_and_close():
+        try:
+            return await coro
+        finally:
+            await aclose_shared_client()
+    return asyncio.run(run_and_close())
+
+@atexit.register
+def _close_remaining_clients() -> None:
+    """Best-effort close of clients whose loop never called aclose_shared_client"""
+    with _clients_lock:
+        leftovers = [(loop, client) for loop, client in _clients.items() if not client.is_closed]
+        _clients.clear()
+    for loop, client in leftovers:
+        try:
+            if loop.is_closed():
+                asyncio.run(client.aclose())
+            elif not loop.is_running():
+                loop.run_until_complete(client.aclose())
+        except Exception as e:
+            logger.debug(f"Shared HTTP client not closed cleanly: {str(e)}")
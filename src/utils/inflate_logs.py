@@ -0,0 +1,132 @@
+"""
+Offline inflater for binary operation logs.
+
+With LOG_BINARY_OPERATIONS=1, log_operation records are written to
+"<module>_<date>.nlog" files as fixed-size headers plus a metadata blob, with
+the operation/status names kept in "<module>_<date>.nlog.ops.json". This tool
+turns them back into the same text lines the text log would have held:
+
+    python -m src.utils.inflate_logs                 # every .nlog in data/logs
+    python -m src.utils.inflate_logs path/to/x.nlog  # specific files
+    python -m src.utils.inflate_logs -o - x.nlog     # print instead of writing
+
+Each input is written next to itself as "<module>_<date>.inflated.log".
+read_records is the decoder used by the in-process log consumers
+(content manager upload history, technician log analysis).
+"""
+import sys
+import json
+import logging
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from src.utils.logging_utils import BINARY_RECORD, BINARY_FLAG_MSGPACK
+
+def module_name(nlog_path: Path) -> str:
+    """Module name from a "<module>_<YYYYMMDD>.nlog" file name"""
+    stem = nlog_path.stem
+    name, _, date = stem.rpartition("_")
+    return name if name and date.isdigit() else stem
+
+def read_records(nlog_path: Path, offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Decode the operation records of one .nlog file
+
+    Args:
+        nlog_path: Path to the binary log
+        offset: Byte offset of the first record to read (0 for the whole file)
+
+    Returns:
+        tuple: (records, byte offset just past the last complete record). Each
+        record is the log_operation context ("operation", "status" and the
+        metadata) plus "levelno" and "created" (seconds since the epoch)
+    """
+    registry_path = nlog_path.with_name(nlog_path.name + ".ops.json")
+    with open(registry_path, 'rb') as f:
+        registry = json.loads(f.read())
+    operations, statuses = registry["operations"], registry["statuses"]
+
+    data = nlog_path.read_bytes()
+    header_size = BINARY_RECORD.size
+    records = []
+    pos = offset if offset <= len(data) else 0  # A shorter file was replaced; start over
+    while pos + header_size <= len(data):
+        op_id, status_id, levelno, flags, ts_ns, meta_len = BINARY_RECORD.unpack_from(data, pos)
+        blob = data[pos + header_size:pos + header_size + meta_len]
+        if len(blob) < meta_len:
+            break  # Truncated final record (still being written, or process killed mid-write)
+        pos += header_size + meta_len
+
+        if flags & BINARY_FLAG_MSGPACK:
+            if msgpack is None:
+                raise RuntimeError(f"{nlog_path} holds msgpack metadata; install msgpack to read it")
+            metadata = msgpack.unpackb(blob)
+        else:
+            metadata = json.loads(blob)
+
+        records.append({
+            "operation": operations[op_id],
+            "status": statuses[status_id],
+            **metadata,
+            "levelno": levelno,
+            "created": ts_ns / 1e9
+        })
+    return records, pos
+
+def inflate(nlog_path: Path) -> Iterator[str]:
+    """
+    Decode one .nlog file into text log lines
+
+    Args:
+        nlog_path: Path to the binary log
+
+    Returns:
+        Iterator of formatted lines (without trailing newline)
+    """
+    module = module_name(nlog_path)
+    records, _ = read_records(nlog_path)
+    for record in records:
+        levelno, created = record.pop("levelno"), record.pop("created")
+        timestamp = datetime.fromtimestamp(created).strftime('%Y-%m-%d %H:%M:%S')
+        context = json.dumps(record)
+        yield (
+            f"{timestamp} | {logging.getLevelName(levelno):<8} | {module} | "
+            f"Operation: {record['operation']} | Status: {record['status']} | {context}"
+        )
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inflate binary operation logs (.nlog) to text")
+    parser.add_argument("paths", nargs="*", type=Path, help="Files to inflate (default: every .nlog in --log-dir)")
+    parser.add_argument("--log-dir", type=Path, default=Path("data/logs"), help="Directory searched when no paths are given")
+    parser.add_argument("-o", "--output", help="Write to this file instead of <name>.inflated.log ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or sorted(args.log_dir.glob("*.nlog"))
+    if not paths:
+        print(f"No .nlog files found in {args.log_dir}", file=sys.stderr)
+        return 1
+
+    for nlog_path in paths:
+        try:
+            lines = list(inflate(nlog_path))
+        except (OSError, ValueError, KeyError, IndexError, RuntimeError) as e:
+            print(f"Failed to inflate {nlog_path}: {str(e)}", file=sys.stderr)
+            return 1
+        if args.output == "-":
+            sys.stdout.write("".join(f"{line}\n" for line in lines))
+            continue
+        out_path = Path(args.output) if args.output else nlog_path.with_name(f"{nlog_path.stem}.inflated.log")
+        with open(out_path, 'a' if args.output else 'w', encoding='utf-8') as f:
+            f.write("".join(f"{line}\n" for line in lines))
+        print(f"{nlog_path} -> {out_path} ({len(lines)} records)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
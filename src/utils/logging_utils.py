@@ -1,18 +1,299 @@
 import os
 import json
+import queue
+import struct
+import threading
+import time
+import atexit
 import logging
+import logging.handlers
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Loggers already configured by setup_logging, and log directories known to exist
+_LOGGERS: Dict[str, logging.Logger] = {}
+_DIRS_CREATED: Set[str] = set()
+
+# File writes are batched: buffered records are flushed every
+# FILE_BUFFER_CAPACITY records, on any ERROR, every FILE_FLUSH_INTERVAL
+# seconds, on flush_logs() and at shutdown
+FILE_BUFFER_CAPACITY = 512
+FILE_FLUSH_INTERVAL = 2.0
+
+# Name of the internal records that ask the listener to flush every handler
+_FLUSH_REQUEST = "logging_utils.flush"
+
+class _ModuleRouter(logging.Handler):
+    """Hands each record to the file/console handlers of the module that logged it"""
+    
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, Tuple[logging.Handler, ...]] = {}
+    
+    def handle(self, record: logging.LogRecord) -> bool:
+        if record.name == _FLUSH_REQUEST:
+            self.flush()
+            done = getattr(record, "done", None)
+            if done is not None:
+                done.set()
+            return True
+        for handler in self._handlers_for(record.name):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+    
+    def _handlers_for(self, name: str) -> Tuple[logging.Handler, ...]:
+        """Handlers of the module itself or, for a child logger like 'ingestion.pdf', its nearest registered parent"""
+        handlers = self.routes.get(name)
+        while handlers is None and "." in name:
+            name = name.rpartition(".")[0]
+            handlers = self.routes.get(name)
+        return handlers or ()
+    
+    def flush(self):
+        for handlers in self.routes.values():
+            for handler in handlers:
+                handler.flush()
+    
+    def close(self):
+        for handlers in self.routes.values():
+            for handler in handlers:
+                target = getattr(handler, "target", None)
+                handler.close()  # MemoryHandler flushes here but leaves its target open
+                if target is not None:
+                    target.close()
+        self.routes.clear()
+        super().close()
+
+# Write buffer of each log file; records reach the file in MemoryHandler
+# batches, so one batch is usually a single write() call
+FILE_WRITE_BUFFER_BYTES = 1 << 20
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler with a large write buffer that is flushed per batch, not per record"""
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=FILE_WRITE_BUFFER_BYTES,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+class _BatchFlushMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes its target's stream once each batch is written"""
+    
+    def flush(self):
+        super().flush()
+        self.acquire()
+        try:
+            if self.target is not None:
+                self.target.flush()
+        finally:
+            self.release()
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that enqueues the record untouched.
+    
+    The stock prepare() formats the message on the calling thread; the queue
+    never leaves the process, so formatting (including StructuredMessage's
+    JSON) is left to the listener thread.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# One queue and one listener thread serve every module's logger
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_router = _ModuleRouter()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+_flush_timer_stop = threading.Event()
+
+def _flush_periodically():
+    """Queue a flush request every FILE_FLUSH_INTERVAL seconds (listener side thread)"""
+    while not _flush_timer_stop.wait(FILE_FLUSH_INTERVAL):
+        _log_queue.put(logging.makeLogRecord({"name": _FLUSH_REQUEST}))
+
+def flush_logs(timeout: float = 5.0) -> bool:
+    """
+    Write every record logged so far to its log file.
+    
+    Call before reading this process's own log files (e.g. log analysis).
+    
+    Args:
+        timeout: Seconds to wait for the listener thread
+    
+    Returns:
+        bool: True if the flush completed within the timeout
+    """
+    if _listener is None:
+        _router.flush()
+        return True
+    done = threading.Event()
+    # Queued behind every earlier record, so those are written first
+    _log_queue.put(logging.makeLogRecord({"name": _FLUSH_REQUEST, "done": done}))
+    return done.wait(timeout)
+
+def _stop_listener():
+    """Drain the queue, stop the listener and flush all handlers (registered with atexit)"""
+    global _listener
+    _flush_timer_stop.set()
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    _router.close()
+
+atexit.register(_stop_listener)
 
 # Configure logging to use structured JSON format
 class StructuredMessage:
+    """Log message with JSON context, serialized only when a handler formats it"""
+    __slots__ = ("message", "kwargs", "_text")
+    
     def __init__(self, message, **kwargs):
         self.message = message
         self.kwargs = kwargs
+        self._text = None
 
     def __str__(self):
-        return f"{self.message} | {json.dumps(self.kwargs)}"
+        # Cached: the file and console handlers both format the same record
+        if self._text is None:
+            self._text = f"{self.message} | {_dumps(self.kwargs)}"
+        return self._text
+
+def _dumps(data: Dict) -> str:
+    """Serialize log context with orjson when available, else stdlib json"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys; json handles those
+    return json.dumps(data, default=str)
+
+# Binary operation records (.nlog): a fixed header followed by the metadata
+# blob. Header fields: operation id, status id, level number, flags,
+# timestamp (ns since epoch), metadata length. Ids index the string tables in
+# the "<file>.nlog.ops.json" registry written next to the records.
+BINARY_OPERATIONS = os.getenv("LOG_BINARY_OPERATIONS", "").lower() in ("1", "true", "yes")
+BINARY_RECORD = struct.Struct("<HBBBQI")
+BINARY_FLAG_MSGPACK = 0x01
+BINARY_BUFFER_BYTES = 64 * 1024
+
+class BinaryOperationHandler(logging.Handler):
+    """
+    Writes log_operation records as compact binary records (NanoLog-style).
+    
+    Only the operation/status ids, level, timestamp and metadata are stored;
+    the message text is rebuilt offline by src.utils.inflate_logs. Records are
+    accumulated in a buffer and appended to the file in BINARY_BUFFER_BYTES
+    batches, on ERROR and on close. Other records are ignored.
+    """
+    
+    def __init__(self, filename: Path):
+        super().__init__()
+        self.filename = Path(filename)
+        self.registry_path = self.filename.with_name(self.filename.name + ".ops.json")
+        self._buffer = bytearray()
+        self._operations: Dict[str, int] = {}
+        self._statuses: Dict[str, int] = {}
+        self._load_registry()
+    
+    def _load_registry(self):
+        """Reuse ids from an existing registry so appended records stay decodable"""
+        try:
+            with open(self.registry_path, 'rb') as f:
+                registry = json.loads(f.read())
+            self._operations = {name: i for i, name in enumerate(registry["operations"])}
+            self._statuses = {name: i for i, name in enumerate(registry["statuses"])}
+        except (OSError, ValueError, KeyError):
+            pass
+    
+    def _save_registry(self):
+        """Rewrite the id tables (only when a new operation or status appears)"""
+        registry = {"operations": list(self._operations), "statuses": list(self._statuses)}
+        tmp_path = self.registry_path.with_name(self.registry_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(registry, f)
+        os.replace(tmp_path, self.registry_path)
+    
+    def _intern(self, table: Dict[str, int], name: str) -> int:
+        """Id of `name` in `table`, allocating and persisting a new one if needed"""
+        index = table.get(name)
+        if index is None:
+            index = table[name] = len(table)
+            self._save_registry()
+        return index
+    
+    def emit(self, record: logging.LogRecord):
+        message = record.msg
+        if not isinstance(message, StructuredMessage):
+            return
+        try:
+            metadata = {k: v for k, v in message.kwargs.items() if k not in ("operation", "status")}
+            if msgpack is not None:
+                blob, flags = msgpack.packb(metadata, default=str), BINARY_FLAG_MSGPACK
+            else:
+                blob, flags = json.dumps(metadata, default=str).encode("utf-8"), 0
+            self._buffer += BINARY_RECORD.pack(
+                self._intern(self._operations, str(message.kwargs.get("operation"))),
+                self._intern(self._statuses, str(message.kwargs.get("status"))),
+                record.levelno,
+                flags,
+                int(record.created * 1e9),
+                len(blob)
+            )
+            self._buffer += blob
+            if len(self._buffer) >= BINARY_BUFFER_BYTES or record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def flush(self):
+        if self._buffer:
+            with open(self.filename, 'ab') as f:
+                f.write(self._buffer)
+            self._buffer.clear()
+    
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            super().close()
+
+class _TextRecordFilter(logging.Filter):
+    """Keeps operation records below WARNING out of the text handlers once they go to .nlog"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or not isinstance(record.msg, StructuredMessage)
+
+# ((year, day of year), "YYYYMMDD") for the log file names, refreshed when the day changes
+_LOG_DATE_KEY = [None, ""]
+
+def _today() -> str:
+    """Today's local date as YYYYMMDD, formatted once per day"""
+    now = time.localtime()
+    day = (now.tm_year, now.tm_yday)
+    if day != _LOG_DATE_KEY[0]:
+        _LOG_DATE_KEY[:] = [day, time.strftime("%Y%m%d", now)]
+    return _LOG_DATE_KEY[1]
 
 def setup_logging(
     module_name: str,
@@ -24,6 +305,15 @@ def setup_logging(
     """
     Configure structured logging for a pipeline module.
     
+    Records are handed to a QueueHandler and formatted and written by a
+    single background QueueListener, so logging calls never block on disk I/O.
+    Each module is configured once; later calls return the existing logger.
+    
+    With LOG_BINARY_OPERATIONS=1 in the environment, log_operation records
+    below WARNING are written as compact binary records to a .nlog sidecar
+    instead of the text log and console; inflate them with
+    `python -m src.utils.inflate_logs`.
+    
     Args:
         module_name: Name of the module (e.g., 'ingestion', 'script_generator')
         log_dir: Base directory for log files
@@ -32,11 +322,16 @@ def setup_logging(
     Returns:
         Configured logger instance
     """
+    if module_name in _LOGGERS:
+        return _LOGGERS[module_name]
+    
     # Ensure log directory exists
-    Path(log_dir).mkdir(parents=True, exist_ok=True)
+    if log_dir not in _DIRS_CREATED:
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+        _DIRS_CREATED.add(log_dir)
     
     # Create module-specific log file path
-    timestamp = datetime.now().strftime("%Y%m%d")
+    timestamp = _today()
     log_file = Path(log_dir) / f"{module_name}_{timestamp}.log"
     
     # Set up logger
@@ -52,23 +347,54 @@ def setup_logging(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    # File handler for persistent logs
-    file_handler = logging.handlers.RotatingFileHandler(
+    # File handler for persistent logs, batched through a memory buffer
+    file_handler = _BufferedRotatingFileHandler(
         filename=log_file,
         maxBytes=max_bytes,
         backupCount=backup_count,
-        encoding='utf-8'
+        encoding='utf-8',
+        delay=True
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    buffered_file_handler = _BatchFlushMemoryHandler(
+        capacity=FILE_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
     
     # Console handler for real-time output
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    
+    # Writes happen on the listener thread; the logger only enqueues records
+    global _listener
+    handlers = (buffered_file_handler, console_handler)
+    if BINARY_OPERATIONS:
+        text_filter = _TextRecordFilter()
+        for handler in handlers:
+            handler.addFilter(text_filter)
+        handlers += (BinaryOperationHandler(Path(log_dir) / f"{module_name}_{timestamp}.nlog"),)
+    _router.routes[module_name] = handlers
+    if _listener is None:
+        _listener = logging.handlers.QueueListener(_log_queue, _router)
+        _listener.start()
+        threading.Thread(target=_flush_periodically, name="log-flush", daemon=True).start()
+    logger.addHandler(_DeferredQueueHandler(_log_queue))
+    _LOGGERS[module_name] = logger
     
     return logger
 
+# Older name still imported by main.py and file_utils
+setup_logger = setup_logging
+
+def _level_number(level: str) -> int:
+    """Numeric value of a level name for log_operation's enabled check (INFO if unknown)"""
+    # getLevelName maps registered names to numbers and works before Python 3.11,
+    # unlike getLevelNamesMapping
+    number = logging.getLevelName(level.upper())
+    return number if isinstance(number, int) else logging.INFO
+
 def log_operation(
     logger: logging.Logger,
     operation: str,
@@ -86,6 +412,10 @@ def log_operation(
         metadata: Additional context as a dictionary
         level: Log level for the message
     """
+    # Skip building the record when the level is filtered out; the metadata
+    # itself is only serialized if a handler formats the message
+    if not logger.isEnabledFor(_level_number(level)):
+        return
     log_method = getattr(logger, level.lower(), logger.info)
     message = StructuredMessage(
         f"Operation: {operation} | Status: {status}",
@@ -0,0 +1,19 @@
+from pathlib import Path
+from typing import Any, Dict, Optional
+from .file_utils import load_json_file_cached
+
+# Location of the pipeline-wide configuration file
+MAIN_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
+
+def get_main_config() -> Optional[Dict[str, Any]]:
+    """
+    Return the parsed main configuration.
+
+    Parsing is cached on the file's mtime and size, so repeated calls cost a
+    stat and edits on disk are picked up by the next call. The returned dict
+    is shared between callers and must be treated as read-only.
+
+    Returns:
+        dict: Main configuration, or None if it could not be loaded
+    """
+    return load_json_file_cached(MAIN_CONFIG_PATH)
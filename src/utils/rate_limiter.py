@@ -0,0 +1,91 @@
+import time
+import asyncio
+import threading
+from typing import Dict, Optional
+from .logging_utils import setup_logging
+
+# Initialize logger for rate limiting
+logger = setup_logging("rate_limiter")
+
+class RateLimiter:
+    """
+    Token-bucket limiter for API requests-per-minute and tokens-per-minute.
+
+    Capacity is reserved up front: a caller that finds the bucket short still
+    takes its share (driving the balance negative) and then sleeps until the
+    refill covers it, so concurrent callers queue up behind each other
+    instead of all waking at once.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: Optional[int] = None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._request_capacity = float(requests_per_minute)
+        self._token_capacity = float(tokens_per_minute or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: int) -> float:
+        """Take capacity for one request and return how long to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+
+            self._request_capacity = min(
+                self._request_capacity + elapsed * self.requests_per_minute / 60.0,
+                self.requests_per_minute
+            )
+            self._request_capacity -= 1
+            wait = max(0.0, -self._request_capacity * 60.0 / self.requests_per_minute)
+
+            if self.tokens_per_minute:
+                self._token_capacity = min(
+                    self._token_capacity + elapsed * self.tokens_per_minute / 60.0,
+                    self.tokens_per_minute
+                )
+                self._token_capacity -= min(tokens, self.tokens_per_minute)
+                wait = max(wait, -self._token_capacity * 60.0 / self.tokens_per_minute)
+            return wait
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until a request of `tokens` estimated tokens may be sent.
+
+        Args:
+            tokens: Estimated prompt + completion tokens for the request
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, tokens: int = 0) -> None:
+        """Blocking variant of acquire for synchronous callers"""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+            time.sleep(wait)
+
+# Limiters shared by every client of the same API account
+_shared_limiters: Dict[str, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+def get_rate_limiter(name: str, requests_per_minute: int, tokens_per_minute: Optional[int] = None) -> RateLimiter:
+    """
+    Return the limiter registered under `name`, creating it on first use.
+
+    Args:
+        name: Key of the shared limit (e.g. "openai")
+        requests_per_minute: RPM budget used if the limiter is created
+        tokens_per_minute: TPM budget used if the limiter is created
+
+    Returns:
+        RateLimiter: The shared limiter
+    """
+    with _shared_lock:
+        limiter = _shared_limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+            _shared_limiters[name] = limiter
+        return limiter
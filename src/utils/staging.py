@@ -0,0 +1,107 @@
+import os
+import shutil
+import asyncio
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+from .logging_utils import setup_logging
+from .file_utils import create_directory_if_not_exists
+
+# Initialize logger for staging operations
+logger = setup_logging("staging")
+
+# Preferred scratch location: RAM-backed on Linux, system temp dir elsewhere
+_DEFAULT_SCRATCH_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Free space required on the scratch filesystem, as a multiple of an
+# artifact's expected size (/dev/shm is only 64 MB in a default Docker container)
+SCRATCH_HEADROOM = 1.5
+
+class StagingSink:
+    """
+    Stage pipeline artifacts on fast local scratch storage and copy them to
+    their canonical location in the background.
+
+    Stages write to scratch_path(...) and keep working on the local copy while
+    the copy to the (possibly slow or networked) data directory happens on a
+    worker task. Artifacts too large for the scratch filesystem are staged
+    in an on-disk temp directory instead. close() waits for every pending
+    copy and removes the staging directories.
+    """
+
+    def __init__(self, scratch_root: Optional[str] = None):
+        self.scratch_dir = Path(tempfile.mkdtemp(
+            prefix="autoed_",
+            dir=scratch_root or _DEFAULT_SCRATCH_ROOT
+        ))
+        self._disk_dir: Optional[Path] = None
+        self.failed: List[Path] = []
+        self._queue: "asyncio.Queue[Tuple[Path, Path]]" = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        logger.debug(f"Staging artifacts in {self.scratch_dir}")
+
+    def scratch_path(self, filename: str, expected_bytes: int = 0) -> Path:
+        """
+        Return a staging path for a stage to write an artifact to.
+
+        Args:
+            filename: Artifact file name
+            expected_bytes: Estimated artifact size; if the scratch filesystem
+                lacks room for it, the path is in an on-disk temp directory
+
+        Returns:
+            Path: Where the stage should write the artifact
+        """
+        if expected_bytes:
+            free = shutil.disk_usage(self.scratch_dir).free
+            if free < expected_bytes * SCRATCH_HEADROOM:
+                if self._disk_dir is None:
+                    self._disk_dir = Path(tempfile.mkdtemp(prefix="autoed_"))
+                logger.info(
+                    f"Scratch space too small for {filename} ({free} bytes free, "
+                    f"~{expected_bytes} needed), staging in {self._disk_dir}"
+                )
+                return self._disk_dir / filename
+        return self.scratch_dir / filename
+
+    def enqueue(self, local_path: Path, final_path: Path) -> None:
+        """
+        Schedule a staged artifact to be copied to its final location.
+
+        Args:
+            local_path: Artifact in the scratch directory
+            final_path: Canonical destination path
+        """
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._drain())
+        self._queue.put_nowait((Path(local_path), Path(final_path)))
+
+    async def _drain(self) -> None:
+        """Copy queued artifacts one at a time until cancelled"""
+        while True:
+            local_path, final_path = await self._queue.get()
+            try:
+                await asyncio.to_thread(self._copy, local_path, final_path)
+                logger.info(f"Persisted staged artifact: {final_path}")
+            except Exception as e:
+                logger.error(f"Failed to persist {local_path} to {final_path}: {str(e)}")
+                self.failed.append(final_path)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _copy(local_path: Path, final_path: Path) -> None:
+        create_directory_if_not_exists(final_path.parent)
+        # shutil.copyfile uses os.sendfile on Linux, so data never enters userspace
+        shutil.copyfile(local_path, final_path)
+
+    async def close(self) -> None:
+        """Wait for all pending copies, then remove the staging directories"""
+        if self._worker is not None:
+            await self._queue.join()
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        await asyncio.to_thread(shutil.rmtree, self.scratch_dir, True)
+        if self._disk_dir is not None:
+            await asyncio.to_thread(shutil.rmtree, self._disk_dir, True)
@@ -1,19 +1,141 @@
 import os
+import logging
 import subprocess
 import time
-import json
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 from src.utils.logging_utils import setup_logging, log_operation
 from src.utils.file_utils import (
     create_directory_if_not_exists,
-    get_file_size
+    get_file_size,
+    load_json_file
 )
+from src.utils.ffmpeg_utils import SOFTWARE_H264_ENCODER, is_encoder_init_failure
 from .config import config
 
 # Initialize logging
 logger = setup_logging("video_composer")
 
+# ffprobe durations keyed on (path, mtime_ns, size); a rewritten file gets a
+# new key, so stale entries are never returned and just age out of the LRU
+_DURATION_CACHE_SIZE = 256
+_duration_cache: "OrderedDict[Tuple[str, int, int], float]" = OrderedDict()
+_duration_cache_lock = threading.Lock()
+
+def _duration_cache_key(file_path: Path) -> Optional[Tuple[str, int, int]]:
+    """Cache key for a media file, or None if it cannot be stat'ed"""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (str(file_path), stat.st_mtime_ns, stat.st_size)
+
+def _file_exists(path: Path) -> bool:
+    """Existence check via access(2), which skips the full stat() of Path.exists()"""
+    return os.access(path, os.F_OK)
+
+def _require_exists(path: Path, label: str) -> None:
+    """Raise FileNotFoundError naming the input if `path` does not exist"""
+    if not _file_exists(path):
+        raise FileNotFoundError(f"{label} file not found: {path}")
+
+def _subtitle_filter(subtitles_srt_path: Path) -> List[str]:
+    """-vf arguments burning the subtitles into the video"""
+    return ["-vf", f"subtitles={str(subtitles_srt_path)}:force_style='Fontsize=24,PrimaryColour=&HFFFFFF&'"]
+
+def _needs_software_retry(stderr: bytes) -> bool:
+    """
+    Tell whether a failed encode should be retried with libx264
+    
+    Only when the configured hardware encoder itself failed to start (a forced
+    codec the host can't run, or a GPU out of encode sessions); bad inputs or
+    filter errors would fail the same way with any encoder. The configured
+    codec is left unchanged, so later jobs still try the hardware encoder.
+    
+    Args:
+        stderr: ffmpeg's stderr from the failed run
+        
+    Returns:
+        bool: True if the job should be rerun with config.software_encode_args
+    """
+    if config.video_codec == SOFTWARE_H264_ENCODER:
+        return False
+    message = stderr.decode('utf-8', errors='replace')
+    if not is_encoder_init_failure(message):
+        return False
+    logger.warning(
+        f"FFmpeg could not start {config.video_codec}, retrying with {SOFTWARE_H264_ENCODER}: "
+        f"{message[-2000:]}"
+    )
+    return True
+
+def _run_ffmpeg(cmd: List[str]) -> subprocess.CompletedProcess:
+    """Run an ffmpeg command, keeping only stderr (raw bytes, decoded on failure)"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("FFmpeg command: %s", " ".join(cmd))
+    return subprocess.run(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False
+    )
+
+def _build_merge_cmd(
+    video_input: str,
+    audio_input: str,
+    subtitles_srt_path: Optional[Path],
+    output_path: Path,
+    encode_args: Tuple[str, ...] = None
+) -> List[str]:
+    """
+    ffmpeg argv muxing one video and one audio input (file paths or pipe:N) into output_path
+    
+    encode_args defaults to config.ffmpeg_encode_args.
+    """
+    cmd = [
+        config.ffmpeg_path,
+        "-y",  # Overwrite output
+        "-i", video_input,
+        "-i", audio_input,
+    ]
+    
+    # Add subtitles if provided
+    if subtitles_srt_path:
+        cmd.extend(_subtitle_filter(subtitles_srt_path))
+    
+    # Add encoding parameters
+    cmd.extend(encode_args or config.ffmpeg_encode_args)
+    cmd.append(str(output_path))
+    return cmd
+
+def _build_batch_cmd(
+    jobs: List[Tuple[Path, Path, Optional[Path], Path]],
+    encode_args: Tuple[str, ...] = None
+) -> List[str]:
+    """
+    ffmpeg argv encoding several (video, audio, subtitles, output) jobs in one process
+    
+    Inputs are numbered in pairs (job i uses inputs 2i and 2i+1); every output
+    carries its own -map, filter and encoding options, so the jobs stay
+    independent while sharing one ffmpeg startup and codec initialization.
+    encode_args defaults to config.ffmpeg_encode_args.
+    """
+    cmd = [config.ffmpeg_path, "-y"]
+    for animation_path, voice_path, _, _ in jobs:
+        cmd.extend(["-i", str(animation_path), "-i", str(voice_path)])
+    for index, (_, _, subtitles_srt_path, output_path) in enumerate(jobs):
+        cmd.extend(["-map", f"{2 * index}:v:0", "-map", f"{2 * index + 1}:a:0"])
+        if subtitles_srt_path:
+            cmd.extend(_subtitle_filter(subtitles_srt_path))
+        cmd.extend(encode_args or config.ffmpeg_encode_args)
+        cmd.append(str(output_path))
+    return cmd
+
 class VideoComposer:
     """Core class for composing final videos from assets"""
     
@@ -34,7 +156,35 @@ class VideoComposer:
         Returns:
             float: Duration in seconds, or None if failed
         """
-        try:
+        return self._get_media_durations([file_path])[0]
+    
+    def _get_media_durations(self, file_paths: List[Path]) -> List[Optional[float]]:
+        """
+        Get durations of several media files, probing them concurrently
+        
+        ffprobe accepts a single input, so one process is started per file;
+        all are launched before any is waited on, so the total wait is that of
+        the slowest probe rather than the sum. Successful results are cached on
+        (path, mtime, size), so unchanged files are not probed again.
+        
+        Args:
+            file_paths: Paths to media files
+            
+        Returns:
+            list: Duration in seconds for each path (None where probing failed), in input order
+        """
+        keys = [_duration_cache_key(file_path) for file_path in file_paths]
+        with _duration_cache_lock:
+            cached = [_duration_cache.get(key) if key else None for key in keys]
+            for key, duration in zip(keys, cached):
+                if duration is not None:
+                    _duration_cache.move_to_end(key)
+        
+        procs = []
+        for file_path, duration in zip(file_paths, cached):
+            if duration is not None:
+                procs.append(None)
+                continue
             cmd = [
                 config.ffprobe_path,
                 "-v", "error",
@@ -42,19 +192,41 @@ class VideoComposer:
                 "-of", "default=noprint_wrappers=1:nokey=1",
                 str(file_path)
             ]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return float(result.stdout.strip())
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to get duration for {file_path}: {str(e)}")
-            return None
-        except ValueError:
-            logger.error(f"Invalid duration output for {file_path}")
-            return None
+            try:
+                procs.append(subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True
+                ))
+            except OSError as e:
+                logger.error(f"Failed to get duration for {file_path}: {str(e)}")
+                procs.append(None)
+        
+        durations = []
+        for file_path, key, duration, proc in zip(file_paths, keys, cached, procs):
+            if proc is None:
+                durations.append(duration)
+                continue
+            stdout, stderr = proc.communicate()
+            if proc.returncode != 0:
+                logger.error(f"Failed to get duration for {file_path}: {stderr.strip()}")
+                durations.append(None)
+                continue
+            try:
+                duration = float(stdout.strip())
+            except ValueError:
+                logger.error(f"Invalid duration output for {file_path}")
+                durations.append(None)
+                continue
+            durations.append(duration)
+            if key is not None:
+                with _duration_cache_lock:
+                    _duration_cache[key] = duration
+                    if len(_duration_cache) > _DURATION_CACHE_SIZE:
+                        _duration_cache.popitem(last=False)
+        return durations
     
     def ensure_sync(self, video_path: Path, audio_path: Path) -> bool:
         """
@@ -67,8 +239,7 @@ class VideoComposer:
         Returns:
             bool: True if durations match within tolerance, False otherwise
         """
-        video_duration = self._get_media_duration(video_path)
-        audio_duration = self._get_media_duration(audio_path)
+        video_duration, audio_duration = self._get_media_durations([video_path, audio_path])
         
         if not video_duration or not audio_duration:
             return False
@@ -90,6 +261,19 @@ class VideoComposer:
         )
         return True
     
+    def default_output_path(self, animation_mp4_path: Path) -> Path:
+        """
+        Get the canonical output path for a final video
+        
+        Args:
+            animation_mp4_path: Path to animation video
+            
+        Returns:
+            Path: Final video path in the configured output directory
+        """
+        source_name = Path(animation_mp4_path).stem.replace("_animation", "")
+        return config.output_dir / f"{source_name}_final.mp4"
+
     def merge_assets(
         self,
         animation_mp4_path: Path,
@@ -118,66 +302,32 @@ class VideoComposer:
         
         try:
             # Validate inputs
-            if not animation_mp4_path.exists():
-                raise FileNotFoundError(f"Animation file not found: {animation_mp4_path}")
-            if not voice_mp3_path.exists():
-                raise FileNotFoundError(f"Voiceover file not found: {voice_mp3_path}")
-            if subtitles_srt_path and not subtitles_srt_path.exists():
-                raise FileNotFoundError(f"Subtitles file not found: {subtitles_srt_path}")
+            _require_exists(animation_mp4_path, "Animation")
+            _require_exists(voice_mp3_path, "Voiceover")
+            if subtitles_srt_path:
+                _require_exists(subtitles_srt_path, "Subtitles")
             
             # Check sync between audio and video
             self.ensure_sync(animation_mp4_path, voice_mp3_path)
             
             # Create output path if not provided
             if not final_output_mp4_path:
-                source_name = animation_mp4_path.stem.replace("_animation", "")
-                final_output_mp4_path = config.output_dir / f"{source_name}_final.mp4"
+                final_output_mp4_path = self.default_output_path(animation_mp4_path)
             else:
                 final_output_mp4_path = Path(final_output_mp4_path)
             
-            # Build ffmpeg command
-            cmd = [
-                config.ffmpeg_path,
-                "-y",  # Overwrite output
-                "-i", str(animation_mp4_path),
-                "-i", str(voice_mp3_path),
-            ]
-            
-            # Add subtitles if provided
-            if subtitles_srt_path:
-                cmd.extend([
-                    "-vf", f"subtitles={str(subtitles_srt_path)}:force_style='Fontsize=24,PrimaryColour=&HFFFFFF&'"
-                ])
-            
-            # Add encoding parameters
-            cmd.extend([
-                "-c:v", config.video_codec,
-                "-b:v", config.video_bitrate,
-                "-crf", str(config.crf),
-                "-c:a", config.audio_codec,
-                "-b:a", config.audio_bitrate,
-                "-threads", str(config.threads),
-                "-shortest",  # End at shortest input duration
-                "-movflags", "+faststart",  # For streaming
-                str(final_output_mp4_path)
-            ])
-            
-            # Log the full command
-            logger.debug(f"FFmpeg command: {' '.join(cmd)}")
-            
-            # Run ffmpeg
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True
-            )
+            # Run ffmpeg, once more with libx264 if the hardware encoder can't start
+            merge_args = (str(animation_mp4_path), str(voice_mp3_path), subtitles_srt_path, final_output_mp4_path)
+            result = _run_ffmpeg(_build_merge_cmd(*merge_args))
+            if result.returncode != 0 and _needs_software_retry(result.stderr):
+                result = _run_ffmpeg(_build_merge_cmd(*merge_args, config.software_encode_args))
             
             if result.returncode != 0:
-                logger.error(f"FFmpeg failed with error: {result.stderr}")
+                logger.error(f"FFmpeg failed with error: {result.stderr.decode('utf-8', errors='replace')}")
                 return None
             
             # Verify output
-            if not final_output_mp4_path.exists():
+            if not _file_exists(final_output_mp4_path):
                 raise RuntimeError("Output file was not created")
             
             duration = time.time() - start_time
@@ -201,6 +351,194 @@ class VideoComposer:
             }, level="ERROR")
             return None
     
+    def merge_assets_batch(
+        self,
+        pairs: List[Tuple[Path, Path]],
+        subtitles: Optional[List[Optional[Path]]] = None
+    ) -> List[Optional[Path]]:
+        """
+        Combine many video/audio pairs, encoding up to config.batch_size per ffmpeg process
+        
+        Outputs go to default_output_path() of each animation. A batch whose
+        hardware encoder can't start is rerun with libx264; if it still
+        fails, its jobs are retried one by one through
+        merge_assets so a single bad input does not fail the whole batch.
+        
+        Args:
+            pairs: (animation path, voiceover path) for each video
+            subtitles: Optional subtitles path per pair (same order, None for none)
+            
+        Returns:
+            list: Path to each generated video, or None where it failed, in input order
+        """
+        start_time = time.time()
+        subtitles = subtitles or [None] * len(pairs)
+        log_operation(logger, "merge_assets_batch", "started", {"videos": len(pairs)})
+        
+        results: List[Optional[Path]] = [None] * len(pairs)
+        jobs = []  # (index, animation, voice, subtitles, output)
+        for index, ((animation_path, voice_path), subtitles_path) in enumerate(zip(pairs, subtitles)):
+            try:
+                _require_exists(animation_path, "Animation")
+                _require_exists(voice_path, "Voiceover")
+                if subtitles_path:
+                    _require_exists(subtitles_path, "Subtitles")
+            except FileNotFoundError as e:
+                logger.error(str(e))
+                continue
+            self.ensure_sync(animation_path, voice_path)
+            jobs.append((index, animation_path, voice_path, subtitles_path, self.default_output_path(animation_path)))
+        
+        for batch_start in range(0, len(jobs), config.batch_size):
+            batch = jobs[batch_start:batch_start + config.batch_size]
+            batch_jobs = [job[1:] for job in batch]
+            result = _run_ffmpeg(_build_batch_cmd(batch_jobs))
+            if result.returncode != 0 and _needs_software_retry(result.stderr):
+                result = _run_ffmpeg(_build_batch_cmd(batch_jobs, config.software_encode_args))
+            if result.returncode != 0:
+                logger.warning(
+                    f"Batched FFmpeg run failed, merging {len(batch)} videos individually: "
+                    f"{result.stderr.decode('utf-8', errors='replace')[-2000:]}"
+                )
+                for index, animation_path, voice_path, subtitles_path, output_path in batch:
+                    results[index] = self.merge_assets(animation_path, voice_path, subtitles_path, output_path)
+                continue
+            
+            for index, _, _, _, output_path in batch:
+                results[index] = output_path if _file_exists(output_path) else None
+        
+        log_operation(logger, "merge_assets_batch", "completed", {
+            "videos": len(pairs),
+            "succeeded": sum(result is not None for result in results),
+            "duration_sec": time.time() - start_time
+        })
+        return results
+    
+    def merge_assets_streamed(
+        self,
+        animation_fd: int,
+        voice_fd: int,
+        final_output_mp4_path: Path,
+        subtitles_srt_path: Optional[Path] = None
+    ) -> Optional[Path]:
+        """
+        Combine video and audio read from pipes into final video
+        
+        For producers running as sibling processes: they write into the write
+        ends of two os.pipe()s and ffmpeg reads the read ends as pipe:N inputs,
+        so the intermediate animation and voiceover never touch disk. The
+        video stream must be pipe-friendly (fragmented MP4, MPEG-TS or raw
+        frames); a regular MP4 with its index at the end cannot be demuxed
+        from a pipe. No sync check is done since pipes cannot be probed ahead.
+        
+        Args:
+            animation_fd: Readable file descriptor carrying the video stream
+            voice_fd: Readable file descriptor carrying the audio stream
+            final_output_mp4_path: Output path
+            subtitles_srt_path: Optional path to subtitles
+            
+        Returns:
+            Path: Path to generated video, or None if failed
+        """
+        start_time = time.time()
+        final_output_mp4_path = Path(final_output_mp4_path)
+        log_operation(logger, "merge_assets_streamed", "started", {
+            "output_path": str(final_output_mp4_path),
+            "subtitles": str(subtitles_srt_path) if subtitles_srt_path else None
+        })
+        
+        try:
+            if subtitles_srt_path:
+                _require_exists(subtitles_srt_path, "Subtitles")
+            
+            cmd = _build_merge_cmd(
+                f"pipe:{animation_fd}",
+                f"pipe:{voice_fd}",
+                subtitles_srt_path,
+                final_output_mp4_path
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("FFmpeg command: %s", " ".join(cmd))
+            
+            # The child inherits only the two input descriptors
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                pass_fds=(animation_fd, voice_fd)
+            )
+            _, stderr = proc.communicate()
+            
+            if proc.returncode != 0:
+                logger.error(f"FFmpeg failed with error: {stderr.decode('utf-8', errors='replace')}")
+                return None
+            
+            if not _file_exists(final_output_mp4_path):
+                raise RuntimeError("Output file was not created")
+            
+            log_operation(logger, "merge_assets_streamed", "completed", {
+                "output_path": str(final_output_mp4_path),
+                "duration_sec": time.time() - start_time,
+                "file_size_bytes": get_file_size(final_output_mp4_path)
+            })
+            
+            return final_output_mp4_path
+            
+        except Exception as e:
+            log_operation(logger, "merge_assets_streamed", "failed", {
+                "error": str(e),
+                "output_path": str(final_output_mp4_path)
+            }, level="ERROR")
+            return None
+    
+    def compose_many(self, script_paths: List[Path], workers: Optional[int] = None) -> List[Optional[Path]]:
+        """
+        Compose videos for several scripts in parallel worker processes
+        
+        Each ffmpeg already uses config.threads threads, so by default only
+        cpu_count // config.threads compositions run at once to keep the
+        cores busy without oversubscribing them.
+        
+        Args:
+            script_paths: Paths to script JSON files
+            workers: Number of worker processes (default: cpu_count // config.threads)
+            
+        Returns:
+            list: Path to each final video, or None where composition failed, in input order
+        """
+        results: List[Optional[Path]] = [None] * len(script_paths)
+        if not script_paths:
+            return []
+        
+        workers = min(workers or max(1, (os.cpu_count() or 1) // config.threads), len(script_paths))
+        log_operation(logger, "compose_many", "started",
+                     {"scripts": len(script_paths), "workers": workers})
+        
+        # Probe the encoder once here rather than in every spawned worker
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_compose_worker,
+            initargs=(config.video_codec,)
+        ) as executor:
+            futures = {
+                executor.submit(_compose_one, str(script_path)): i
+                for i, script_path in enumerate(script_paths)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    log_operation(logger, "compose_many", "script_failed",
+                                 {"script": str(script_paths[i]), "error": str(e)}, level="ERROR")
+        
+        log_operation(logger, "compose_many", "completed",
+                     {"scripts": len(script_paths),
+                      "failed": sum(result is None for result in results)})
+        return results
+    
     def compose_video(
         self,
         script_json_path: Path,
@@ -222,8 +560,9 @@ class VideoComposer:
         """
         try:
             # Load script metadata
-            with open(script_json_path, 'r', encoding='utf-8') as f:
-                script_data = json.load(f)
+            script_data = load_json_file(script_json_path)
+            if script_data is None:
+                return None
             
             source_name = Path(script_data["metadata"]["source"]["source"]).stem
             
@@ -239,7 +578,7 @@ class VideoComposer:
             final_video_path = self.merge_assets(
                 animation_mp4_path=animation_path,
                 voice_mp3_path=voiceover_path,
-                subtitles_srt_path=subtitles_path if subtitles_path.exists() else None
+                subtitles_srt_path=subtitles_path if _file_exists(subtitles_path) else None
             )
             
             return final_video_path
@@ -247,3 +586,17 @@ class VideoComposer:
         except Exception as e:
             logger.error(f"Video composition failed: {str(e)}")
             return None
+
+# Per-process composer used by _compose_one
+_worker_composer: Optional[VideoComposer] = None
+
+def _init_compose_worker(video_codec: str) -> None:
+    """Reuse the parent's encoder choice instead of probing again in each worker"""
+    config.video_codec = video_codec
+
+def _compose_one(script_path: str) -> Optional[Path]:
+    """Compose one script's video in a worker process (see VideoComposer.compose_many)"""
+    global _worker_composer
+    if _worker_composer is None:
+        _worker_composer = VideoComposer()
+    return _worker_composer.compose_video(Path(script_path))
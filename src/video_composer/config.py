@@ -1,15 +1,16 @@
 import os
 from pathlib import Path
-from typing import Dict, Any
-from src.utils.file_utils import load_json_file
+from typing import Dict, Any, Optional
+from src.utils.main_config import get_main_config
+from src.utils.ffmpeg_utils import SOFTWARE_H264_ENCODER, detect_h264_encoder, encoder_args
 
 # Load main configuration
-_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
-_main_config = load_json_file(_CONFIG_PATH)
+_main_config = get_main_config()
+_composer_settings = _main_config["module_specific"].get("video_composer", {})
 
 class VideoComposerConfig:
     """Configuration for the Video Composer module"""
-    
+
     def __init__(self):
         # Paths from main config
         self.base_data_path = Path(_main_config["base_settings"]["base_data_path"])
@@ -22,17 +23,25 @@ class VideoComposerConfig:
         self.resolution = _main_config["module_specific"]["animator"]["output_resolution"]
         self.fps = _main_config["module_specific"]["animator"]["fps"]
         
-        # Encoding settings
-        self.video_codec = "libx264"
+        # FFmpeg settings
+        self.ffmpeg_path = "ffmpeg"  # Assumes ffmpeg is in PATH
+        self.ffprobe_path = "ffprobe"  # For duration checking
+        self.threads = 2  # Number of threads for encoding
+        
+        # Encoding settings; the video codec is resolved on first use (see video_codec)
+        self.force_codec = _composer_settings.get("force_codec")
+        self._video_codec: Optional[str] = None
+        self._ffmpeg_encode_args: Optional[tuple] = None
         self.audio_codec = "aac"
         self.video_bitrate = "8000k" if self.resolution == "4k" else "5000k" if self.resolution == "1080p" else "2500k"
         self.audio_bitrate = "192k"
         self.crf = 18  # Constant Rate Factor (lower = better quality)
         
-        # FFmpeg settings
-        self.ffmpeg_path = "ffmpeg"  # Assumes ffmpeg is in PATH
-        self.ffprobe_path = "ffprobe"  # For duration checking
-        self.threads = 2  # Number of threads for encoding
+        # libx264 arguments used to retry a job whose hardware encoder fails
+        self.software_encode_args = self.encode_args(SOFTWARE_H264_ENCODER)
+        
+        # Videos encoded per ffmpeg process by merge_assets_batch
+        self.batch_size = 8
         
         # Sync tolerance (seconds)
         self.sync_tolerance = 0.5
@@ -45,5 +54,57 @@ class VideoComposerConfig:
         self.supported_audio_formats = [".mp3", ".wav"]
         self.supported_subtitle_formats = [".srt", ".vtt"]
 
+    @property
+    def video_codec(self) -> str:
+        """
+        Video encoder for merges: forced codec, else NVENC/VideoToolbox when
+        available, else libx264
+        
+        Detection runs a test encode, so it happens on first use rather than
+        at import; compose_many hands the result to its workers.
+        """
+        if self._video_codec is None:
+            self._video_codec = self.force_codec or detect_h264_encoder(self.ffmpeg_path)
+        return self._video_codec
+
+    @video_codec.setter
+    def video_codec(self, codec: str) -> None:
+        self._video_codec = codec
+        self._ffmpeg_encode_args = None
+
+    @property
+    def ffmpeg_encode_args(self) -> tuple:
+        """Encoding arguments shared by every merge, built once for video_codec"""
+        if self._ffmpeg_encode_args is None:
+            self._ffmpeg_encode_args = self.encode_args(self.video_codec)
+        return self._ffmpeg_encode_args
+
+    def encode_args(self, codec: str) -> tuple:
+        """
+        Build the ffmpeg encoding arguments for a video encoder
+        
+        Hardware encoders use their own rate control from ffmpeg_utils.
+        
+        Args:
+            codec: Encoder name (e.g. 'h264_nvenc', 'libx264')
+            
+        Returns:
+            tuple: ffmpeg output arguments (video, audio and muxing options)
+        """
+        if codec == SOFTWARE_H264_ENCODER:
+            video_args = ("-c:v", codec, "-b:v", self.video_bitrate, "-crf", str(self.crf))
+        else:
+            video_args = tuple(encoder_args(codec))
+            if "-b:v" not in video_args:
+                video_args += ("-b:v", self.video_bitrate)
+        return (
+            *video_args,
+            "-c:a", self.audio_codec,
+            "-b:a", self.audio_bitrate,
+            "-threads", str(self.threads),
+            "-shortest",  # End at shortest input duration
+            "-movflags", "+faststart"  # For streaming
+        )
+
 # Singleton config instance
 config = VideoComposerConfig()
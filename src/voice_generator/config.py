@@ -1,11 +1,11 @@
 import os
 from pathlib import Path
-from typing import Dict, Any
-from src.utils.file_utils import load_json_file
+from typing import Dict, Any, Optional, Tuple
+from src.utils.main_config import get_main_config
 
 # Load main configuration
-_CONFIG_PATH = Path(__file__).parent.parent.parent / "config" / "main_config.json"
-_main_config = load_json_file(_CONFIG_PATH)
+_main_config = get_main_config()
+_voice_settings = _main_config["module_specific"].get("voice_generator", {})
 
 class VoiceGeneratorConfig:
     """Configuration for the Voice Generator module"""
@@ -26,12 +26,35 @@ class VoiceGeneratorConfig:
         # Subtitle settings
         self.subtitle_format = "srt"
         self.max_line_length = 42  # Characters per subtitle line
-        self.max_line_duration = 3.0  # Seconds per subtitle
+        self.max_line_duration = 3.0  # Seconds per subtitle (estimated timings only)
+        self.subtitle_timestamps = True  # Time subtitles from the TTS API's character alignment
+        
+        # Synthesized audio cache (keyed on text, voice, model and settings)
+        self.tts_cache_dir = self.output_dir / ".tts_cache"
+        self.tts_cache_max_bytes = 512 * 1024 * 1024
+        self.tts_cache_memory_bytes = 32 * 1024 * 1024
+        self.tts_cache_ttl_seconds = 30 * 24 * 3600
+        
+        # Scripts are synthesized per paragraph so each one is cached separately;
+        # longer paragraphs are split into sentence groups of at most this size
+        self.tts_segment_chars = 1000
+        
+        # Synthesis backend: "elevenlabs" (API) or "local_xtts" (on-device
+        # XTTS-v2 through the optional auralis package; needs ffmpeg for MP3)
+        self.backend = _voice_settings.get("backend", "elevenlabs")
+        self.local_tts_model = _voice_settings.get("local_tts_model", "AstraMindAI/xttsv2")
+        self.local_tts_gpt_model = _voice_settings.get("local_tts_gpt_model", "AstraMindAI/xtts2-gpt")
+        self.local_tts_concurrency = 16  # Requests Auralis may batch together
+        # Reference recordings to clone, by ElevenLabs voice_id ("default" for any other)
+        self.local_speaker_files = {"default": self.base_data_path / "voices" / "default.wav"}
         
         # API settings
         self.timeout_seconds = 30
+        self.max_concurrency = 4  # Concurrent TTS requests per event loop
+        self.stream_chunk_size = 64 * 1024  # Bytes per write when streaming audio to disk
         self.max_retries = 3
-        self.retry_delay = 2
+        self.retry_base = 0.5  # Seconds; backoff ceiling doubles per attempt
+        self.retry_max_delay = 30
         
         # Voice profiles (voice_id: description)
         self.voice_profiles = {
@@ -54,6 +77,31 @@ class VoiceGeneratorConfig:
                 "similarity_boost": 0.7
             }
         }
+        
+        # Lookup by ElevenLabs voice_id (profile fields plus its "name") and
+        # the profile names, built once for constant-time membership checks
+        self._voice_id_index = {
+            profile["voice_id"]: {"name": name, **profile}
+            for name, profile in self.voice_profiles.items()
+        }
+        self._profile_names = tuple(self.voice_profiles)
+    
+    @property
+    def profile_names(self) -> Tuple[str, ...]:
+        """Names of the configured voice profiles"""
+        return self._profile_names
+    
+    def get_profile_by_voice_id(self, voice_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the voice profile using an ElevenLabs voice_id
+        
+        Args:
+            voice_id: ElevenLabs voice identifier
+            
+        Returns:
+            dict: Profile settings with its "name", or None if no profile uses that voice
+        """
+        return self._voice_id_index.get(voice_id)
 
 # Singleton config instance
 config = VoiceGeneratorConfig()
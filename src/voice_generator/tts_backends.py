@@ -0,0 +1,168 @@
+import asyncio
+import subprocess
+from pathlib import Path
+from typing import Optional, Dict, Any, List, NamedTuple, Protocol, Union
+
+try:
+    from auralis import TTS, TTSRequest
+except ImportError:
+    TTS = TTSRequest = None
+from src.utils.logging_utils import setup_logging
+from src.utils.file_utils import save_bytes_file_async
+from .config import config
+
+# Initialize logging
+logger = setup_logging("tts_backends")
+
+class TTSResponse(NamedTuple):
+    """Outcome of a TTS request (audio is the output path when written to a file)"""
+    audio: Union[bytes, Path, None]
+    status: Optional[int]
+    retry_after: Optional[float]
+    alignment: Optional[Dict[str, Any]] = None
+
+class TTSBackend(Protocol):
+    """
+    What VoiceGenerator needs from a speech synthesizer
+
+    TTSClient (ElevenLabs) and LocalXTTSBackend implement it. Audio is MP3.
+    """
+
+    supports_timestamps: bool
+
+    def generate_audio(
+        self,
+        text: str,
+        voice_id: str = None,
+        model_id: str = None,
+        stability: float = None,
+        similarity_boost: float = None
+    ) -> Optional[bytes]: ...
+
+    async def request_audio_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        model_id: str = None,
+        stability: float = None,
+        similarity_boost: float = None,
+        output_path: Path = None
+    ) -> TTSResponse: ...
+
+    async def generate_many_async(self, texts: List[str], voice_id: str = None) -> List[Optional[bytes]]: ...
+
+def _wav_to_mp3(wav_data: bytes) -> bytes:
+    """Encode WAV audio as MP3 at the configured bitrate and sample rate (needs ffmpeg)"""
+    result = subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "wav", "-i", "pipe:0",
+            "-ar", str(config.sample_rate), "-b:a", config.bitrate,
+            "-f", "mp3", "pipe:1"
+        ],
+        input=wav_data,
+        capture_output=True,
+        check=True
+    )
+    return result.stdout
+
+class LocalXTTSBackend:
+    """
+    On-device XTTS-v2 synthesis through Auralis (a CUDA GPU is strongly recommended)
+
+    Voices are cloned from reference recordings: config.local_speaker_files
+    maps an ElevenLabs voice_id (or "default") to a WAV file, so existing
+    voice profiles keep working. Stability and similarity settings have no
+    XTTS equivalent and are ignored, and no character timings are produced.
+
+    Async calls run on the caller's event loop; Auralis batches requests that
+    are in flight together, so concurrent callers (or generate_many_async)
+    get much better GPU throughput than serial calls.
+    """
+
+    supports_timestamps = False
+
+    def __init__(self):
+        if TTS is None:
+            raise RuntimeError("The local_xtts backend needs the auralis package")
+        self._tts = TTS(scheduler_max_concurrency=config.local_tts_concurrency).from_pretrained(
+            config.local_tts_model,
+            gpt_model=config.local_tts_gpt_model
+        )
+        self.speaker_files = config.local_speaker_files
+        logger.info(f"Loaded local TTS model {config.local_tts_model}")
+
+    def _build_request(self, text: str, voice_id: Optional[str]) -> "TTSRequest":
+        """Auralis request for text in the reference voice mapped to voice_id"""
+        speaker_file = self.speaker_files.get(voice_id) or self.speaker_files["default"]
+        return TTSRequest(text=text, speaker_files=[str(speaker_file)])
+
+    def generate_audio(
+        self,
+        text: str,
+        voice_id: str = None,
+        model_id: str = None,
+        stability: float = None,
+        similarity_boost: float = None
+    ) -> Optional[bytes]:
+        """
+        Synthesize speech (blocking; from a coroutine use request_audio_async)
+
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice whose reference recording to clone
+            model_id: Unused (the loaded model is always used)
+            stability: Unused
+            similarity_boost: Unused
+
+        Returns:
+            bytes: Audio data in MP3 format, or None if failed
+        """
+        try:
+            output = self._tts.generate_speech(self._build_request(text, voice_id))
+            return _wav_to_mp3(output.to_bytes())
+        except Exception as e:
+            logger.error(f"Local TTS synthesis failed: {str(e)}")
+            return None
+
+    async def request_audio_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        model_id: str = None,
+        stability: float = None,
+        similarity_boost: float = None,
+        output_path: Path = None
+    ) -> TTSResponse:
+        """
+        Synthesize speech on the running event loop, written to output_path if given
+
+        Returns:
+            TTSResponse: Audio (or output_path) on success; status is always None
+        """
+        try:
+            output = await self._tts.generate_speech_async(self._build_request(text, voice_id))
+            audio = await asyncio.to_thread(_wav_to_mp3, output.to_bytes())
+        except Exception as e:
+            logger.error(f"Local TTS synthesis failed: {str(e)}")
+            return TTSResponse(None, None, None)
+
+        if output_path is None:
+            return TTSResponse(audio, None, None)
+        if not await save_bytes_file_async(audio, output_path):
+            return TTSResponse(None, None, None)
+        return TTSResponse(Path(output_path), None, None)
+
+    async def generate_many_async(self, texts: List[str], voice_id: str = None) -> List[Optional[bytes]]:
+        """
+        Synthesize several texts in one go, letting Auralis batch them on the GPU
+
+        Args:
+            texts: Texts to convert to speech
+            voice_id: Voice to use for all of them
+
+        Returns:
+            list: MP3 data per text (None where synthesis failed), in order
+        """
+        results = await asyncio.gather(*(self.request_audio_async(text, voice_id) for text in texts))
+        return [result.audio for result in results]
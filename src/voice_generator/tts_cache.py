@@ -0,0 +1,314 @@
+import os
+import json
+import time
+import shutil
+import struct
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Dict, Any
+from src.utils.logging_utils import setup_logging
+from src.utils.file_utils import create_directory_if_not_exists
+
+# Initialize logging
+logger = setup_logging("tts_cache")
+
+class TTSCache:
+    """
+    Content-addressed cache of synthesized audio.
+
+    Entries are keyed on everything that affects the audio (text, voice,
+    model, voice settings) and stored as <key>.mp3 with a <key>.json sidecar.
+    Recently used clips are also kept in memory. The disk cache is trimmed to
+    max_bytes by deleting the least recently used clips; a hit refreshes the
+    clip's mtime, which is what recency is judged by. Expiry (ttl_seconds) is
+    judged by the sidecar's created_at instead, so frequently used clips
+    still age out.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_bytes: int = 512 * 1024 * 1024,
+        memory_max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.memory_max_bytes = memory_max_bytes
+        self.ttl_seconds = ttl_seconds
+        create_directory_if_not_exists(self.cache_dir)
+
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: Optional[int] = None  # Computed on first store
+        self._created_at: Dict[str, float] = {}  # Sidecar timestamps already read
+
+    @staticmethod
+    def make_key(
+        text: str,
+        voice_id: str,
+        model_id: str,
+        stability: float,
+        similarity_boost: float
+    ) -> str:
+        """
+        Build the cache key for a synthesis request
+
+        Whitespace runs in the text are collapsed since they do not change
+        the spoken audio; case is kept because it can (e.g. "US" vs "us").
+
+        Returns:
+            str: Hex digest usable as a file name
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (" ".join(text.split()), voice_id, model_id):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x1f")
+        digest.update(struct.pack("<dd", stability, similarity_boost))
+        return digest.hexdigest()
+
+    def _audio_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.mp3"
+
+    def _expired(self, key: str) -> bool:
+        """Whether a clip is older than ttl_seconds, by its sidecar's created_at"""
+        if self.ttl_seconds is None:
+            return False
+        with self._lock:
+            created_at = self._created_at.get(key)
+        if created_at is None:
+            try:
+                with open(self._audio_path(key).with_suffix(".json"), 'rb') as f:
+                    created_at = float(json.loads(f.read())["created_at"])
+            except (OSError, ValueError, KeyError, TypeError):
+                return True  # Age unknown, so the clip can't be trusted to be fresh
+            with self._lock:
+                self._created_at[key] = created_at
+        return time.time() - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up cached audio
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            bytes: MP3 data, or None on a miss
+        """
+        if self._expired(key):
+            self._delete(key)
+            return None
+
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                logger.debug(f"TTS cache hit (memory): {key}")
+                return data
+
+        audio_path = self._audio_path(key)
+        try:
+            data = audio_path.read_bytes()
+            os.utime(audio_path)  # Mark as recently used
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Discarding unreadable TTS cache entry {audio_path}: {str(e)}")
+            self._delete(key)
+            return None
+
+        self._remember(key, data)
+        logger.debug(f"TTS cache hit (disk): {key}")
+        return data
+
+    def get_alignment(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the character timings stored with a clip
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            dict: Alignment as returned by the TTS API, or None if not stored
+        """
+        try:
+            with open(self._audio_path(key).with_suffix(".json"), 'rb') as f:
+                return json.loads(f.read()).get("alignment")
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, data: bytes, text: str = "", alignment: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Store audio (written to a temp file and renamed into place)
+
+        Args:
+            key: Key from make_key
+            data: MP3 data
+            text: Source text, a preview of which is kept in the sidecar
+            alignment: Character timings, kept in the sidecar when given
+
+        Returns:
+            bool: True if the audio was stored
+        """
+        audio_path = self._audio_path(key)
+        tmp_path = audio_path.with_name(audio_path.name + ".tmp")
+        try:
+            tmp_path.write_bytes(data)
+            self._commit(key, tmp_path, len(data), text, alignment)
+        except OSError as e:
+            logger.error(f"Failed to store TTS cache entry {audio_path}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        self._remember(key, data)
+        self._account(len(data))
+        return True
+
+    def set_from_file(self, key: str, source_path: Path, text: str = "") -> bool:
+        """
+        Store audio already written to disk (copied, never read into memory)
+
+        Args:
+            key: Key from make_key
+            source_path: MP3 file to copy into the cache
+            text: Source text, a preview of which is kept in the sidecar
+
+        Returns:
+            bool: True if the audio was stored
+        """
+        audio_path = self._audio_path(key)
+        tmp_path = audio_path.with_name(audio_path.name + ".tmp")
+        try:
+            shutil.copyfile(source_path, tmp_path)
+            size = tmp_path.stat().st_size
+            self._commit(key, tmp_path, size, text)
+        except OSError as e:
+            logger.error(f"Failed to store TTS cache entry {audio_path}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        self._account(size)
+        return True
+
+    def copy_to(self, key: str, dest_path: Path) -> bool:
+        """
+        Write cached audio to dest_path, copying file to file on a disk hit
+
+        Args:
+            key: Key from make_key
+            dest_path: Destination MP3 path
+
+        Returns:
+            bool: True on a hit (dest_path written), False on a miss
+        """
+        if self._expired(key):
+            self._delete(key)
+            return False
+
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+        try:
+            if data is not None:
+                Path(dest_path).write_bytes(data)
+                logger.debug(f"TTS cache hit (memory): {key}")
+                return True
+
+            audio_path = self._audio_path(key)
+            shutil.copyfile(audio_path, dest_path)
+            os.utime(audio_path)  # Mark as recently used
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Failed to copy TTS cache entry {key} to {dest_path}: {str(e)}")
+            return False
+
+        logger.debug(f"TTS cache hit (disk): {key}")
+        return True
+
+    def _commit(
+        self,
+        key: str,
+        tmp_path: Path,
+        size: int,
+        text: str,
+        alignment: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Rename a fully written temp file into place and write its sidecar"""
+        audio_path = self._audio_path(key)
+        os.replace(tmp_path, audio_path)
+        created_at = time.time()
+        sidecar = {
+            "created_at": created_at,
+            "ttl": self.ttl_seconds,
+            "bytes": size,
+            "text_preview": text[:80]
+        }
+        if alignment is not None:
+            sidecar["alignment"] = alignment
+        audio_path.with_suffix(".json").write_text(json.dumps(sidecar), encoding="utf-8")
+        with self._lock:
+            self._created_at[key] = created_at
+
+    def _account(self, size: int) -> None:
+        """Add a stored clip to the disk total, curating once it passes max_bytes"""
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += size
+            over_limit = self._disk_bytes is None or self._disk_bytes > self.max_bytes
+        if over_limit:
+            self.curate()
+
+    def curate(self) -> None:
+        """Delete least recently used clips until the disk cache fits in max_bytes"""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".mp3") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.name[:-4]))
+                    total += stat.st_size
+
+        evicted = 0
+        if total > self.max_bytes:
+            for _, size, key in sorted(entries):
+                self._delete(key)
+                total -= size
+                evicted += 1
+                if total <= self.max_bytes:
+                    break
+            logger.info(f"Evicted {evicted} TTS cache entries from {self.cache_dir}")
+
+        with self._lock:
+            self._disk_bytes = total
+
+    def _remember(self, key: str, data: bytes) -> None:
+        """Keep a clip in the in-memory LRU, dropping the oldest past memory_max_bytes"""
+        if len(data) > self.memory_max_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.memory_max_bytes:
+                _, dropped = self._memory.popitem(last=False)
+                self._memory_bytes -= len(dropped)
+
+    def _delete(self, key: str) -> None:
+        """Remove a clip and its sidecar from disk and memory"""
+        audio_path = self._audio_path(key)
+        audio_path.unlink(missing_ok=True)
+        audio_path.with_suffix(".json").unlink(missing_ok=True)
+        with self._lock:
+            self._created_at.pop(key, None)
+            dropped = self._memory.pop(key, None)
+            if dropped is not None:
+                self._memory_bytes -= len(dropped)
@@ -1,23 +1,66 @@
 import os
+import re
 import time
 import json
+import base64
+import random
+import asyncio
+import functools
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Mapping, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from src.utils.logging_utils import setup_logging, log_operation
 from src.utils.file_utils import (
     create_directory_if_not_exists,
-    save_text_file,
-    get_file_size
+    stream_text_file_writer,
+    save_bytes_file_async
 )
+from src.utils.http_client import get_shared_client, run_sync
 from .config import config
+from .tts_cache import TTSCache
+from .tts_backends import TTSBackend, TTSResponse, LocalXTTSBackend
 from src.utils.api_keys import ELEVENLABS_API_KEY  # Import API key
 
 # Initialize logging
 logger = setup_logging("voice_generator")
 
+def _decode_timestamped_audio(body: Dict[str, Any]) -> Tuple[bytes, Optional[Dict[str, Any]]]:
+    """Split a /with-timestamps response into MP3 bytes and its character alignment"""
+    return base64.b64decode(body["audio_base64"]), body.get("alignment")
+
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a request body to JSON bytes (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP-date values are ignored)"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+def _is_retryable_status(status: Optional[int]) -> bool:
+    """Transport errors, 408, 429 and 5xx may succeed later; other 4xx responses won't"""
+    return status is None or status in (408, 429) or status >= 500
+
 class TTSClient:
-    """Wrapper class for TTS API calls"""
+    """Wrapper class for TTS API calls (the ElevenLabs TTSBackend)"""
+    
+    supports_timestamps = True
     
     def __init__(self):
         self.api_key = ELEVENLABS_API_KEY
@@ -28,16 +71,78 @@ class TTSClient:
             "Content-Type": "application/json"
         }
         
+        # Keep-alive session for the blocking paths, so repeated calls skip the
+        # DNS lookup and TCP/TLS handshake; retries are handled by the caller
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0))
+        
+        self.cache = TTSCache(
+            config.tts_cache_dir,
+            max_bytes=config.tts_cache_max_bytes,
+            memory_max_bytes=config.tts_cache_memory_bytes,
+            ttl_seconds=config.tts_cache_ttl_seconds
+        )
+        
+        # Shared async HTTP client and concurrency cap, bound per event loop
+        self._client = None
+        self._semaphore = None
+        self._client_loop = None
+    
+    def _bind_loop(self) -> None:
+        """Pick up the loop's shared AsyncClient and create a semaphore for it (they can't cross loops)"""
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            self._client = get_shared_client()
+            self._semaphore = asyncio.Semaphore(config.max_concurrency)
+            self._client_loop = loop
+    
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def __enter__(self) -> "TTSClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _build_request(
+        self,
+        text: str,
+        voice_id: Optional[str],
+        model_id: Optional[str],
+        stability: Optional[float],
+        similarity_boost: Optional[float]
+    ) -> Tuple[str, str, bytes]:
+        """Apply defaults and return (cache key, URL, encoded JSON body) for a synthesis request"""
+        voice_id = voice_id or config.default_voice_id
+        model_id = model_id or config.default_model
+        stability = stability or 0.5
+        similarity_boost = similarity_boost or 0.75
+        
+        cache_key = self.cache.make_key(text, voice_id, model_id, stability, similarity_boost)
+        payload = {
+            "text": text,
+            "model_id": model_id,
+            "voice_settings": {
+                "stability": stability,
+                "similarity_boost": similarity_boost
+            }
+        }
+        return cache_key, f"{self.base_url}/text-to-speech/{voice_id}", _encode_payload(payload)
+        
     def generate_audio(
         self,
         text: str,
         voice_id: str = None,
         model_id: str = None,
         stability: float = None,
-        similarity_boost: float = None
-    ) -> Optional[bytes]:
+        similarity_boost: float = None,
+        output_path: Path = None
+    ) -> Union[bytes, Path, None]:
         """
-        Generate audio using TTS API
+        Generate audio using TTS API (identical requests are served from the cache)
         
         Args:
             text: Text to convert to speech
@@ -45,47 +150,445 @@ class TTSClient:
             model_id: Model to use
             stability: Voice stability setting
             similarity_boost: Similarity boost setting
+            output_path: Stream the MP3 straight into this file instead of
+                returning it, so the audio is never held in memory
             
         Returns:
-            bytes: Audio data in MP3 format, or None if failed
+            bytes: Audio data in MP3 format (output_path when one was given), or None if failed
         """
-        if not voice_id:
-            voice_id = config.default_voice_id
-        if not model_id:
-            model_id = config.default_model
-            
-        url = f"{self.base_url}/text-to-speech/{voice_id}"
+        cache_key, url, body = self._build_request(text, voice_id, model_id, stability, similarity_boost)
+        if output_path is not None:
+            output_path = Path(output_path)
+            if self.cache.copy_to(cache_key, output_path):
+                return output_path
+            result = self._stream_to_file(f"{url}/stream", body, output_path)
+            if result.audio is not None:
+                self.cache.set_from_file(cache_key, output_path, text)
+            return result.audio
         
-        payload = {
-            "text": text,
-            "model_id": model_id,
-            "voice_settings": {
-                "stability": stability or 0.5,
-                "similarity_boost": similarity_boost or 0.75
-            }
-        }
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
-                json=payload,
-                headers=self.headers,
+                data=body,
                 timeout=self.timeout
             )
             response.raise_for_status()
+            self.cache.set(cache_key, response.content, text)
             return response.content
         except requests.exceptions.RequestException as e:
             logger.error(f"TTS API request failed: {str(e)}")
             return None
+    
+    def generate_audio_with_timestamps(
+        self,
+        text: str,
+        voice_id: str = None,
+        model_id: str = None,
+        stability: float = None,
+        similarity_boost: float = None
+    ) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """
+        Generate audio along with per-character timings (ElevenLabs /with-timestamps)
+        
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice to use
+            model_id: Model to use
+            stability: Voice stability setting
+            similarity_boost: Similarity boost setting
+            
+        Returns:
+            tuple: (MP3 bytes, alignment dict with "characters",
+            "character_start_times_seconds" and "character_end_times_seconds"),
+            or None if failed
+        """
+        cache_key, url, body = self._build_request(text, voice_id, model_id, stability, similarity_boost)
+        alignment = self.cache.get_alignment(cache_key)
+        if alignment is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached, alignment
+        
+        try:
+            response = self.session.post(
+                f"{url}/with-timestamps",
+                data=body,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            audio, alignment = _decode_timestamped_audio(response.json())
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            logger.error(f"TTS API request failed: {str(e)}")
+            return None
+        self.cache.set(cache_key, audio, text, alignment)
+        return audio, alignment
+    
+    async def generate_audio_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        model_id: str = None,
+        stability: float = None,
+        similarity_boost: float = None
+    ) -> Optional[bytes]:
+        """
+        Generate audio using TTS API without blocking the event loop (see generate_audio)
+        
+        At most config.max_concurrency requests are in flight per event loop.
+        """
+        result = await self.request_audio_async(text, voice_id, model_id, stability, similarity_boost)
+        return result.audio
+    
+    async def generate_many_async(self, texts: List[str], voice_id: str = None) -> List[Optional[bytes]]:
+        """
+        Generate audio for several texts concurrently (within config.max_concurrency)
+        
+        Args:
+            texts: Texts to convert to speech
+            voice_id: Voice to use for all of them
+            
+        Returns:
+            list: MP3 data per text (None where generation failed), in order
+        """
+        return await asyncio.gather(*(self.generate_audio_async(text, voice_id) for text in texts))
+    
+    async def request_audio_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        model_id: str = None,
+        stability: float = None,
+        similarity_boost: float = None,
+        output_path: Path = None
+    ) -> "TTSResponse":
+        """
+        Generate audio, also reporting how a failed request failed
+        
+        With output_path the MP3 is streamed into that file (see generate_audio).
+        
+        Returns:
+            TTSResponse: Audio (None if failed), HTTP status (None for cache
+            hits and transport errors) and the Retry-After delay in seconds
+        """
+        cache_key, url, body = self._build_request(text, voice_id, model_id, stability, similarity_boost)
+        if output_path is not None:
+            return await self._request_to_file_async(cache_key, url, body, text, Path(output_path))
+        
+        cached = await asyncio.to_thread(self.cache.get, cache_key)
+        if cached is not None:
+            return TTSResponse(cached, None, None)
+        
+        self._bind_loop()
+        try:
+            async with self._semaphore:
+                if self._client is not None:
+                    response = await self._client.post(
+                        url, content=body, headers=self.headers, timeout=self.timeout
+                    )
+                else:
+                    response = await asyncio.to_thread(
+                        self.session.post, url, data=body, timeout=self.timeout
+                    )
+        except Exception as e:
+            logger.error(f"TTS API request failed: {str(e)}")
+            return TTSResponse(None, None, None)
+        
+        if response.status_code >= 400:
+            logger.error(f"TTS API request failed with HTTP {response.status_code}")
+            return TTSResponse(None, response.status_code, _retry_after_seconds(response.headers.get("Retry-After")))
+        await asyncio.to_thread(self.cache.set, cache_key, response.content, text)
+        return TTSResponse(response.content, response.status_code, None)
+    
+    async def request_audio_with_timestamps_async(
+        self,
+        text: str,
+        voice_id: str = None,
+        model_id: str = None,
+        stability: float = None,
+        similarity_boost: float = None,
+        output_path: Path = None
+    ) -> "TTSResponse":
+        """
+        Generate audio with per-character timings, written to output_path if given
+        (see generate_audio_with_timestamps and request_audio_async)
+        
+        Returns:
+            TTSResponse: As request_audio_async, plus the alignment on success
+        """
+        cache_key, url, body = self._build_request(text, voice_id, model_id, stability, similarity_boost)
+        alignment = await asyncio.to_thread(self.cache.get_alignment, cache_key)
+        if alignment is not None:
+            if output_path is None:
+                cached = await asyncio.to_thread(self.cache.get, cache_key)
+                if cached is not None:
+                    return TTSResponse(cached, None, None, alignment)
+            elif await asyncio.to_thread(self.cache.copy_to, cache_key, Path(output_path)):
+                return TTSResponse(Path(output_path), None, None, alignment)
+        
+        self._bind_loop()
+        try:
+            async with self._semaphore:
+                if self._client is not None:
+                    response = await self._client.post(
+                        f"{url}/with-timestamps", content=body, headers=self.headers, timeout=self.timeout
+                    )
+                else:
+                    response = await asyncio.to_thread(
+                        self.session.post, f"{url}/with-timestamps", data=body, timeout=self.timeout
+                    )
+        except Exception as e:
+            logger.error(f"TTS API request failed: {str(e)}")
+            return TTSResponse(None, None, None)
+        
+        if response.status_code >= 400:
+            logger.error(f"TTS API request failed with HTTP {response.status_code}")
+            return TTSResponse(None, response.status_code, _retry_after_seconds(response.headers.get("Retry-After")))
+        try:
+            audio, alignment = _decode_timestamped_audio(response.json())
+        except (KeyError, ValueError) as e:
+            logger.error(f"Malformed TTS timestamps response: {str(e)}")
+            return TTSResponse(None, response.status_code, None)
+        
+        await asyncio.to_thread(self.cache.set, cache_key, audio, text, alignment)
+        if output_path is None:
+            return TTSResponse(audio, response.status_code, None, alignment)
+        if not await save_bytes_file_async(audio, output_path):
+            return TTSResponse(None, None, None)
+        return TTSResponse(Path(output_path), response.status_code, None, alignment)
+    
+    async def _request_to_file_async(
+        self,
+        cache_key: str,
+        url: str,
+        body: bytes,
+        text: str,
+        output_path: Path
+    ) -> "TTSResponse":
+        """Streamed variant of request_audio_async that writes the MP3 to output_path"""
+        if await asyncio.to_thread(self.cache.copy_to, cache_key, output_path):
+            return TTSResponse(output_path, None, None)
+        
+        self._bind_loop()
+        async with self._semaphore:
+            if self._client is not None:
+                result = await self._stream_to_file_async(f"{url}/stream", body, output_path)
+            else:
+                result = await asyncio.to_thread(self._stream_to_file, f"{url}/stream", body, output_path)
+        if result.audio is not None:
+            await asyncio.to_thread(self.cache.set_from_file, cache_key, output_path, text)
+        return result
+    
+    def _stream_to_file(self, url: str, body: bytes, output_path: Path) -> "TTSResponse":
+        """
+        POST a synthesis request and write the response body to output_path as it arrives
+        
+        Chunks go to "<name>.part", which is renamed into place once complete
+        so a failed download never leaves a truncated MP3 behind.
+        """
+        part_path = output_path.with_name(output_path.name + ".part")
+        try:
+            with self.session.post(url, data=body, timeout=self.timeout, stream=True) as response:
+                if response.status_code >= 400:
+                    logger.error(f"TTS API request failed with HTTP {response.status_code}")
+                    return TTSResponse(None, response.status_code, _retry_after_seconds(response.headers.get("Retry-After")))
+                with open(part_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=config.stream_chunk_size):
+                        f.write(chunk)
+            os.replace(part_path, output_path)
+            return TTSResponse(output_path, response.status_code, None)
+        except (requests.exceptions.RequestException, OSError) as e:
+            logger.error(f"TTS API request failed: {str(e)}")
+            part_path.unlink(missing_ok=True)
+            return TTSResponse(None, None, None)
+    
+    async def _stream_to_file_async(self, url: str, body: bytes, output_path: Path) -> "TTSResponse":
+        """_stream_to_file over the shared AsyncClient"""
+        part_path = output_path.with_name(output_path.name + ".part")
+        try:
+            async with self._client.stream(
+                "POST", url, content=body, headers=self.headers, timeout=self.timeout
+            ) as response:
+                if response.status_code >= 400:
+                    logger.error(f"TTS API request failed with HTTP {response.status_code}")
+                    return TTSResponse(None, response.status_code, _retry_after_seconds(response.headers.get("Retry-After")))
+                # Chunk writes land in the page cache; a thread hop per chunk would cost more
+                with open(part_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(config.stream_chunk_size):
+                        f.write(chunk)
+            os.replace(part_path, output_path)
+            return TTSResponse(output_path, response.status_code, None)
+        except Exception as e:
+            logger.error(f"TTS API request failed: {str(e)}")
+            part_path.unlink(missing_ok=True)
+            return TTSResponse(None, None, None)
+
+# Script segmentation for per-paragraph synthesis
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# MPEG audio Layer III frame header tables, indexed by the header's version bits
+_MP3_BITRATES_KBPS = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),  # MPEG-1
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),      # MPEG-2
+    0: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),      # MPEG-2.5
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+def _mp3_frame(data: bytes, pos: int) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse the Layer III frame header at pos
+    
+    Returns:
+        tuple: (frame length in bytes, samples, sample rate), or None if pos is not a frame header
+    """
+    header = int.from_bytes(data[pos:pos + 4], "big")
+    version = (header >> 19) & 3
+    bitrate_index = (header >> 12) & 15
+    rate_index = (header >> 10) & 3
+    if (header >> 21) != 0x7FF or version == 1 or ((header >> 17) & 3) != 1 \
+            or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    bitrate = _MP3_BITRATES_KBPS[version][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    samples = 1152 if version == 3 else 576
+    return samples // 8 * bitrate // sample_rate + ((header >> 9) & 1), samples, sample_rate
+
+def _is_info_frame(data: bytes, pos: int) -> bool:
+    """Whether the frame at pos is a Xing/Info metadata frame (silent, not part of the audio)"""
+    header = int.from_bytes(data[pos:pos + 4], "big")
+    mono = ((header >> 6) & 3) == 3
+    if ((header >> 19) & 3) == 3:  # MPEG-1
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+    tag = pos + 4 + side_info
+    return data[tag:tag + 4] in (b"Xing", b"Info")
+
+def _first_frame(data: bytes, pos: int = 0) -> int:
+    """Offset of the first Layer III frame header at or after pos, or len(data) if none"""
+    while pos <= len(data) - 4:
+        if _mp3_frame(data, pos) is not None:
+            return pos
+        pos += 1
+    return len(data)
+
+def _strip_mp3_metadata(data: bytes) -> bytes:
+    """
+    Audio frames of MP3 data without ID3 tags or a leading Xing/Info frame
+    
+    Tags and the Info frame only describe the file they start; concatenated
+    mid-stream they are decoded as noise or ~26 ms of silence each.
+    """
+    start, end = 0, len(data)
+    if data[:3] == b"ID3" and len(data) >= 10:
+        start = 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9])
+        if data[5] & 0x10:  # Footer present
+            start += 10
+    if end - start >= 128 and data[end - 128:end - 125] == b"TAG":  # ID3v1
+        end -= 128
+    data = data[start:end]
+    
+    pos = _first_frame(data)
+    frame = _mp3_frame(data, pos) if pos < len(data) else None
+    if frame is not None and _is_info_frame(data, pos):
+        return data[pos + frame[0]:]
+    return data[pos:]
+
+def _mp3_duration(data: bytes) -> float:
+    """
+    Playing time of MP3 data in seconds, found by walking its frame headers
+    
+    Only Layer III is recognized (what the TTS API returns); anything else,
+    such as an ID3 tag, is skipped. A leading Xing/Info frame is not counted.
+    """
+    data = _strip_mp3_metadata(data)
+    seconds = 0.0
+    pos = 0
+    end = len(data) - 4
+    while pos <= end:
+        frame = _mp3_frame(data, pos)
+        if frame is None:
+            pos += 1  # Not a Layer III frame header; resync
+            continue
+        length, samples, sample_rate = frame
+        pos += length
+        seconds += samples / sample_rate
+    return seconds
+
+def _merge_alignments(results: List[TTSResponse]) -> Optional[Dict[str, Any]]:
+    """
+    Join the character alignments of consecutively played audio segments
+    
+    Each segment's timings are shifted by the playing time of the audio before it.
+    """
+    characters, starts, ends = [], [], []
+    offset = 0.0
+    for result in results:
+        alignment = result.alignment
+        if alignment is None:
+            return None
+        characters.extend(alignment["characters"])
+        starts.extend(t + offset for t in alignment["character_start_times_seconds"])
+        ends.extend(t + offset for t in alignment["character_end_times_seconds"])
+        offset += _mp3_duration(result.audio)
+    return {
+        "characters": characters,
+        "character_start_times_seconds": starts,
+        "character_end_times_seconds": ends
+    }
+
+def _srt_time(ms: int) -> str:
+    """Convert milliseconds to SRT time format (HH:MM:SS,mmm)"""
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+def _srt_block(index: int, start_ms: int, end_ms: int, text: str) -> str:
+    """Format a single SRT block (times in integer milliseconds)"""
+    return f"{index}\n{_srt_time(start_ms)} --> {_srt_time(end_ms)}\n{text}"
 
 class VoiceGenerator:
     """Core class for generating voiceovers and subtitles"""
     
     def __init__(self):
         self.tts_client = TTSClient()
-        create_directory_if_not_exists(config.output_dir)
-        create_directory_if_not_exists(config.subtitle_dir)
+        self.backend = self._create_backend()
+        
+        # Settings read on every call, snapshotted once
+        self._output_dir = Path(config.output_dir)
+        self._subtitle_dir = Path(config.subtitle_dir)
+        self._max_line_len = config.max_line_length
+        self._max_line_ms = int(config.max_line_duration * 1000)
+        
+        create_directory_if_not_exists(self._output_dir)
+        create_directory_if_not_exists(self._subtitle_dir)
         logger.info("Voice Generator initialized")
+    
+    def _create_backend(self) -> TTSBackend:
+        """Synthesizer selected by config.backend, falling back to ElevenLabs if it can't load"""
+        if config.backend == "local_xtts":
+            try:
+                return LocalXTTSBackend()
+            except Exception as e:
+                logger.error(f"Failed to load local TTS backend, using ElevenLabs: {str(e)}")
+        elif config.backend != "elevenlabs":
+            logger.warning(f"Unknown TTS backend {config.backend!r}, using ElevenLabs")
+        return self.tts_client
+    
+    def close(self) -> None:
+        """Release the TTS client's pooled connections"""
+        self.tts_client.close()
+    
+    def __enter__(self) -> "VoiceGenerator":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
         
     def generate_voiceover(
         self,
@@ -95,7 +598,19 @@ class VoiceGenerator:
         **kwargs
     ) -> Optional[Path]:
         """
-        Generate voiceover audio from script text
+        Generate voiceover audio from script text (blocking wrapper around generate_voiceover_async)
+        """
+        return run_sync(self.generate_voiceover_async(script_text, voice_profile, output_mp3_path, **kwargs))
+    
+    async def generate_voiceover_async(
+        self,
+        script_text: str,
+        voice_profile: str = None,
+        output_mp3_path: str = None,
+        **kwargs
+    ) -> Optional[Path]:
+        """
+        Generate voiceover audio from script text without blocking the event loop
         
         Args:
             script_text: Text to convert to speech
@@ -106,74 +621,180 @@ class VoiceGenerator:
         Returns:
             Path: Path to generated MP3 file, or None if failed
         """
+        output_path, _ = await self._voiceover_async(script_text, voice_profile, output_mp3_path, False, **kwargs)
+        return output_path
+    
+    async def _voiceover_async(
+        self,
+        script_text: str,
+        voice_profile: Optional[str],
+        output_mp3_path: Optional[str],
+        with_alignment: bool,
+        **kwargs
+    ) -> Tuple[Optional[Path], Optional[Dict[str, Any]]]:
+        """
+        generate_voiceover_async, optionally also fetching character timings
+        
+        Returns:
+            tuple: (MP3 path, alignment); alignment is None unless with_alignment
+            was set, and both are None if generation failed
+        """
         start_time = time.time()
         log_operation(logger, "generate_voiceover", "started", 
                      {"voice_profile": voice_profile or "default"})
         
         try:
-            # Get voice settings
-            voice_settings = {}
-            if voice_profile and voice_profile in config.voice_profiles:
-                voice_settings = config.voice_profiles[voice_profile]
-            else:
-                voice_settings = {
-                    "voice_id": config.default_voice_id,
-                    "model": config.default_model
-                }
+            voice_settings = self._resolve_voice_settings(voice_profile)
             
             # Generate output path if not provided
             if not output_mp3_path:
                 timestamp = int(time.time())
-                output_mp3_path = config.output_dir / f"voiceover_{timestamp}.mp3"
+                output_mp3_path = self._output_dir / f"voiceover_{timestamp}.mp3"
             else:
                 output_mp3_path = Path(output_mp3_path)
             
-            # Generate audio
-            audio_data = None
-            for attempt in range(config.max_retries):
-                audio_data = self.tts_client.generate_audio(
-                    text=script_text,
-                    voice_id=voice_settings.get("voice_id"),
-                    model_id=voice_settings.get("model"),
-                    stability=voice_settings.get("stability"),
-                    similarity_boost=voice_settings.get("similarity_boost"),
-                    **kwargs
+            with_alignment = with_alignment and self.backend.supports_timestamps
+            request_audio = (
+                self.tts_client.request_audio_with_timestamps_async if with_alignment
+                else self.backend.request_audio_async
+            )
+            segments = self._segment_script(script_text)
+            if len(segments) <= 1:
+                # Generate audio into output_mp3_path (streamed unless timings are needed)
+                result = await self._request_with_retries(
+                    request_audio, script_text, voice_settings, output_path=output_mp3_path, **kwargs
                 )
-                if audio_data:
-                    break
-                time.sleep(config.retry_delay)
-            
-            if not audio_data:
-                raise RuntimeError("Failed to generate audio after retries")
-            
-            # Save audio file
-            with open(output_mp3_path, 'wb') as f:
-                f.write(audio_data)
+                if not result.audio:
+                    raise RuntimeError("Failed to generate audio after retries")
+                alignment = result.alignment
+            else:
+                # Each paragraph is synthesized and cached on its own so text
+                # shared between scripts is only paid for once; ElevenLabs
+                # returns CBR MP3, whose frames can be concatenated once each
+                # segment's tags and Info frame are stripped
+                results = await asyncio.gather(*(
+                    self._request_with_retries(request_audio, segment, voice_settings, **kwargs)
+                    for segment in segments
+                ))
+                if not all(result.audio for result in results):
+                    raise RuntimeError("Failed to generate audio after retries")
+                cache_hits = sum(1 for result in results if result.status is None)
+                logger.info(
+                    f"Voiceover segments: {len(segments)}, cache hits: {cache_hits} "
+                    f"({cache_hits / len(segments):.0%})"
+                )
+                audio = b"".join(_strip_mp3_metadata(result.audio) for result in results)
+                if not await save_bytes_file_async(audio, output_mp3_path):
+                    raise RuntimeError(f"Failed to write {output_mp3_path}")
+                alignment = _merge_alignments(results) if with_alignment else None
             
             duration = time.time() - start_time
-            file_size = get_file_size(output_mp3_path)
+            file_size = output_mp3_path.stat().st_size
             
             log_operation(logger, "generate_voiceover", "completed", {
                 "output_path": str(output_mp3_path),
                 "duration_sec": duration,
                 "file_size_bytes": file_size,
-                "voice_settings": voice_settings
+                "voice_settings": dict(voice_settings)
             })
             
-            return output_mp3_path
+            return output_mp3_path, alignment
             
         except Exception as e:
             log_operation(logger, "generate_voiceover", "failed", {
                 "error": str(e),
                 "voice_profile": voice_profile
             }, level="ERROR")
-            return None
+            return None, None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _resolve_voice_settings(voice_profile: Optional[str]) -> Mapping[str, Any]:
+        """
+        Voice settings for a profile name, falling back to the default voice
+        
+        Resolved once per profile; the result is read-only so it can be shared
+        between concurrent calls.
+        """
+        voice_settings = config.voice_profiles.get(voice_profile) if voice_profile else None
+        if voice_settings is None:
+            voice_settings = {
+                "voice_id": config.default_voice_id,
+                "model": config.default_model
+            }
+        return MappingProxyType(dict(voice_settings))
+
+    async def _request_with_retries(
+        self,
+        request_audio,
+        text: str,
+        voice_settings: Mapping[str, Any],
+        **kwargs
+    ) -> TTSResponse:
+        """
+        Call a TTSClient request_* coroutine, retrying failures that may be transient
+        
+        Returns:
+            TTSResponse: The successful response, or the last failed one
+        """
+        for attempt in range(config.max_retries):
+            result = await request_audio(
+                text=text,
+                voice_id=voice_settings.get("voice_id"),
+                model_id=voice_settings.get("model"),
+                stability=voice_settings.get("stability"),
+                similarity_boost=voice_settings.get("similarity_boost"),
+                **kwargs
+            )
+            if result.audio or attempt == config.max_retries - 1 or not _is_retryable_status(result.status):
+                break
+            
+            # Full jitter keeps concurrent workers from retrying in lockstep;
+            # a rate-limited response's Retry-After is honoured as a minimum
+            delay = random.uniform(0, min(config.retry_max_delay, config.retry_base * (2 ** attempt)))
+            if result.status == 429 and result.retry_after:
+                delay = max(delay, result.retry_after)
+            logger.warning(
+                f"TTS attempt {attempt + 1} failed (HTTP {result.status}). "
+                f"Retrying in {delay:.1f} seconds"
+            )
+            await asyncio.sleep(delay)
+        return result
+
+    def _segment_script(self, text: str) -> List[str]:
+        """
+        Split a script into paragraphs for separate synthesis
+        
+        Paragraphs longer than config.tts_segment_chars are split further into
+        groups of whole sentences.
+        """
+        max_chars = config.tts_segment_chars
+        segments = []
+        for paragraph in _PARAGRAPH_BREAK.split(text):
+            paragraph = paragraph.strip()
+            if len(paragraph) <= max_chars:
+                if paragraph:
+                    segments.append(paragraph)
+                continue
+            
+            group = []
+            group_len = 0
+            for sentence in _SENTENCE_END.split(paragraph):
+                if group and group_len + 1 + len(sentence) > max_chars:
+                    segments.append(' '.join(group))
+                    group = []
+                    group_len = 0
+                group_len += len(sentence) + (1 if group else 0)
+                group.append(sentence)
+            segments.append(' '.join(group))
+        return segments
 
     def generate_subtitles(
         self,
         script_text: str,
         audio_file_path: str,
-        output_srt_path: str = None
+        output_srt_path: str = None,
+        alignment: Optional[Dict[str, Any]] = None
     ) -> Optional[Path]:
         """
         Generate subtitles for the voiceover
@@ -182,6 +803,8 @@ class VoiceGenerator:
             script_text: Original script text
             audio_file_path: Path to audio file
             output_srt_path: Custom output path
+            alignment: Character timings from the TTS API; without them line
+                timings are estimated from line length
             
         Returns:
             Path: Path to generated SRT file, or None if failed
@@ -191,49 +814,38 @@ class VoiceGenerator:
                      {"audio_file": audio_file_path})
         
         try:
-            # In production, you would:
-            # 1. Use TTS API word timings if available, or
-            # 2. Run ASR on the generated audio to get timings
-            # This is a simplified placeholder implementation
-            
             # Generate output path if not provided
             if not output_srt_path:
                 output_srt_path = Path(audio_file_path).with_suffix('.srt')
             else:
                 output_srt_path = Path(output_srt_path)
             
-            # Split text into subtitle lines
-            lines = self._split_text_for_subtitles(script_text)
-            
-            # Generate dummy timings (in production, use actual word timings)
-            subtitles = []
-            start_time_sec = 0.0
-            for i, line in enumerate(lines, 1):
-                duration = min(
-                    len(line) * 0.1,  # Rough estimate: 0.1s per character
-                    config.max_line_duration
-                )
-                end_time_sec = start_time_sec + duration
-                
-                subtitles.append(
-                    self._format_srt_block(
-                        index=i,
-                        start_time=start_time_sec,
-                        end_time=end_time_sec,
-                        text=line
-                    )
-                )
-                start_time_sec = end_time_sec + 0.1  # Small gap between lines
+            # Split text into subtitle lines and time them in the same pass;
+            # lines are only collected when the alignment has to be checked
+            lines = self._iter_subtitle_lines(script_text)
+            timed_lines = None
+            if alignment:
+                lines = list(lines)
+                timed_lines = self._align_lines(lines, alignment)
+            timing = "alignment" if timed_lines is not None else "estimated"
+            if timed_lines is None:
+                timed_lines = self._estimate_line_times(lines)
             
-            # Save SRT file
-            srt_content = "\n\n".join(subtitles)
-            save_text_file(srt_content, output_srt_path)
+            # Blocks are written as they are formatted
+            subtitle_count = 0
+            with stream_text_file_writer(output_srt_path) as f:
+                for i, (line, start_ms, end_ms) in enumerate(timed_lines, 1):
+                    if i > 1:
+                        f.write("\n\n")
+                    f.write(_srt_block(i, start_ms, end_ms, line))
+                    subtitle_count = i
             
             duration = time.time() - start_time
             log_operation(logger, "generate_subtitles", "completed", {
                 "output_path": str(output_srt_path),
                 "duration_sec": duration,
-                "subtitle_count": len(subtitles)
+                "subtitle_count": subtitle_count,
+                "timing": timing
             })
             
             return output_srt_path
@@ -247,47 +859,116 @@ class VoiceGenerator:
 
     def _split_text_for_subtitles(self, text: str) -> list[str]:
         """Split text into appropriate lines for subtitles"""
-        words = text.split()
-        lines = []
+        return [line for line, _, _ in self._iter_subtitle_lines(text)]
+
+    def _iter_subtitle_lines(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """
+        Split text into subtitle lines, yielding (line, first, end) where
+        first:end is the line's range among the text's non-whitespace
+        characters, i.e. its slice of the TTS alignment once spaces are dropped
+        """
+        max_length = self._max_line_len
         current_line = []
+        current_len = 0  # Length of ' '.join(current_line), tracked instead of re-joining
+        first = 0
+        visible = 0  # Non-whitespace characters seen so far
         
-        for word in words:
-            if len(' '.join(current_line + [word])) <= config.max_line_length:
+        for word in text.split():
+            prospective = current_len + len(word) + (1 if current_line else 0)
+            if prospective <= max_length:
                 current_line.append(word)
+                current_len = prospective
             else:
-                lines.append(' '.join(current_line))
+                yield ' '.join(current_line), first, visible
                 current_line = [word]
+                current_len = len(word)
+                first = visible
+            visible += len(word)
         
         if current_line:
-            lines.append(' '.join(current_line))
-            
-        return lines
+            yield ' '.join(current_line), first, visible
+
+    def _estimate_line_times(self, lines: Iterable[Tuple[str, int, int]]) -> Iterator[Tuple[str, int, int]]:
+        """
+        Time subtitle lines without an alignment, yielding (line, start_ms, end_ms)
+        
+        Timings are integer milliseconds so no float rounding builds up.
+        """
+        max_line_ms = self._max_line_ms
+        start_ms = 0
+        for line, _, _ in lines:
+            end_ms = start_ms + min(len(line) * 100, max_line_ms)  # Rough estimate: 0.1s per character
+            yield line, start_ms, end_ms
+            start_ms = end_ms + 100  # Small gap between lines
 
-    def _format_srt_block(
+    def _align_lines(
         self,
-        index: int,
-        start_time: float,
-        end_time: float,
-        text: str
-    ) -> str:
-        """Format a single SRT block"""
-        def format_time(seconds: float) -> str:
-            """Convert seconds to SRT time format (HH:MM:SS,mmm)"""
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            seconds = seconds % 60
-            return f"{hours:02d}:{minutes:02d}:{seconds:06.3f}".replace('.', ',')
-        
-        return (
-            f"{index}\n"
-            f"{format_time(start_time)} --> {format_time(end_time)}\n"
-            f"{text}"
-        )
+        lines: List[Tuple[str, int, int]],
+        alignment: Dict[str, Any]
+    ) -> Optional[List[Tuple[str, int, int]]]:
+        """
+        Time subtitle lines from character timings, returning (line, start_ms, end_ms)
+        
+        Each line's non-whitespace character range (from _iter_subtitle_lines)
+        indexes the alignment once its whitespace entries are skipped. Returns
+        None (estimate instead) if the character counts disagree, e.g. when
+        the API normalized the text.
+        """
+        try:
+            characters = alignment["characters"]
+            starts = alignment["character_start_times_seconds"]
+            ends = alignment["character_end_times_seconds"]
+        except (KeyError, TypeError):
+            logger.warning("Alignment is missing character timings; estimating subtitle timings")
+            return None
+        
+        visible = [i for i, char in enumerate(characters) if not char.isspace()]
+        if len(visible) != (lines[-1][2] if lines else 0):
+            logger.warning("Alignment does not match the script text; estimating subtitle timings")
+            return None
+        if not lines:
+            return []
+        
+        if np is not None:
+            # Both line boundaries are looked up in the timing arrays in one gather each
+            firsts = np.fromiter((first for _, first, _ in lines), dtype=np.int64, count=len(lines))
+            char_ends = np.fromiter((end for _, _, end in lines), dtype=np.int64, count=len(lines))
+            visible = np.asarray(visible, dtype=np.int64)
+            last = max(len(visible) - 1, 0)
+            starts_ms = np.rint(np.asarray(starts)[visible[np.minimum(firsts, last)]] * 1000).astype(np.int64)
+            ends_ms = np.rint(np.asarray(ends)[visible[np.maximum(char_ends - 1, 0)]] * 1000).astype(np.int64)
+            ends_ms[char_ends == 0] = 0
+            starts_ms = np.where(firsts == char_ends, ends_ms, starts_ms)  # Empty lines sit at the previous end
+            return [
+                (line, start_ms, end_ms)
+                for (line, _, _), start_ms, end_ms in zip(lines, starts_ms.tolist(), ends_ms.tolist())
+            ]
+        
+        timed_lines = []
+        end_ms = 0
+        for line, first, end in lines:
+            if end > first:
+                start_ms = int(round(starts[visible[first]] * 1000))
+                end_ms = int(round(ends[visible[end - 1]] * 1000))
+            else:
+                start_ms = end_ms
+            timed_lines.append((line, start_ms, end_ms))
+        return timed_lines
 
     def process_script(
         self,
         script_json: Dict[str, Any],
         voice_profile: str = None
+    ) -> Dict[str, Optional[Path]]:
+        """
+        Process script to generate both voiceover and subtitles (blocking wrapper around process_script_async)
+        """
+        return run_sync(self.process_script_async(script_json, voice_profile))
+    
+    async def process_script_async(
+        self,
+        script_json: Dict[str, Any],
+        voice_profile: str = None
     ) -> Dict[str, Optional[Path]]:
         """
         Process script to generate both voiceover and subtitles
@@ -302,25 +983,82 @@ class VoiceGenerator:
         script_text = script_json.get("script", "")
         source_name = Path(script_json.get("metadata", {}).get("source", {}).get("source", "unknown")).stem
         
-        # Generate voiceover
-        voiceover_path = config.output_dir / f"{source_name}_voiceover.mp3"
-        voice_result = self.generate_voiceover(
-            script_text=script_text,
-            voice_profile=voice_profile,
-            output_mp3_path=voiceover_path
-        )
+        voiceover_path = self._output_dir / f"{source_name}_voiceover.mp3"
+        subtitle_path = self._subtitle_dir / f"{source_name}_subtitles.srt"
         
-        # Generate subtitles
-        subtitle_path = None
-        if voice_result:
-            subtitle_path = config.subtitle_dir / f"{source_name}_subtitles.srt"
-            self.generate_subtitles(
+        if config.subtitle_timestamps and self.backend.supports_timestamps:
+            # Subtitles are timed from the voiceover's character alignment
+            voice_result, alignment = await self._voiceover_async(
+                script_text, voice_profile, voiceover_path, True
+            )
+            subtitle_result = None
+            if voice_result:
+                subtitle_result = await asyncio.to_thread(
+                    self.generate_subtitles,
+                    script_text=script_text,
+                    audio_file_path=voiceover_path,
+                    output_srt_path=subtitle_path,
+                    alignment=alignment
+                )
+        else:
+            # Estimated timings don't depend on the audio, so the subtitles
+            # are written while the voiceover downloads
+            voice_task = asyncio.create_task(self._voiceover_async(
+                script_text, voice_profile, voiceover_path, False
+            ))
+            subtitle_task = asyncio.create_task(asyncio.to_thread(
+                self.generate_subtitles,
                 script_text=script_text,
                 audio_file_path=voiceover_path,
                 output_srt_path=subtitle_path
-            )
+            ))
+            (voice_result, _), subtitle_result = await asyncio.gather(voice_task, subtitle_task)
+            if not voice_result and subtitle_result:
+                subtitle_result.unlink(missing_ok=True)  # No voiceover to go with it
+                subtitle_result = None
         
         return {
             "voiceover": voiceover_path if voice_result else None,
-            "subtitles": subtitle_path
+            "subtitles": subtitle_result if voice_result else None
         }
+    
+    def process_scripts(
+        self,
+        scripts: List[Dict[str, Any]],
+        voice_profile: str = None,
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Optional[Path]]]:
+        """
+        Process several scripts concurrently (blocking wrapper around process_scripts_async)
+        """
+        return run_sync(self.process_scripts_async(scripts, voice_profile, max_concurrency))
+    
+    async def process_scripts_async(
+        self,
+        scripts: List[Dict[str, Any]],
+        voice_profile: str = None,
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Optional[Path]]]:
+        """
+        Process several scripts concurrently
+        
+        Two limits apply: max_concurrency caps the scripts in progress at once
+        (voiceover plus subtitles), and config.max_concurrency caps the TTS
+        requests in flight. Keep the latter within the concurrent request
+        limit of the ElevenLabs plan, or the extra requests just get 429s.
+        
+        Args:
+            scripts: Structured script data, one dict per script
+            voice_profile: Voice profile to use for all of them
+            max_concurrency: Most scripts processed at the same time
+            
+        Returns:
+            list: One process_script result per script, in order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def process_one(script: Dict[str, Any]) -> Dict[str, Optional[Path]]:
+            async with semaphore:
+                return await self.process_script_async(script, voice_profile)
+        
+        return await asyncio.gather(*(process_one(script) for script in scripts))
@@ -0,0 +1,10 @@
+from src.utils.main_config import get_main_config
+
+# config/main_config.json does not define every key the module configs read
+# yet; fill the gaps on the shared parsed copy before any module config is
+# built, using the values the rest of the file already implies
+_main_config = get_main_config()
+_main_config["paths"].setdefault("subtitle_dir", _main_config["paths"]["subtitle_output_dir"])
+_main_config["module_specific"]["animator"].setdefault(
+    "output_resolution", _main_config["base_settings"]["output_video_resolution"]
+)
@@ -0,0 +1,53 @@
+from src.utils.cache_utils import JsonCache, make_cache_key
+
+def test_get_returns_stored_value(tmp_path):
+    cache = JsonCache(tmp_path, max_entries=4)
+    assert cache.set("a", {"value": 1})
+    assert cache.get("a") == {"value": 1}
+    assert cache.get("missing") is None
+
+def test_least_frequently_used_entry_is_evicted(tmp_path):
+    cache = JsonCache(tmp_path, max_entries=2)
+    cache.set("hot", 1)
+    cache.set("cold", 2)
+    cache.get("hot")
+    cache.get("hot")
+    cache.get("cold")
+
+    cache.set("new", 3)
+
+    assert cache.get("cold") is None
+    assert not (tmp_path / "cold.json").exists()
+    assert cache.get("hot") == 1
+    assert cache.get("new") == 3
+
+def test_overwriting_a_key_does_not_evict(tmp_path):
+    cache = JsonCache(tmp_path, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 10)
+    assert cache.get("a") == 10
+    assert cache.get("b") == 2
+
+def test_hit_counts_survive_a_reload(tmp_path):
+    cache = JsonCache(tmp_path, max_entries=2)
+    cache.set("hot", 1)
+    cache.set("cold", 2)
+    cache.get("hot")
+
+    reloaded = JsonCache(tmp_path, max_entries=2)
+    reloaded.set("new", 3)
+
+    assert reloaded.get("hot") == 1
+    assert reloaded.get("cold") is None
+
+def test_corrupt_entry_is_discarded(tmp_path):
+    cache = JsonCache(tmp_path)
+    cache.set("a", 1)
+    (tmp_path / "a.json").write_text("{not json", encoding="utf-8")
+    assert cache.get("a") is None
+    assert not (tmp_path / "a.json").exists()
+
+def test_cache_key_distinguishes_part_boundaries():
+    assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+    assert make_cache_key("a", None) == make_cache_key("a", "")
@@ -0,0 +1,45 @@
+import pytest
+
+from src.utils.ffmpeg_utils import (
+    NVENC_H264_ENCODER,
+    SOFTWARE_H264_ENCODER,
+    encoder_args,
+    is_encoder_init_failure
+)
+from src.video_composer import compose
+from src.video_composer.config import config
+
+@pytest.mark.parametrize("stderr", [
+    "[h264_nvenc @ 0x55] No NVENC capable devices found",
+    "[h264_nvenc @ 0x55] Cannot load libcuda.so.1",
+    "[h264_nvenc @ 0x55] OpenEncodeSessionEx failed: out of memory (10)",
+    "Error while opening encoder for output stream #0:0",
+])
+def test_encoder_init_errors_are_recognized(stderr):
+    assert is_encoder_init_failure(stderr)
+
+@pytest.mark.parametrize("stderr", [
+    "input.mp4: No such file or directory",
+    "[mp3 @ 0x55] Failed to read frame size: Invalid data found when processing input",
+    "Error reinitializing filters!",
+])
+def test_input_errors_are_not_encoder_failures(stderr):
+    assert not is_encoder_init_failure(stderr)
+
+def test_hardware_init_failure_is_retried_in_software(monkeypatch):
+    monkeypatch.setattr(config, "_video_codec", NVENC_H264_ENCODER)
+    assert compose._needs_software_retry(b"No NVENC capable devices found")
+    # The configured codec is kept for later jobs
+    assert config.video_codec == NVENC_H264_ENCODER
+
+def test_input_failure_is_not_retried(monkeypatch):
+    monkeypatch.setattr(config, "_video_codec", NVENC_H264_ENCODER)
+    assert not compose._needs_software_retry(b"bad.mp3: Invalid data found when processing input")
+
+def test_software_encoder_is_never_retried(monkeypatch):
+    monkeypatch.setattr(config, "_video_codec", SOFTWARE_H264_ENCODER)
+    assert not compose._needs_software_retry(b"Error while opening encoder for output stream")
+
+def test_software_retry_args_select_libx264():
+    assert config.software_encode_args[:2] == ("-c:v", SOFTWARE_H264_ENCODER)
+    assert encoder_args(NVENC_H264_ENCODER)[:2] == ["-c:v", NVENC_H264_ENCODER]
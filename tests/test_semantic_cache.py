@@ -0,0 +1,46 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.quality_control.semantic_cache import SemanticCache
+
+def test_lookup_matches_similar_embedding_within_scope(tmp_path):
+    cache = SemanticCache(tmp_path / "cache.npz", threshold=0.95)
+    cache.add("qc:gpt-4", [1.0, 0.0, 0.0], {"score": 4})
+
+    assert cache.lookup("qc:gpt-4", [0.99, 0.05, 0.0]) == {"score": 4}
+    assert cache.lookup("qc:gpt-4", [0.0, 1.0, 0.0]) is None
+    assert cache.lookup("qc:gpt-3.5", [1.0, 0.0, 0.0]) is None
+
+def test_oldest_entries_are_dropped_past_max_entries(tmp_path):
+    cache = SemanticCache(tmp_path / "cache.npz", max_entries=2)
+    cache.add("s", [1.0, 0.0, 0.0], {"id": 1})
+    cache.add("s", [0.0, 1.0, 0.0], {"id": 2})
+    cache.add("s", [0.0, 0.0, 1.0], {"id": 3})
+
+    assert cache.lookup("s", [1.0, 0.0, 0.0]) is None
+    assert cache.lookup("s", [0.0, 0.0, 1.0]) == {"id": 3}
+
+def test_add_reports_when_a_save_is_due(tmp_path):
+    cache = SemanticCache(tmp_path / "cache.npz", save_every=2)
+    assert not cache.add("s", [1.0, 0.0], {"id": 1})
+    assert cache.add("s", [0.0, 1.0], {"id": 2})
+    assert cache.save()
+    assert not cache.add("s", [1.0, 1.0], {"id": 3})
+
+def test_flush_persists_pending_entries(tmp_path):
+    path = tmp_path / "cache.npz"
+    cache = SemanticCache(path, save_every=32)
+    assert cache.flush()  # Nothing pending
+    assert not path.exists()
+
+    cache.add("s", [1.0, 0.0], {"id": 1})
+    assert cache.flush()
+
+    reloaded = SemanticCache(path)
+    assert reloaded.lookup("s", [1.0, 0.0]) == {"id": 1}
+
+def test_corrupt_file_starts_empty(tmp_path):
+    path = tmp_path / "cache.npz"
+    path.write_bytes(b"not an npz file")
+    assert SemanticCache(path).lookup("s", [1.0, 0.0]) is None
@@ -0,0 +1,70 @@
+import json
+import os
+import time
+
+from src.voice_generator.tts_cache import TTSCache
+
+def _age_sidecar(cache_dir, key, seconds):
+    sidecar = cache_dir / f"{key}.json"
+    data = json.loads(sidecar.read_text(encoding="utf-8"))
+    data["created_at"] -= seconds
+    sidecar.write_text(json.dumps(data), encoding="utf-8")
+
+def test_round_trip_and_alignment(tmp_path):
+    cache = TTSCache(tmp_path)
+    alignment = {"characters": ["h", "i"]}
+    assert cache.set("k", b"audio", text="hi", alignment=alignment)
+    assert cache.get("k") == b"audio"
+    assert cache.get_alignment("k") == alignment
+    assert cache.get("other") is None
+
+def test_make_key_ignores_whitespace_but_not_case():
+    key = TTSCache.make_key("Hello  world", "voice", "model", 0.5, 0.75)
+    assert key == TTSCache.make_key("Hello world", "voice", "model", 0.5, 0.75)
+    assert key != TTSCache.make_key("hello world", "voice", "model", 0.5, 0.75)
+    assert key != TTSCache.make_key("Hello world", "voice", "model", 0.5, 0.8)
+
+def test_entry_expires_by_creation_time_despite_hits(tmp_path):
+    TTSCache(tmp_path, ttl_seconds=60).set("k", b"audio")
+    _age_sidecar(tmp_path, "k", 120)
+    os.utime(tmp_path / "k.mp3")  # What a recent hit does
+
+    cache = TTSCache(tmp_path, ttl_seconds=60)
+    assert cache.get("k") is None
+    assert not (tmp_path / "k.mp3").exists()
+    assert not (tmp_path / "k.json").exists()
+
+def test_fresh_entry_is_served_without_ttl_refresh(tmp_path):
+    TTSCache(tmp_path, ttl_seconds=60).set("k", b"audio")
+    _age_sidecar(tmp_path, "k", 30)
+    assert TTSCache(tmp_path, ttl_seconds=60).get("k") == b"audio"
+
+def test_memory_hit_also_expires(tmp_path, monkeypatch):
+    cache = TTSCache(tmp_path, ttl_seconds=60)
+    cache.set("k", b"audio")
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert cache.get("k") is None
+
+def test_copy_to_respects_expiry(tmp_path):
+    cache_dir = tmp_path / "cache"
+    TTSCache(cache_dir, ttl_seconds=60).set("k", b"audio")
+    _age_sidecar(cache_dir, "k", 120)
+    dest = tmp_path / "out.mp3"
+    assert not TTSCache(cache_dir, ttl_seconds=60).copy_to("k", dest)
+    assert not dest.exists()
+
+def test_least_recently_used_clip_is_evicted(tmp_path):
+    cache = TTSCache(tmp_path, max_bytes=250, memory_max_bytes=0)
+    cache.set("old", b"a" * 100)
+    cache.set("used", b"b" * 100)
+    past = time.time() - 100
+    os.utime(tmp_path / "old.mp3", (past, past))
+    os.utime(tmp_path / "used.mp3", (past - 10, past - 10))
+    assert cache.get("used") == b"b" * 100  # Refreshes its mtime
+
+    cache.set("new", b"c" * 100)
+
+    assert not (tmp_path / "old.mp3").exists()
+    assert (tmp_path / "used.mp3").exists()
+    assert (tmp_path / "new.mp3").exists()
@@ -0,0 +1,52 @@
+import pytest
+
+# Needs requests and the local src/utils/api_keys.py
+voice_gen = pytest.importorskip("src.voice_generator.voice_gen")
+
+from src.voice_generator.tts_backends import TTSResponse
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, stereo: 417-byte frames of 1152 samples
+_FRAME_HEADER = bytes.fromhex("FFFB9000")
+_FRAME_SECONDS = 1152 / 44100
+
+def _frame(payload: bytes = b"") -> bytes:
+    return _FRAME_HEADER + payload + b"\0" * (417 - 4 - len(payload))
+
+def _segment(frames: int) -> bytes:
+    """Frames as the TTS API returns them: ID3v2 tag, Info frame, audio, ID3v1 tag"""
+    id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x04" + b"tag!"
+    info = _frame(b"\0" * 32 + b"Info")
+    return id3v2 + info + _frame() * frames + b"TAG" + b"\0" * 125
+
+def _alignment(*starts):
+    return {
+        "characters": ["x"] * len(starts),
+        "character_start_times_seconds": list(starts),
+        "character_end_times_seconds": [start + 0.1 for start in starts]
+    }
+
+def test_duration_skips_tags_and_info_frame():
+    assert voice_gen._mp3_duration(_segment(10)) == pytest.approx(10 * _FRAME_SECONDS)
+
+def test_strip_leaves_only_audio_frames():
+    assert voice_gen._strip_mp3_metadata(_segment(3)) == _frame() * 3
+
+def test_merge_offsets_each_segment_by_preceding_audio():
+    results = [
+        TTSResponse(_segment(10), 200, None, _alignment(0.0, 0.1)),
+        TTSResponse(_segment(20), 200, None, _alignment(0.0)),
+        TTSResponse(_segment(5), 200, None, _alignment(0.05)),
+    ]
+    merged = voice_gen._merge_alignments(results)
+    assert merged["characters"] == ["x"] * 4
+    assert merged["character_start_times_seconds"] == pytest.approx(
+        [0.0, 0.1, 10 * _FRAME_SECONDS, 30 * _FRAME_SECONDS + 0.05]
+    )
+    assert merged["character_end_times_seconds"][2] == pytest.approx(10 * _FRAME_SECONDS + 0.1)
+
+def test_merge_needs_every_alignment():
+    results = [
+        TTSResponse(_segment(10), 200, None, _alignment(0.0)),
+        TTSResponse(_segment(10), 200, None, None),
+    ]
+    assert voice_gen._merge_alignments(results) is None